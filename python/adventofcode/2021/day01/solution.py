@@ -1,22 +1,25 @@
 # https://adventofcode.com/2021/day/1
 
+from typing import List
+
 from more_itertools import quantify
 
 from adventofcode.utils import load_list
 
-measurements = load_list(parser=int)
+
+def get_measurements() -> List[int]:
+    return load_list(parser=int)
 
 
 def part_1() -> int:
+    measurements = get_measurements()
     # Take the measurements and create pairs one index apart, then map them to a bool
     # which is True if b is greater than a. `quantify` counts the True values
     return quantify(b > a for a, b in zip(measurements, measurements[1:]))
 
 
-print(part_1())
-
-
-def part_2(window_size: int) -> int:
+def part_2(window_size: int = 3) -> int:
+    measurements = get_measurements()
     count = 0
     # Get the sum of the first `window_size` numbers
     cur_sum = sum(measurements[:window_size])
@@ -38,4 +41,6 @@ def part_2(window_size: int) -> int:
     return count
 
 
-print(part_2(window_size=3))
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2(window_size=3))
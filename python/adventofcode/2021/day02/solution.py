@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import List
 
 from adventofcode.utils import load_list
 
@@ -20,14 +21,15 @@ class Instruction:
         return Instruction(parts[0], int(parts[1]))
 
 
-instructions = load_list(parser=Instruction.from_line)
+def get_instructions() -> List[Instruction]:
+    return load_list(parser=Instruction.from_line)
 
 
 def part_1() -> int:
     horizontal = 0
     depth = 0
 
-    for instruction in instructions:
+    for instruction in get_instructions():
         if instruction.direction == "forward":
             horizontal += instruction.magnitude
         elif instruction.direction == "down":
@@ -40,15 +42,12 @@ def part_1() -> int:
     return horizontal * depth
 
 
-print(part_1())
-
-
 def part_2() -> int:
     horizontal = 0
     depth = 0
     aim = 0
 
-    for instruction in instructions:
+    for instruction in get_instructions():
         if instruction.direction == "forward":
             horizontal += instruction.magnitude
             depth += aim * instruction.magnitude
@@ -62,4 +61,6 @@ def part_2() -> int:
     return horizontal * depth
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -3,8 +3,10 @@ from typing import Callable, Dict, Iterable, List, Tuple
 
 from adventofcode.utils import load_list
 
-# Convert each line into a list of 0s and 1s
-numbers = load_list(parser=list)
+
+def get_numbers() -> List[List[str]]:
+    # Convert each line into a list of 0s and 1s
+    return load_list(parser=list)
 
 
 def to_int(binary: List[str]) -> int:
@@ -48,7 +50,7 @@ def get_digit_to_numbers(
     return digit_to_numbers
 
 
-def get_gamma_and_epsilon_rate() -> Tuple[int, int]:
+def get_gamma_and_epsilon_rate(numbers: List[List[str]]) -> Tuple[int, int]:
     digit_count = len(numbers[0])
     gamma_rate = []
     epsilon_rate = []
@@ -68,15 +70,15 @@ def get_gamma_and_epsilon_rate() -> Tuple[int, int]:
 
 
 def part_1() -> int:
-    gamma_rate, episolon_rate = get_gamma_and_epsilon_rate()
+    gamma_rate, episolon_rate = get_gamma_and_epsilon_rate(get_numbers())
 
     return gamma_rate * episolon_rate
 
 
-print(part_1())
-
-
-def get_rating(one_condition: Callable[[Dict[str, List[List[str]]]], bool]) -> int:
+def get_rating(
+    numbers: List[List[str]],
+    one_condition: Callable[[Dict[str, List[List[str]]]], bool],
+) -> int:
     """
     Generic function to return a rating.
 
@@ -101,25 +103,32 @@ def get_rating(one_condition: Callable[[Dict[str, List[List[str]]]], bool]) -> i
             return to_int(rating[0])
 
 
-def get_oxygen_generator_rating() -> int:
+def get_oxygen_generator_rating(numbers: List[List[str]]) -> int:
     # The condition keeping numbers with a 1 in the current position is that there are
     # more 1s or the same number of ones
     return get_rating(
+        numbers,
         lambda digit_to_numbers: len(digit_to_numbers["1"])
-        >= len(digit_to_numbers["0"])
+        >= len(digit_to_numbers["0"]),
     )
 
 
-def get_co2_scrubber_rating() -> int:
+def get_co2_scrubber_rating(numbers: List[List[str]]) -> int:
     # The condition keeping numbers with a 1 in the current position is that there are
     # less 1s
     return get_rating(
-        lambda digit_to_numbers: len(digit_to_numbers["1"]) < len(digit_to_numbers["0"])
+        numbers,
+        lambda digit_to_numbers: len(digit_to_numbers["1"])
+        < len(digit_to_numbers["0"]),
     )
 
 
 def part_2() -> int:
-    return get_oxygen_generator_rating() * get_co2_scrubber_rating()
+    numbers = get_numbers()
+
+    return get_oxygen_generator_rating(numbers) * get_co2_scrubber_rating(numbers)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from pathlib import Path
 from pprint import pformat
 from typing import Dict, List, Tuple
 
+from adventofcode.utils import load_list
+
 
 @dataclass
 class Position:
@@ -72,11 +73,7 @@ class BingoBoard:
 
 
 def get_input() -> Tuple[List[int], List[BingoBoard]]:
-    input_path = Path(__file__).parent.joinpath("input.txt")
-
-    with open(input_path, "r") as file:
-        # Use `.strip` to remove "\n"
-        lines = [l.strip() for l in file.readlines()]
+    lines = load_list(parser=str.strip)
 
     # The first line is the numbers that will be marked on the bingo boards.
     # They're separated by commas
@@ -103,10 +100,9 @@ def get_input() -> Tuple[List[int], List[BingoBoard]]:
     return to_mark, bingo_boards
 
 
-to_mark, bingo_boards = get_input()
-
-
 def part_1() -> int:
+    to_mark, bingo_boards = get_input()
+
     for number in to_mark:
         for bingo_board in bingo_boards:
             bingo_board.mark(number)
@@ -114,10 +110,8 @@ def part_1() -> int:
                 return bingo_board.unmarked_sum * number
 
 
-print(part_1())
-
-
 def part_2() -> int:
+    to_mark, bingo_boards = get_input()
     # Keep track of the boards that haven't won yet
     remaining_boards = set(bingo_boards)
 
@@ -138,4 +132,6 @@ def part_2() -> int:
         remaining_boards.difference_update(newly_won)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -2,7 +2,7 @@
 
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Callable, Optional, Set, Tuple
+from typing import Callable, List, Optional, Set, Tuple
 
 from more_itertools import ilen
 
@@ -79,7 +79,8 @@ def parser(line: str) -> Line:
     )
 
 
-lines = load_list(parser=parser)
+def get_lines() -> List[Line]:
+    return load_list(parser=parser)
 
 
 def count_overlapping_points(
@@ -92,7 +93,7 @@ def count_overlapping_points(
     """
     all_points = defaultdict(int)
 
-    for line in lines:
+    for line in get_lines():
         if line_filter and line_filter(line):
             continue
 
@@ -108,11 +109,10 @@ def part_1() -> int:
     )
 
 
-print(part_1())
-
-
 def part_2() -> int:
     return count_overlapping_points(threshold=2)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -9,8 +9,9 @@ def parser(line: str) -> List[int]:
     return [int(x) for x in line.split(",")]
 
 
-# Since there's only one line, take the first value
-fish = load_list(parser=parser)[0]
+def get_fish() -> List[int]:
+    # Since there's only one line, take the first value
+    return load_list(parser=parser)[0]
 
 
 def simulate(days: int) -> int:
@@ -20,7 +21,7 @@ def simulate(days: int) -> int:
 
     # Initial population, count the number of fish for each number of remaining days
     # from  0 to 8
-    for count in fish:
+    for count in get_fish():
         counts[count] += 1
 
     # For each day...
@@ -48,11 +49,10 @@ def part_1() -> int:
     return simulate(80)
 
 
-print(part_1())
-
-
 def part_2() -> int:
     return simulate(256)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -10,20 +10,19 @@ def parser(line: str) -> List[int]:
     return [int(x) for x in line.split(",")]
 
 
-# Since there's only one line, take the first value
-positions = load_list(parser=parser)[0]
+def get_positions() -> List[int]:
+    # Since there's only one line, take the first value
+    return load_list(parser=parser)[0]
 
 
 def part_1() -> float:
+    positions = get_positions()
     # By definition, the median is the middle value since the fuel cost is linear
     median_ = median(positions)
 
     return sum(abs(pos - median_) for pos in positions)
 
 
-print(part_1())
-
-
 def cost(start: int, end: int) -> float:
     """Return the cost to move from `start` to `end` in part 2."""
     n = abs(start - end)
@@ -36,7 +35,7 @@ def part_2() -> float:
     # We sort the positions so that we start with a high cost at position zero that will
     # lower as we move to the right. Eventually, there will be an inflection point where
     # moving further right causes the cost to increase rather than decrease
-    sorted_positions = sorted(positions)
+    sorted_positions = sorted(get_positions())
 
     def get_costs(cur_pos: int) -> Iterable[float]:
         """Return the cost to move all crabs to `cur_pos`."""
@@ -58,4 +57,6 @@ def part_2() -> float:
         cur_cost = new_cost
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -12,7 +12,8 @@ def parser(line: str) -> Tuple[List[str], List[str]]:
     return left.split(" "), right.split(" ")
 
 
-inputs_and_outputs: List[Tuple[List[str], List[str]]] = load_list(parser=parser)
+def get_inputs_and_outputs() -> List[Tuple[List[str], List[str]]]:
+    return load_list(parser=parser)
 
 
 def part_1() -> int:
@@ -26,14 +27,11 @@ def part_1() -> int:
 
     return quantify(
         len(digit) in unique_segment_counts
-        for _, outputs in inputs_and_outputs
+        for _, outputs in get_inputs_and_outputs()
         for digit in outputs
     )
 
 
-print(part_1())
-
-
 class Decoder:
 
     # Ordered segments to the digit they represent
@@ -200,8 +198,10 @@ class Decoder:
 def part_2() -> int:
     return sum(
         Decoder(input_digits).decode(output_digits)
-        for input_digits, output_digits in inputs_and_outputs
+        for input_digits, output_digits in get_inputs_and_outputs()
     )
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -1,122 +1,76 @@
 import operator
-from collections import deque
 from functools import reduce
-from itertools import product
-from typing import Iterable, Optional, Set, Tuple
+from typing import Iterable, Iterator, List
 
-from adventofcode.utils import load_list
+from adventofcode.utils import Grid, bfs, load_grid
 
-height_map = load_list(parser=lambda line: [int(x) for x in line])
+# The highest point. Basins never include it
+PEAK = 9
 
 
-def height_at(x: int, y: int) -> Optional[int]:
-    """
-    Return the height at (x, y).
+def get_height_map() -> Grid:
+    # Treat everything outside the map as a peak. It's never lower than a point in the
+    # map and it stops a basin from growing, so we don't need to check bounds
+    return load_grid(parser=int, border=PEAK)
 
-    If the point is invalid, return None
-    """
-    if x < 0:
-        return None
 
-    if len(height_map[0]) <= x:
-        return None
+def is_lowest(height_map: Grid, index: int) -> bool:
+    """Return True if the point at `index` is lower than all of its neighbors."""
+    cells = height_map.cells
+    height = cells[index]
 
-    if y < 0:
-        return None
-
-    if len(height_map) <= y:
-        return None
-
-    return height_map[y][x]
-
-
-def get_neighbors(x: int, y: int) -> Iterable[Tuple[int, int]]:
-    """
-    Return the neighbors of (x, y).
-
-    This only includes top, bottom, left, and right (not diagonals)
-    """
-    return (
-        (x, y + 1),
-        (x, y - 1),
-        (x + 1, y),
-        (x - 1, y),
-    )
-
-
-def is_lowest(x: int, y: int) -> bool:
-    """Return True if (x, y) is the lowest point of its neighbors."""
-    height = height_map[y][x]
-
-    for neighbor in get_neighbors(x, y):
-        neighbor_height = height_at(*neighbor)
-
-        if neighbor_height is not None and neighbor_height <= height:
-            return False
-
-    return True
+    # Only consider top, bottom, left, and right (not diagonals)
+    return all(height < cells[index + o] for o in height_map.orthogonal_offsets)
 
 
 def part_1() -> int:
-    # Get all tuples of (x, y) in the height map
-    points = product(range(len(height_map[0])), range(len(height_map)))
-
-    return sum(1 + height_at(*point) for point in points if is_lowest(*point))
-
-
-print(part_1())
-
+    height_map = get_height_map()
 
-def get_basin(unvisited: Set[Tuple[int, int]]) -> Set[Tuple[int, int]]:
-    """Return the next unvisited basin."""
-    # Keep track of all the points in the basin
-    basin = set()
-    # Pick a random point we haven't visited to start creating the basin
-    start = next(iter(unvisited))
-    # Keep track of the points in the basin we still need to visit
-    to_visit = deque([start])
-
-    while to_visit:
-        x, y = to_visit.popleft()
-
-        # If we've already been here, don't do anything
-        if (x, y) not in unvisited:
-            continue
+    return sum(
+        1 + height_map[index]
+        for index in height_map.indices
+        if is_lowest(height_map, index)
+    )
 
-        # Mark as visited
-        unvisited.remove((x, y))
 
-        # Don't visit neighbors of points with height 9. Otherwise we'll combine basins
-        # that should be separate
-        if height_map[y][x] == 9:
-            continue
+def get_basin(height_map: Grid, start: int) -> Iterable[int]:
+    """Return the points in the basin that contains `start`."""
+    cells = height_map.cells
+    offsets = height_map.orthogonal_offsets
 
-        # Add this point to the basin and mark its neighbors as points that need visited
-        basin.add((x, y))
-        to_visit.extend(get_neighbors(x, y))
+    def get_neighbors(index: int) -> Iterator[int]:
+        # Don't visit peaks. Otherwise we'll combine basins that should be separate
+        return (index + o for o in offsets if cells[index + o] != PEAK)
 
-    return basin
+    return bfs([start], get_neighbors).distances.keys()
 
 
 def part_2() -> int:
     # General strategy is
-    #   1. Pick a random point in the height map
+    #   1. Pick a point in the height map we haven't visited that isn't a peak
     #   2. BFS by visiting all neighbors and adding them to the basin if their height
     #      isn't 9
     #   3. When we've run out of points to visit, we've found the whole basin. Start
-    #      over with a new random point we haven't visited (to find a new basin)
+    #      over with a new point we haven't visited (to find a new basin)
     #   4. When we've visited every point, we've found all the basins
 
-    # Get all tuples of (x, y) in the height map
-    unvisited = set(product(range(len(height_map[0])), range(len(height_map))))
-    basin_sizes = []
+    height_map = get_height_map()
+    visited = bytearray(len(height_map.cells))
+    basin_sizes: List[int] = []
+
+    for index in height_map.indices:
+        if not visited[index] and height_map[index] != PEAK:
+            basin = get_basin(height_map, index)
+            basin_sizes.append(len(basin))
 
-    while unvisited:
-        basin_sizes.append(len(get_basin(unvisited)))
+            for point in basin:
+                visited[point] = True
 
     three_largest_basins = sorted(basin_sizes, reverse=True)[:3]
     # Multiply the three basin sizes together
     return reduce(operator.mul, three_largest_basins)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
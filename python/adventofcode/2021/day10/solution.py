@@ -6,8 +6,6 @@ from typing import Iterable, List, Union
 
 from adventofcode.utils import load_list
 
-lines = load_list()
-
 opening_to_closing = {
     "(": ")",
     "[": "]",
@@ -61,10 +59,7 @@ def part_1() -> int:
 
         return char_to_score[result]
 
-    return sum(get_score(line) for line in lines)
-
-
-print(part_1())
+    return sum(get_score(line) for line in load_list())
 
 
 def part_2() -> float:
@@ -84,11 +79,13 @@ def part_2() -> float:
 
         return score
 
-    results = (get_closing_sequence_or_corrupted_char(line) for line in lines)
+    results = (get_closing_sequence_or_corrupted_char(line) for line in load_list())
     # If the line was corrupted, filter it out
     closing_sequences = (r for r in results if not isinstance(r, str))
 
     return median(get_score(s) for s in closing_sequences)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -1,56 +1,33 @@
 # https://adventofcode.com/2021/day/11
 
-from typing import Iterable, List, Set, Tuple
+from typing import Iterator, List, Tuple
 
-from adventofcode.utils import is_valid_point, load_list
+from adventofcode.utils import Grid, find_cycle, load_grid
 
 
-def get_energy_levels() -> List[List[int]]:
-    return load_list(parser=lambda line: [int(x) for x in line])
+def get_energy_levels() -> Grid:
+    return load_grid(parser=int)
 
 
-energy_levels = get_energy_levels()
-
-
-def get_neighbors(x: int, y: int) -> Iterable[Tuple[int, int]]:
-    """
-    Return all neighbors of (x, y)
-
-    Horizontal, vertical, and diagonal. Don't include invalid points
-    """
-    neighbors = (
-        (x + 1, y),
-        (x - 1, y),
-        (x, y + 1),
-        (x, y - 1),
-        (x + 1, y + 1),
-        (x + 1, y - 1),
-        (x - 1, y + 1),
-        (x - 1, y - 1),
-    )
-
-    return (n for n in neighbors if is_valid_point(*n, energy_levels))
-
-
-def increase_energy_levels(amount: int = 1) -> Set[Tuple[int, int]]:
+def increase_energy_levels(energy_levels: Grid, amount: int = 1) -> List[int]:
     """
     Increase the each energy level in `energy_levels` by `amount`.
 
-    Return the set of points with energy greater than 9.
+    Return the indices of the octopuses with energy greater than 9.
     """
-    to_flash = set()
+    cells = energy_levels.cells
+    to_flash = []
 
-    for y, row in enumerate(energy_levels):
-        for x in range(len(row)):
-            energy_levels[y][x] += amount
+    for index in energy_levels.indices:
+        cells[index] += amount
 
-            if energy_levels[y][x] > 9:
-                to_flash.add((x, y))
+        if cells[index] > 9:
+            to_flash.append(index)
 
     return to_flash
 
 
-def flash(to_flash: Set[Tuple[int, int]]) -> int:
+def flash(energy_levels: Grid, to_flash: List[int]) -> int:
     """
     Make all octopuses in `to_flash` flash.
 
@@ -59,47 +36,60 @@ def flash(to_flash: Set[Tuple[int, int]]) -> int:
 
     Return the number of octopuses that flashed.
     """
-    flashed = set()
+    cells = energy_levels.cells
+    # Horizontal, vertical, and diagonal, not including points outside the grid
+    neighbors = energy_levels.neighbors
+    flashed = set(to_flash)
 
     while to_flash:
-        point = to_flash.pop()
-        flashed.add(point)
+        index = to_flash.pop()
 
-        for neighbor in get_neighbors(*point):
-            x, y = neighbor
-            energy_levels[y][x] += 1
+        for neighbor in neighbors[index]:
+            cells[neighbor] += 1
 
             # Make sure an octopus can't flash more than once. Otherwise we'd have an
             # infinite loop
-            if energy_levels[y][x] > 9 and (x, y) not in flashed:
-                to_flash.add((x, y))
+            if cells[neighbor] > 9 and neighbor not in flashed:
+                flashed.add(neighbor)
+                to_flash.append(neighbor)
 
-    for point in flashed:
-        x, y = point
-        energy_levels[y][x] = 0
+    for index in flashed:
+        cells[index] = 0
 
     return len(flashed)
 
 
-def part_1(steps: int) -> int:
-    return sum(flash(increase_energy_levels()) for _ in range(steps))
-
+def run_steps(energy_levels: Grid) -> Iterator[Tuple[bytes, int]]:
+    """Yield the energy levels before each step, and how many octopuses flashed."""
+    while True:
+        state = energy_levels.cells.tobytes()
 
-print(part_1(100))
+        yield state, flash(energy_levels, increase_energy_levels(energy_levels))
 
-# Make sure to reset before part 2
-energy_levels = get_energy_levels()
 
+def part_1(steps: int = 100) -> int:
+    energy_levels = get_energy_levels()
 
-def part_2() -> int:
-    step = 0
-    octopus_count = len(energy_levels) * len(energy_levels[0])
+    return sum(
+        flash(energy_levels, increase_energy_levels(energy_levels))
+        for _ in range(steps)
+    )
 
-    while True:
-        step += 1
 
-        if flash(increase_energy_levels()) == octopus_count:
+def part_2() -> int:
+    energy_levels = get_energy_levels()
+    octopus_count = len(energy_levels)
+    # Once the octopuses repeat, any step where they all flash has already happened
+    cycle = find_cycle(run_steps(energy_levels))
+    assert cycle is not None
+
+    for step, flashes in enumerate(cycle.values, 1):
+        if flashes == octopus_count:
             return step
 
+    raise ValueError("The octopuses never all flash at once")
+
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1(100))
+    print(part_2())
@@ -54,16 +54,18 @@ class Graph:
         return self._connections[vertex]
 
 
-graph = Graph(load_list(parser=lambda line: line.split("-")))
+def get_graph() -> Graph:
+    return Graph(load_list(parser=lambda line: line.split("-")))
 
 
 def get_paths(
-    cur_path: List[str], visited: Set[str], paths: List[List[str]]
+    graph: Graph, cur_path: List[str], visited: Set[str], paths: List[List[str]]
 ) -> List[List[str]]:
     """
     Recursively populate `paths` based on the graph.
 
     Args:
+        graph: The caves and their connections
         cur_path: The vertices we've visited so far in order
         visited: A set of vertices we've visited
         paths: All of the complete paths, populated over time
@@ -84,20 +86,21 @@ def get_paths(
             paths.append(new_path)
         else:
             # Otherwise, keep generating paths
-            get_paths(new_path, visited.copy(), paths)
+            get_paths(graph, new_path, visited.copy(), paths)
 
     return paths
 
 
 def part_1() -> int:
-    return len(get_paths(["start"], set(), []))
-
-
-print(part_1())
+    return len(get_paths(get_graph(), ["start"], set(), []))
 
 
 def get_paths_visiting_a_small_cave_twice(
-    cur_path: List[str], visited: Set[str], visited_twice: bool, paths: List[List[str]]
+    graph: Graph,
+    cur_path: List[str],
+    visited: Set[str],
+    visited_twice: bool,
+    paths: List[List[str]],
 ) -> List[List[str]]:
     """
     Recursively populate `paths` based on the graph.
@@ -105,6 +108,7 @@ def get_paths_visiting_a_small_cave_twice(
     Now we're allowed to visit a single small cave twice.
 
     Args:
+        graph: The caves and their connections
         cur_path: The vertices we've visited so far in order
         visited: A set of vertices we've visited
         visited_twice: True if we've already visited a small cave twice
@@ -132,14 +136,22 @@ def get_paths_visiting_a_small_cave_twice(
             # we've already visited a small cave twice or we just did because the small
             # cave we're visiting was already visited once
             get_paths_visiting_a_small_cave_twice(
-                new_path, visited.copy(), small_and_visited or visited_twice, paths
+                graph,
+                new_path,
+                visited.copy(),
+                small_and_visited or visited_twice,
+                paths,
             )
 
     return paths
 
 
 def part_2() -> int:
-    return len(get_paths_visiting_a_small_cave_twice(["start"], set(), False, []))
+    return len(
+        get_paths_visiting_a_small_cave_twice(get_graph(), ["start"], set(), False, [])
+    )
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
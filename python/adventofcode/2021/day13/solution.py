@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from pprint import pprint
+from pprint import pformat
 from typing import List, Set, Tuple
 
 from adventofcode.utils import load_list
@@ -38,10 +38,8 @@ class Fold:
         raise ValueError(f"Unknown axis `{axis}`")
 
 
-lines = load_list()
-
-
 def get_dots_and_folds() -> Tuple[Set[Tuple[int, int]], List[Fold]]:
+    lines = load_list()
     # Store the dots as a set of (x, y) points
     dots: Set[Tuple[int, int]] = set()
 
@@ -59,9 +57,6 @@ def get_dots_and_folds() -> Tuple[Set[Tuple[int, int]], List[Fold]]:
     return dots, folds
 
 
-dots, folds = get_dots_and_folds()
-
-
 def fold(dots: Set[Tuple[int, int]], instruction: Fold) -> Set[Tuple[int, int]]:
     """
     Return the remaining dots after folding `dots` with `instruction`.
@@ -101,13 +96,12 @@ def fold(dots: Set[Tuple[int, int]], instruction: Fold) -> Set[Tuple[int, int]]:
 
 
 def part_1() -> int:
-    return len(fold(dots, folds[0]))
-
+    dots, folds = get_dots_and_folds()
 
-print(part_1())
+    return len(fold(dots, folds[0]))
 
 
-def print_dots(dots: Set[Tuple[int, int]]) -> None:
+def format_dots(dots: Set[Tuple[int, int]]) -> str:
     max_x = max(p[0] for p in dots)
     max_y = max(p[1] for p in dots)
 
@@ -116,18 +110,20 @@ def print_dots(dots: Set[Tuple[int, int]]) -> None:
         x, y = dot
         grid[y][x] = "#"
 
-    # Print a grid where ' ' means empty and '#' means a dot is present
-    pprint(["".join(col) for col in grid])
+    # Format a grid where ' ' means empty and '#' means a dot is present
+    return pformat(["".join(col) for col in grid])
 
 
-def part_2() -> None:
-    updated = dots
+def part_2() -> str:
+    updated, folds = get_dots_and_folds()
 
     for instruction in folds:
         updated = fold(updated, instruction)
 
-    print_dots(updated)
+    return format_dots(updated)
 
 
-# We'll need to manually read the output from this to get the solution
-part_2()
+if __name__ == "__main__":
+    print(part_1())
+    # We'll need to manually read the output from this to get the solution
+    print(part_2())
@@ -2,23 +2,21 @@
 
 from __future__ import annotations
 
-from collections import Counter, defaultdict
-from typing import Dict, Tuple
+from dataclasses import dataclass
+from itertools import product
+from typing import Dict, List, Tuple
 
 from adventofcode.utils import load_list
 
-lines = load_list()
-
 
 def get_template_and_rules() -> Tuple[str, Dict[str, str]]:
+    lines = load_list()
+
     # The first line is the template, the rules start on line 3.
     # Each rule looks like `CH -> B`
     return lines[0], dict(l.split(" -> ") for l in lines[2:])
 
 
-template, rules = get_template_and_rules()
-
-
 def process_slow(polymer: str, rules: Dict[str, str]) -> str:
     """
     Process one step of `polymer` with `rules`.
@@ -58,7 +56,49 @@ def process_slow(polymer: str, rules: Dict[str, str]) -> str:
     return "".join(new_polymer)
 
 
-def process(polymer: Dict[str, int], rules: Dict[str, str]) -> Dict[str, int]:
+@dataclass
+class PairRules:
+    """
+    The rules, compiled to work on pairs numbered by their elements.
+
+    Pair "AB" is `index(A) * len(elements) + index(B)`, so pair counts fit in a list
+    indexed by pair rather than a dict keyed by strings.
+    """
+
+    elements: List[str]
+    # The pairs each pair becomes in one step. Pairs without a rule stay the same
+    targets: List[Tuple[int, ...]]
+
+    @classmethod
+    def compile(cls, template: str, rules: Dict[str, str]) -> PairRules:
+        elements = sorted({*template, *"".join(rules), *rules.values()})
+        element_count = len(elements)
+        indices = {e: i for i, e in enumerate(elements)}
+        targets = []
+
+        for first, second in product(elements, repeat=2):
+            insertion = rules.get(f"{first}{second}")
+
+            if insertion is None:
+                targets.append((indices[first] * element_count + indices[second],))
+            else:
+                # If we have "NN" and insert "C", we'll end up with "NC" and "CN"
+                targets.append(
+                    (
+                        indices[first] * element_count + indices[insertion],
+                        indices[insertion] * element_count + indices[second],
+                    )
+                )
+
+        return cls(elements, targets)
+
+    def get_index(self, pair: str) -> int:
+        first, second = (self.elements.index(e) for e in pair)
+
+        return first * len(self.elements) + second
+
+
+def process(polymer: List[int], rules: PairRules) -> List[int]:
     """
     Process one step of `polymer` with `rules`.
 
@@ -75,55 +115,40 @@ def process(polymer: Dict[str, int], rules: Dict[str, str]) -> Dict[str, int]:
     }
 
     If we have the pair "NN" and it needs "C" inserted, we need to remove all "NN"s and
-    add the same number of "NC" and "CN" pairs.
-    """
-    updates = defaultdict(int)
-
-    for pair, insertion in rules.items():
-        if pair not in polymer:
-            continue
+    add the same number of "NC" and "CN" pairs. `polymer` holds the count of each pair
+    by its index (see `PairRules`).
 
-        count = polymer[pair]
-        # Remove all occurences of this pair, since the new char will split it
-        updates[pair] -= count
-
-        # If we have "NN" and insert "C", we'll end up with "NC" and "CN"
-        new_pair_a = f"{pair[0]}{insertion}"
-        new_pair_b = f"{insertion}{pair[1]}"
-
-        # We create the same number of each new pair as we had of the old pair
-        updates[new_pair_a] += count
-        updates[new_pair_b] += count
-
-    # Copy the polymer pairs, defaulting new counts to 0.
-    # Remember we need to process the updates all at once at the end since all pairs are
-    # considered simultaneously.
-    polymer = defaultdict(int, polymer)
-    for pair, count in updates.items():
-        polymer[pair] += count
+    Every pair's count is a linear function of the counts before, so this could be a
+    matrix raised to the number of steps. But the counts about double every step, and
+    squaring a matrix of such big ints is far slower than stepping through each step
+    one pair at a time.
+    """
+    new_polymer = [0] * len(polymer)
 
-        # If the pair doesn't have any more occurences, remove it to keep the size of
-        # the polymer down
-        if polymer[pair] <= 0:
-            del polymer[pair]
+    for pair, count in enumerate(polymer):
+        if count:
+            for new_pair in rules.targets[pair]:
+                new_polymer[new_pair] += count
 
-    return polymer
+    return new_polymer
 
 
 def simulate(steps: int) -> int:
-    # Keep track of the last char in the template, see note below
-    last = template[-1]
+    template, raw_rules = get_template_and_rules()
+    rules = PairRules.compile(template, raw_rules)
     # Create all pairs from the polymer.
     # For example, "NNCB" -> ["NN", "NC", "CB"]
     # Count the occurences of each
-    polymer = Counter("".join(pair) for pair in zip(template, template[1:]))
+    polymer = [0] * len(rules.targets)
+    for pair in zip(template, template[1:]):
+        polymer[rules.get_index("".join(pair))] += 1
 
     for _ in range(steps):
         polymer = process(polymer, rules)
 
     # Count how many times each char appears
-    counts = defaultdict(int)
-    for pair, count in polymer.items():
+    counts = [0] * len(rules.elements)
+    for pair, count in enumerate(polymer):
         # Since we duplicated chars, make sure to only count the first char in each
         # pair.
         # For example, "NNCB" -> ["NN", "NC", "CB"]
@@ -132,14 +157,16 @@ def simulate(steps: int) -> int:
         # even though the real counts are
         #   2 Ns, 1 C,  and 1 B
         # Only counting the first char in the pair removes the duplicates
-        counts[pair[0]] += count
+        counts[pair // len(rules.elements)] += count
 
     # Since we're only looking at the first value in each pair, we don't count the last
     # char
-    counts[last] += 1
+    counts[rules.elements.index(template[-1])] += 1
 
-    most_common = max(counts.values())
-    least_common = min(counts.values())
+    # Elements that never appear don't count as the least common
+    counts = [c for c in counts if c]
+    most_common = max(counts)
+    least_common = min(counts)
 
     return most_common - least_common
 
@@ -148,11 +175,10 @@ def part_1() -> int:
     return simulate(10)
 
 
-print(part_1())
-
-
 def part_2() -> int:
     return simulate(40)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
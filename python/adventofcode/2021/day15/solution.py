@@ -1,173 +1,212 @@
-from copy import deepcopy
-from dataclasses import dataclass
-from heapq import heappop, heappush
-from typing import List
+from array import array
+from typing import List, Optional
 
-from adventofcode.utils import is_valid_point, load_list
+from adventofcode.utils import count, load_list, timer
 
-risk_levels: List[List[int]] = load_list(parser=lambda l: [int(x) for x in l])
 
+def get_risk_levels() -> List[List[int]]:
+    return load_list(parser=lambda l: [int(x) for x in l])
 
-def get_risk(x: int, y: int, risk_levels: List[List[int]]) -> int:
-    return risk_levels[y][x]
 
-
-def repeat(risk_levels: List[List[int]]) -> List[List[int]]:
+class TiledRiskMap:
     """
-    Repeat `risk_levels` to the right or downward.
+    `risk_levels` repeated `tiles` times to the right and downward, without building
+    the whole map.
 
-    We only need one function since both operations are the same. Increase risk by 1
-    and wrap it around if it's greater than 9.
+    Each tile's risk levels are 1 more than the tile to its left (or above it),
+    wrapping around from 9 to 1. So a tile's risk levels are the original ones plus
+    how many tiles right and down it is, and we can find any of them when we need it.
     """
-    original_height = len(risk_levels)
-    original_width = len(risk_levels[0])
-
-    new_map = deepcopy(risk_levels)
 
-    for y in range(original_height):
-        for x in range(original_width):
-            new_map[y][x] = new_map[y][x] + 1
+    def __init__(self, risk_levels: List[List[int]], tiles: int = 1) -> None:
+        tile_width = len(risk_levels[0])
+        tile_height = len(risk_levels)
+        self.width = tile_width * tiles
+        self.height = tile_height * tiles
 
-            if new_map[y][x] > 9:
-                new_map[y][x] = 1
+        # Look up where each row and column is in its tile, and how many tiles over it
+        # is. These are only as big as one side of the map
+        self.rows = [risk_levels[y % tile_height] for y in range(self.height)]
+        self.row_tiles = [y // tile_height for y in range(self.height)]
+        self.columns = [x % tile_width for x in range(self.width)]
+        self.column_tiles = [x // tile_width for x in range(self.width)]
 
-    return new_map
+        # Map an original risk level plus the tiles moved to the wrapped risk level
+        self.wrapped = [(r - 1) % 9 + 1 for r in range(9 + 2 * tiles)]
 
 
-def expand(risk_levels: List[List[int]]) -> List[List[int]]:
-    """
-    Expand `risk_levels` into a 5x5 grid.
+# Distances are stored as unsigned 32 bit ints, so no real one is this big
+UNREACHED = 2**32 - 1
 
-    i.e. repeat `risk_levels` right 5 times and down 5 times for a total of 25 tiles.
 
-    Notice that the resulting grid is symmetric across a line from the top left to the
-    bottom right. i.e. if we number each unique tile, they look like this
+class Frontier:
+    """
+    One direction of a shortest path search across a `TiledRiskMap`.
 
-    - 0 1 2 3
-    . - 4 5 6
-    . . - 7 8
-    . . . - 9
-    . . . . -
+    This is Dijkstra with a bucket queue (Dial's algorithm). Risks are only 1-9, so
+    every point waiting to be expanded is within 9 of the distance being expanded,
+    and 10 buckets are enough. Points are numbered row by row, and their distances are
+    kept in an array rather than a dict, so each point takes 4 bytes.
 
-    - . . . .
-    0 - . . .
-    1 4 - . .
-    2 5 7 - .
-    3 6 8 9 -
+    Searching forward, a point's distance is the risk of the lowest risk path from
+    `start` to it. Searching backward, it's the risk of the lowest risk path from it
+    to `start`, which doesn't include its own risk level.
     """
-    original_height = len(risk_levels)
-    original_width = len(risk_levels[0])
-
-    # 5x5 grid
-    tiles = [[None] * 5 for _ in range(5)]
-
-    # Create each tile in the 5x5 grid on the right half of the diagonal line mentioned
-    # above
-    for y in range(5):
-        for x in range(y, 5):
-            # The top left tile is the original risk levels
-            if (x, y) == (0, 0):
-                tiles[y][x] = risk_levels
-                continue
 
-            # If we're on the top row, we can just repeat the tile to the left of us
-            if y == 0:
-                tiles[y][x] = repeat(tiles[y][x - 1])
+    def __init__(self, risk_map: TiledRiskMap, start: int, forward: bool = True):
+        self.risk_map = risk_map
+        self.forward = forward
+        self.distances = array("I", [UNREACHED]) * (risk_map.width * risk_map.height)
+        self.distances[start] = 0
+        self.buckets: List[List[int]] = [[start], *([] for _ in range(9))]
+        # The distance we're expanding next. Every point closer than this is final
+        self.distance = 0
+        # The points in the buckets, including ones we've since found shorter paths to
+        self.pending = 1
+        self.expanded = 0
+
+    def expand(self, other_distances: Optional[array] = None) -> int:
+        """
+        Expand every point at the current distance, and move on to the next one.
+
+        Return the risk of the lowest risk path we found through a point that
+        `other_distances` (from a search in the other direction) has also reached, or
+        UNREACHED.
+        """
+        # Look everything up once, since this is the inner loop. The risk level at
+        # (x, y) is `wrapped[rows[y][columns[x]] + row_tiles[y] + column_tiles[x]]`
+        risk_map = self.risk_map
+        width = risk_map.width
+        height = risk_map.height
+        rows = risk_map.rows
+        row_tiles = risk_map.row_tiles
+        columns = risk_map.columns
+        column_tiles = risk_map.column_tiles
+        wrapped = risk_map.wrapped
+        forward = self.forward
+        distances = self.distances
+        buckets = self.buckets
+        distance = self.distance
+        bucket = buckets[distance % 10]
+        best = UNREACHED
+        pending = self.pending
+        expanded = self.expanded
+
+        while bucket:
+            index = bucket.pop()
+            pending -= 1
+
+            # We already found a shorter path here
+            if distances[index] != distance:
                 continue
 
-            # Otherwise, repeat the tile above us
-            tiles[y][x] = repeat(tiles[y - 1][x])
-
-    # Copy the tiles on the left half of the diagonal line mentioned above from the
-    # right half we already filled in
-    for y in range(1, 5):
-        for x in range(y):
-            tiles[y][x] = tiles[x][y]
+            expanded += 1
+            y, x = divmod(index, width)
 
-    new_height = original_height * 5
-    new_width = original_width * 5
-    new_risk_levels = [[None] * new_width for _ in range(new_height)]
+            # Searching backward, moving from a point to here costs our risk level
+            if not forward:
+                risk = wrapped[rows[y][columns[x]] + row_tiles[y] + column_tiles[x]]
 
-    # Flatten out the list of lists of tiles into a single 2D grid
-    for tiles_y, tile_row in enumerate(tiles):
-        for tiles_x, tile in enumerate(tile_row):
-            for y, row in enumerate(tile):
-                for x, value in enumerate(row):
-                    # To get the absolute y, multiply the tile row by the height of
-                    # each tile and add our position within the tile
-                    new_y = y + (original_height * tiles_y)
-                    new_x = x + (original_width * tiles_x)
-                    new_risk_levels[new_y][new_x] = value
+            for neighbor, neighbor_x, neighbor_y in (
+                (index - 1, x - 1, y),
+                (index + 1, x + 1, y),
+                (index - width, x, y - 1),
+                (index + width, x, y + 1),
+            ):
+                if not (0 <= neighbor_x < width and 0 <= neighbor_y < height):
+                    continue
 
-    return new_risk_levels
+                # Searching forward, moving there costs its risk level
+                if forward:
+                    risk = wrapped[
+                        rows[neighbor_y][columns[neighbor_x]]
+                        + row_tiles[neighbor_y]
+                        + column_tiles[neighbor_x]
+                    ]
 
+                new_distance = distance + risk
+                if new_distance >= distances[neighbor]:
+                    continue
 
-@dataclass
-class Path:
+                distances[neighbor] = new_distance
+                buckets[new_distance % 10].append(neighbor)
+                pending += 1
 
-    x: int
-    y: int
-    risk: int
+                if (
+                    other_distances is not None
+                    and other_distances[neighbor] != UNREACHED
+                ):
+                    best = min(best, new_distance + other_distances[neighbor])
 
-    # Implement for comparison in the heap
-    def __lt__(self, other: object) -> bool:
-        if not isinstance(other, Path):
-            return NotImplemented
+        self.distance += 1
+        self.pending = pending
+        self.expanded = expanded
 
-        return self.risk < other.risk
+        return best
 
 
-def get_risk_of_lowest_path(risk_levels: List[List[int]]) -> int:
+def get_risk_of_lowest_path(risk_map: TiledRiskMap, bidirectional: bool = False) -> int:
     """
-    Find the risk of the lowest risk path.
+    Find the risk of the lowest risk path from the top left to the bottom right.
 
-    Use Dijkstra
+    With `bidirectional`, search from both ends at once. Each search only has to get
+    about halfway, so they expand about half as many points as one search would.
     """
-    # Start with a path that has 0 risk and is at position (0, 0)
-    paths = [Path(0, 0, 0)]
-    # Keep track of the positions we've visited so we don't visit twice
-    visited = set()
-    # We stop when we reach the bottom right position
-    end_pos = (len(risk_levels[0]) - 1, len(risk_levels) - 1)
-
-    while True:
-        # Get the path with the lowest risk
-        path = heappop(paths)
-
-        # Consider each neighbor (up, down, left, right)
-        for point in (
-            (path.x + 1, path.y),
-            (path.x - 1, path.y),
-            (path.x, path.y + 1),
-            (path.x, path.y - 1),
-        ):
-            # We can't visit if the point isn't in the grid or we've already visited
-            if not is_valid_point(*point, risk_levels) or point in visited:
-                continue
+    end = risk_map.width * risk_map.height - 1
+    forward = Frontier(risk_map, 0)
+
+    if not bidirectional:
+        # Once we're expanding the end's distance, nothing can get there for less
+        while forward.distance < forward.distances[end]:
+            forward.expand()
+
+        count("points expanded", forward.expanded)
+
+        return forward.distances[end]
+
+    backward = Frontier(risk_map, end, forward=False)
+    best = 0 if end == 0 else UNREACHED
 
-            new_risk = path.risk + get_risk(*point, risk_levels)
+    # Any path we haven't found yet leaves one search's expanded points at its current
+    # distance or more, and reaches the other's the same way. Once that's no better
+    # than a path we found, we're done. If either search runs out of points, it has
+    # reached everything it can
+    while (
+        forward.pending
+        and backward.pending
+        and forward.distance + backward.distance < best
+    ):
+        # Expand whichever search has less to do
+        frontier, other = (
+            (forward, backward)
+            if forward.pending <= backward.pending
+            else (backward, forward)
+        )
+        best = min(best, frontier.expand(other.distances))
 
-            # If this is the end, we've found the lowest risk since we always consider
-            # the next path with the lowest risk
-            if point == end_pos:
-                return new_risk
+    count("points expanded", forward.expanded + backward.expanded)
 
-            # Make sure not to come back here
-            visited.add(point)
-            # Add this new path to those we may consider. Use a heap so the paths are
-            # ordered by risk (from lowest to highest)
-            heappush(paths, Path(*point, new_risk))
+    return best
 
 
 def part_1() -> int:
-    return get_risk_of_lowest_path(risk_levels)
+    with timer("parse"):
+        risk_levels = get_risk_levels()
 
+    with timer("solve"):
+        return get_risk_of_lowest_path(TiledRiskMap(risk_levels))
 
-print(part_1())
 
+def part_2(tiles: int = 5, bidirectional: bool = True) -> int:
+    with timer("parse"):
+        risk_levels = get_risk_levels()
 
-def part_2() -> int:
-    return get_risk_of_lowest_path(expand(risk_levels))
+    with timer("solve"):
+        return get_risk_of_lowest_path(
+            TiledRiskMap(risk_levels, tiles=tiles), bidirectional=bidirectional
+        )
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -2,193 +2,217 @@
 
 from __future__ import annotations
 
-import operator
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from functools import reduce
-from typing import List
+from dataclasses import dataclass
+from enum import Enum, auto
+from operator import add, mul
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 from adventofcode.utils import load_list
 
-transmission = load_list()[0]
+LITERAL_VALUE_TYPE_ID = 4
 
+# Map each operator's type ID to how it combines the value of its sub-packets so far
+# with the next one's. Comparisons always have exactly two sub-packets
+OPERATIONS: Dict[int, Callable[[int, int], int]] = {
+    0: add,
+    1: mul,
+    2: min,
+    3: max,
+    5: lambda first, second: int(first > second),
+    6: lambda first, second: int(first < second),
+    7: lambda first, second: int(first == second),
+}
 
-@dataclass
-class Packet(ABC):
-
-    # Binary string
-    data: str
-    sub_packets: List[Packet] = field(init=False, default_factory=list)
-
-    @staticmethod
-    def _bin_to_int(binary: str) -> int:
-        return int(binary, 2)
-
-    @property
-    def size(self) -> int:
-        return len(self.data)
 
-    @property
-    def version(self) -> int:
-        return self._bin_to_int(self.data[:3])
+class BitReader:
+    """
+    Read a transmission a few bits at a time, from the most significant bit.
 
-    @property
-    def type_id(self) -> int:
-        return self._bin_to_int(self.data[3:6])
+    The bits stay packed in bytes, and we keep track of how far we've read. Reading
+    only looks at the bytes the bits are in, so it takes the same time no matter how
+    long the transmission is.
+    """
 
-    @classmethod
-    def parse(cls, binary: str) -> Packet:
-        # If the type ID is 4, it's a literal value
-        if cls._bin_to_int(binary[3:6]) == 4:
-            return LiteralValuePacket.parse(binary)
-
-        # Otherwise it's an operator
-        return OperatorPacket.parse(binary)
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        # In bits
+        self.offset = 0
 
     @classmethod
-    def from_hex(cls, hex_: str) -> Packet:
-        # Interpret the string as a base 16 integer, then convert to binary.
-        # Remove the '0b' python adds at the beginning of the binary string
-        binary = bin(int(hex_, 16))[2:]
+    def from_hex(cls, hex_: str) -> BitReader:
+        # Every hex digit is 4 bits, including leading zeros. Bytes are 2 digits, so
+        # pad an odd number of digits with 4 bits we won't read
+        hex_ = hex_.strip()
+        if len(hex_) % 2:
+            hex_ += "0"
 
-        return cls.parse(binary)
+        return cls(bytes.fromhex(hex_))
 
-    @abstractmethod
-    def evaluate(self) -> int:
-        """
-        Return the result of evaluating this packet.
+    def read(self, count: int) -> int:
+        """Return the next `count` bits as an int."""
+        start = self.offset
+        end = start + count
+        self.offset = end
 
-        Implementation varies depending on the packet type.
-        """
+        chunk = int.from_bytes(self.data[start // 8 : -(-end // 8)], "big")
 
+        # Drop the bits after the ones we want, then the ones before them
+        return (chunk >> (-end % 8)) & ((1 << count) - 1)
 
-class LiteralValuePacket(Packet):
-    def evaluate(self) -> int:
-        # The value starts at the 7th bit since the first 6 were the version and type ID
-        index = 7
-        chunks = []
+    def read_literal_value(self) -> int:
+        value = 0
 
+        # Each group of 5 bits starts with whether there's another group after it
         while True:
-            chunk = self.data[index : index + 4]
-            chunks.append(chunk)
-
-            # We stop when the chunk starts with a 0
-            if self.data[index - 1] == "0":
-                break
+            group = self.read(5)
+            value = (value << 4) | (group & 0b1111)
 
-            index += 5
+            if not group & 0b10000:
+                return value
 
-        return self._bin_to_int("".join(chunks))
 
-    @staticmethod
-    def parse(binary: str) -> Packet:
-        end_index = 6
+class EventKind(Enum):
+    ENTER_OPERATOR = auto()
+    LITERAL_VALUE = auto()
+    EXIT_OPERATOR = auto()
 
-        while binary[end_index] != "0":
-            end_index += 5
 
-        # The last chunk
-        end_index += 4
+class Event(NamedTuple):
 
-        return LiteralValuePacket(binary[: end_index + 1])
+    kind: EventKind
+    version: int
+    type_id: int
+    # Only literal values have a value
+    value: Optional[int] = None
 
 
 @dataclass
-class OperatorPacket(Packet):
-
-    sub_packets: List[Packet]
-    packet_start_index: int
-
-    @classmethod
-    def parse(cls, binary: str) -> OperatorPacket:
-        if binary[6] == "0":
-            # 15 bits are used to represent the size of the sub-packets
-            size = cls._bin_to_int(binary[7:22])
-            parsed_size = 0
-            sub_packets = []
+class _OpenOperator:
+    """An operator packet that we haven't read all of the sub-packets of yet."""
+
+    version: int
+    type_id: int
+    # The operator gives either the offset its sub-packets end at, or how many there
+    # are. We count the latter down as we read them
+    end: Optional[int] = None
+    remaining: Optional[int] = None
+
+    def is_done(self, offset: int) -> bool:
+        if self.end is not None:
+            return offset >= self.end
+
+        return self.remaining == 0
+
+
+def decode(reader: BitReader) -> Iterator[Event]:
+    """
+    Read the next packet, including all of the packets in it, yielding an event as
+    each one starts or ends.
+
+    Nothing is kept for a packet once it's read, so the memory used only depends on
+    how deeply packets are nested. Operators we're still reading the sub-packets of
+    are kept on a stack rather than read recursively, so deeply nested packets can't
+    hit the recursion limit.
+    """
+    stack: List[_OpenOperator] = []
+
+    while True:
+        version = reader.read(3)
+        type_id = reader.read(3)
+        finished = False
+
+        if type_id == LITERAL_VALUE_TYPE_ID:
+            value = reader.read_literal_value()
+            yield Event(EventKind.LITERAL_VALUE, version, type_id, value)
+            finished = True
+        else:
+            if reader.read(1) == 0:
+                # 15 bits are used to represent the size of the sub-packets
+                size = reader.read(15)
+                operator = _OpenOperator(version, type_id, end=reader.offset + size)
+            else:
+                # 11 bits are used to represent the number of sub-packets
+                operator = _OpenOperator(version, type_id, remaining=reader.read(11))
+
+            stack.append(operator)
+            yield Event(EventKind.ENTER_OPERATOR, version, type_id)
+
+        # Finishing a packet may finish its operator too, and so on
+        while True:
+            if finished:
+                if not stack:
+                    return
 
-            chunk = binary[22:]
-            while parsed_size != size:
-                packet = Packet.parse(chunk)
-                sub_packets.append(packet)
+                if stack[-1].remaining is not None:
+                    stack[-1].remaining -= 1
 
-                parsed_size += packet.size
-                # Move our window down past the packet we just parsed
-                chunk = chunk[packet.size :]
+            operator = stack[-1]
+            if not operator.is_done(reader.offset):
+                break
 
-            return cls(
-                # The header is 22 bits and we want to include the data for all of the
-                # sub-packets
-                data=binary[: size + 22],
-                sub_packets=sub_packets,
-                packet_start_index=22,
-            )
+            stack.pop()
+            yield Event(EventKind.EXIT_OPERATOR, operator.version, operator.type_id)
+            finished = True
 
-        # 11 bits are used to represent the number of sub-packets
-        packet_count = cls._bin_to_int(binary[7:18])
-        size = 0
-        sub_packets = []
-        chunk = binary[18:]
-        for _ in range(packet_count):
-            packet = Packet.parse(chunk)
-            sub_packets.append(packet)
 
-            size += packet.size
-            # Move our window down past the packet we just parsed
-            chunk = chunk[packet.size :]
+def get_version_sum(events: Iterable[Event]) -> int:
+    """Calculate the sum of the versions of every packet in `events`."""
+    return sum(e.version for e in events if e.kind is not EventKind.EXIT_OPERATOR)
 
-        return cls(
-            data=binary[: size + 18], sub_packets=sub_packets, packet_start_index=18
-        )
 
-    def evaluate(self) -> int:
-        results = (p.evaluate() for p in self.sub_packets)
+def evaluate(events: Iterable[Event]) -> int:
+    """
+    Return the result of evaluating the packet in `events`.
 
-        if self.type_id == 0:
-            return sum(results)
+    Each operator combines its sub-packets' values as they arrive, so we only keep
+    one value for each operator we're in.
+    """
+    # The type ID of each operator we're in, and what its sub-packets combine to so
+    # far, if it's seen any
+    stack: List[Tuple[int, Optional[int]]] = []
 
-        if self.type_id == 1:
-            return reduce(operator.mul, results)
+    for event in events:
+        if event.kind is EventKind.ENTER_OPERATOR:
+            stack.append((event.type_id, None))
+            continue
 
-        if self.type_id == 2:
-            return min(results)
+        if event.kind is EventKind.LITERAL_VALUE:
+            value = event.value
+        else:
+            _, value = stack.pop()
 
-        if self.type_id == 3:
-            return max(results)
+            if value is None:
+                raise ValueError(f"Operator with type ID {event.type_id} is empty")
 
-        if self.type_id == 5:
-            return next(results) > next(results)
+        # That's the outermost packet
+        if not stack:
+            return value
 
-        if self.type_id == 6:
-            return next(results) < next(results)
+        type_id, combined = stack[-1]
+        if combined is not None:
+            value = OPERATIONS[type_id](combined, value)
 
-        if self.type_id == 7:
-            return next(results) == next(results)
+        stack[-1] = (type_id, value)
 
-        raise ValueError(f"Unknown type ID: {self.type_id}")
+    raise ValueError("The transmission ended in the middle of a packet")
 
 
-def get_version_sum(packet: Packet) -> int:
-    """Recursively calculate the sum of the versions contained in `packet`."""
-    version_sum = packet.version
+def get_transmission() -> str:
+    return load_list()[0]
 
-    for sub_packet in packet.sub_packets:
-        version_sum += get_version_sum(sub_packet)
 
-    return version_sum
+def get_events() -> Iterator[Event]:
+    return decode(BitReader.from_hex(get_transmission()))
 
 
 def part_1() -> int:
-    packet = Packet.from_hex(transmission)
-    return get_version_sum(packet)
-
-
-print(part_1())
+    return get_version_sum(get_events())
 
 
 def part_2() -> int:
-    packet = Packet.from_hex(transmission)
-    return packet.evaluate()
+    return evaluate(get_events())
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
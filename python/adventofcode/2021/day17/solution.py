@@ -29,16 +29,17 @@ class TargetArea:
         return TargetArea(*parse_min_and_max(x_part), *parse_min_and_max(y_part))
 
 
-target_area = TargetArea.parse(load_list()[0])
-
-
 def get_peak_height(y_velocity: int) -> int:
     # Since the y velocity decreases by one each step, it's basically the reverse sum of
     # natural numbers. For example, 5 + 4 + 3 + 2 + 1
     return (y_velocity * (y_velocity + 1)) / 2
 
 
-def get_max_y_velocity() -> int:
+def get_target_area() -> TargetArea:
+    return TargetArea.parse(load_list()[0])
+
+
+def get_max_y_velocity(target_area: TargetArea) -> int:
     # Since projectile motion is symmetric, the y velocity at y = 0 will be the same
     # magnitude as when you launched it (but in the opposite direction). For example,
     # if we launch with y velocity 10, at y = 0 (some distance to the right) the
@@ -53,7 +54,8 @@ def get_max_y_velocity() -> int:
 def part_1() -> int:
     # The x and y components are completely separate. For this part, we only care
     # about y
-    return get_peak_height(get_max_y_velocity())
+    return get_peak_height(get_max_y_velocity(get_target_area()))
 
 
-print(part_1())
+if __name__ == "__main__":
+    print(part_1())
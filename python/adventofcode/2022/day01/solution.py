@@ -1,13 +1,13 @@
-from typing import List
+from heapq import nlargest
+from typing import Iterator
 
-from adventofcode.utils import load_input
+from adventofcode.utils import iter_blocks
 
 
-def get_calories() -> List[int]:
-    # Each elf is separated by two newlines
-    elves = load_input().split("\n\n")
+def get_calories() -> Iterator[int]:
+    # Each elf is separated by a blank line.
     # Sum the calories (each on a new line) that each elf is carying
-    return [sum(int(c) for c in e.split("\n")) for e in elves]
+    return iter_blocks(parser=lambda elf: sum(int(c) for c in elf))
 
 
 def part_1() -> int:
@@ -16,9 +16,10 @@ def part_1() -> int:
 
 def part_2() -> int:
     # Return the sum of the three largest calorie counts.
-    # By default, sorting is from low to high, so reverse it.
-    return sum(sorted(get_calories(), reverse=True)[0:3])
+    # Only keep the three largest as we go rather than sorting every elf
+    return sum(nlargest(3, get_calories()))
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
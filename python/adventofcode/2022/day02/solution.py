@@ -112,9 +112,6 @@ def part_1() -> int:
     return score(choice_decoder)
 
 
-print(part_1())
-
-
 def chose(others_value: str, outcome: str) -> Choice:
     # Chose based on the other player and the needed outcome
     others_choice = decode_choice(others_value)
@@ -127,4 +124,6 @@ def part_2() -> int:
     return score(chose)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
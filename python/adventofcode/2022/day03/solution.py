@@ -26,9 +26,6 @@ def part_1() -> int:
     )
 
 
-print(part_1())
-
-
 def get_unique_item_per_group(elves_per_group: int) -> List[str]:
     rucksacks = load_list()
     group_count = len(rucksacks) // elves_per_group
@@ -47,4 +44,6 @@ def part_2() -> int:
     return sum(priority(item) for item in get_unique_item_per_group(elves_per_group=3))
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
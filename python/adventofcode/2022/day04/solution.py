@@ -1,67 +1,55 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Callable, List, Tuple
 
 from more_itertools import quantify
 
-from adventofcode.utils import load_list
+from adventofcode.utils import IntervalSet, load_list
 
 
-@dataclass
-class Assignment:
+def parse_assignment(value: str) -> IntervalSet:
+    start, end = (int(x) for x in value.split("-"))
 
-    start: int
-    end: int
+    # Assignments include their last section
+    return IntervalSet([(start, end + 1)])
 
-    @classmethod
-    def parse(cls, value: str) -> Assignment:
-        return Assignment(*(int(x) for x in value.split("-")))
 
-    def fully_overlaps(self, other: Assignment) -> bool:
-        # Two assignments fully overlap if one is contained in the
-        # other. For example
-        # ...aaa....
-        # ...bbbb...
-        return self.start <= other.start and self.end >= other.end
-
-    def overlaps(self, other: Assignment) -> bool:
-        # Two assignments overlap if at least one section is shared.
-        # For example
-        # ...aaa....
-        # .....bb...
-        # or
-        # ...aaa....
-        # ..bb......
-        start_contained = self.start >= other.start and self.start <= other.end
-        end_contained = self.end <= other.end and self.end >= other.start
-
-        return start_contained or end_contained
-
-
-def get_assignments() -> List[Tuple[Assignment, Assignment]]:
+def get_assignments() -> List[Tuple[IntervalSet, IntervalSet]]:
     return [
-        (Assignment.parse(left), Assignment.parse(right))
+        (parse_assignment(left), parse_assignment(right))
         for left, right in load_list(parser=lambda line: line.split(","))
     ]
 
 
-def count_overlaps(comparison: Callable[[Assignment, Assignment], bool]) -> int:
-    return quantify(
-        comparison(left, right) or comparison(right, left)
-        for left, right in get_assignments()
-    )
+def count_overlaps(comparison: Callable[[IntervalSet, IntervalSet], bool]) -> int:
+    return quantify(comparison(left, right) for left, right in get_assignments())
 
 
-def part_1() -> int:
-    return count_overlaps(lambda a, b: a.fully_overlaps(b))
+def fully_overlaps(left: IntervalSet, right: IntervalSet) -> bool:
+    # Two assignments fully overlap if one is contained in the other, i.e. their
+    # shared sections are all of one of them. For example
+    # ...aaa....
+    # ...bbbb...
+    shared = left & right
 
+    return shared == left or shared == right
 
-print(part_1())
+
+def overlaps(left: IntervalSet, right: IntervalSet) -> bool:
+    # Two assignments overlap if at least one section is shared. For example
+    # ...aaa....
+    # .....bb...
+    return bool(left & right)
+
+
+def part_1() -> int:
+    return count_overlaps(fully_overlaps)
 
 
 def part_2() -> int:
-    return count_overlaps(lambda a, b: a.overlaps(b))
+    return count_overlaps(overlaps)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
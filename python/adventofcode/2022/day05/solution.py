@@ -45,9 +45,6 @@ def part_1() -> str:
     return "".join(s[-1] for s in stacks)
 
 
-print(part_1())
-
-
 def part_2() -> str:
     stacks = get_stacks()
     moves = get_moves()
@@ -60,4 +57,6 @@ def part_2() -> str:
     return "".join(s[-1] for s in stacks)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
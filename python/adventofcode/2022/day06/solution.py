@@ -9,5 +9,14 @@ def find_marker(chunk_size: int) -> int:
             return end
 
 
-print(find_marker(chunk_size=4))
-print(find_marker(chunk_size=14))
+def part_1() -> int:
+    return find_marker(chunk_size=4)
+
+
+def part_2() -> int:
+    return find_marker(chunk_size=14)
+
+
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -73,9 +73,6 @@ def part_1() -> int:
     )
 
 
-print(part_1())
-
-
 def part_2() -> int:
     fs = get_filesystem()
     unused = 70000000 - fs.size
@@ -86,4 +83,6 @@ def part_2() -> int:
     )
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -1,180 +1,91 @@
-from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Final, Iterator, Set, Tuple
 
-from adventofcode.utils import load_list
+from adventofcode.utils import Grid, load_grid
 
+# Taller than any tree, so looking in any direction always stops at the edge
+EDGE: Final = 10
 
-def save_debug_map(
-    heights: List[List[int]],
-    visible_from_top: Set[Tuple[int, int]],
-    visible_from_bottom: Set[Tuple[int, int]],
-    visible_from_left: Set[Tuple[int, int]],
-    visible_from_right: Set[Tuple[int, int]],
-) -> None:
-    for row in range(len(heights)):
-        for col in range(len(heights[0])):
-            if (row, col) in visible_from_top:
-                marker = "t"
-            elif (row, col) in visible_from_bottom:
-                marker = "b"
-            elif (row, col) in visible_from_left:
-                marker = "l"
-            elif (row, col) in visible_from_right:
-                marker = "r"
-            else:
-                marker = heights[row][col]
 
-            heights[row][col] = marker
+def get_heights() -> Grid:
+    return load_grid(parser=int, border=EDGE)
 
-    with open(Path(__file__).parent / "debug.txt", "w") as file:
-        file.write("\n".join("".join(str(x) for x in row) for row in heights))
 
+def find_view(heights: Grid, index: int, offset: int) -> int:
+    """Return the number of trees we can see from `index` looking towards `offset`."""
+    cells = heights.cells
+    height = cells[index]
+    count = 0
 
-def get_heights() -> List[List[int]]:
-    return load_list(parser=lambda line: [int(x) for x in line])
-
-
-def find_visible_horizontally(
-    heights: List[List[int]], invert: bool
-) -> Set[Tuple[int, int]]:
-    visible = set()
-    if invert:
-        direction = -1
-        col_range = range(len(heights[0]) - 1, 0, direction)
-    else:
-        direction = 1
-        col_range = range(0, len(heights[0]), direction)
-
-    for row in range(len(heights)):
-        tallest = -1
-        for col in col_range:
-            # This tree is only visible if it's taller than the tallest tree we've seen
-            # so far
-            if heights[row][col] > tallest:
-                tallest = heights[row][col]
-                visible.add((row, col))
-
-    return visible
+    index += offset
+    while cells[index] < height:
+        index += offset
+        count += 1
 
+    # Apparently we count the last tree, i.e. the one that blocks our view
+    if cells[index] != EDGE:
+        count += 1
 
-def find_visible_vertically(
-    heights: List[List[int]], invert: bool
-) -> Set[Tuple[int, int]]:
-    visible = set()
-    if invert:
-        direction = -1
-        row_range = range(len(heights) - 1, 0, direction)
-    else:
-        direction = 1
-        row_range = range(0, len(heights), direction)
-
-    for col in range(len(heights[0])):
-        tallest = -1
-        for row in row_range:
-            if heights[row][col] > tallest:
-                tallest = heights[row][col]
-                visible.add((row, col))
+    return count
 
-    return visible
 
+def get_sight_lines(heights: Grid) -> Iterator[Tuple[int, int, int]]:
+    """
+    Yield (start, offset, length) for looking in from every spot on the edge.
 
-def part_1() -> int:
-    heights = get_heights()
+    i.e. along each row from the left and the right and along each column from the top
+    and the bottom.
+    """
+    width, height = heights.width, heights.height
 
-    visible_from_top = find_visible_vertically(heights, invert=False)
-    visible_from_bottom = find_visible_vertically(heights, invert=True)
-    visible_from_left = find_visible_horizontally(heights, invert=False)
-    visible_from_right = find_visible_horizontally(heights, invert=True)
+    for y in range(height):
+        yield heights.index(0, y), 1, width
+        yield heights.index(width - 1, y), -1, width
 
-    # save_debug_map(
-    #     heights,
-    #     visible_from_top,
-    #     visible_from_bottom,
-    #     visible_from_left,
-    #     visible_from_right,
-    # )
+    for x in range(width):
+        yield heights.index(x, 0), heights.stride, height
+        yield heights.index(x, height - 1), -heights.stride, height
 
-    return len(
-        {
-            *visible_from_top,
-            *visible_from_bottom,
-            *visible_from_left,
-            *visible_from_right,
-        }
-    )
 
+def find_visible(heights: Grid) -> Set[int]:
+    cells = heights.cells
+    visible = set()
 
-print(part_1())
+    for index, offset, length in get_sight_lines(heights):
+        tallest = -1
 
+        for _ in range(length):
+            # This tree is only visible if it's taller than the tallest tree we've seen
+            # so far
+            if cells[index] > tallest:
+                tallest = cells[index]
+                visible.add(index)
 
-def find_vertical_view(
-    heights: List[List[int]], row: int, col: int, invert: bool
-) -> int:
-    count = 0
-    height = heights[row][col]
-
-    if invert:
-        at_end = lambda row: row >= len(heights)
-        direction = 1
-    else:
-        at_end = lambda row: row < 0
-        direction = -1
-
-    row += direction
-    while not at_end(row) and heights[row][col] < height:
-        row += direction
-        count += 1
+            index += offset
 
-    # Apparently we count the last tree, i.e. the one that blocks our view
-    if not at_end(row):
-        count += 1
+    return visible
 
-    return count
 
+def calculate_scenic_score(heights: Grid, index: int) -> int:
+    score = 1
 
-def find_horizontal_view(
-    heights: List[List[int]], row: int, col: int, invert: bool
-) -> int:
-    count = 0
-    height = heights[row][col]
-
-    if invert:
-        at_end = lambda col: col >= len(heights[0])
-        direction = 1
-    else:
-        at_end = lambda col: col < 0
-        direction = -1
-
-    col += direction
-    while not at_end(col) and heights[row][col] < height:
-        col += direction
-        count += 1
+    for offset in heights.orthogonal_offsets:
+        score *= find_view(heights, index, offset)
 
-    # Apparently we count the last tree, i.e. the one that blocks our view
-    if not at_end(col):
-        count += 1
+    return score
 
-    return count
 
+def part_1() -> int:
+    heights = get_heights()
 
-def calculate_scenic_score(heights: List[List[int]], row: int, col: int) -> int:
-    args = (heights, row, col)
-    return (
-        find_vertical_view(*args, invert=False)
-        * find_vertical_view(*args, invert=True)
-        * find_horizontal_view(*args, invert=False)
-        * find_horizontal_view(*args, invert=True)
-    )
+    return len(find_visible(heights))
 
 
 def part_2() -> int:
     heights = get_heights()
 
-    return max(
-        calculate_scenic_score(heights, row, col)
-        for row in range(len(heights))
-        for col in range(len(heights[0]))
-    )
+    return max(calculate_scenic_score(heights, index) for index in heights.indices)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -102,11 +102,10 @@ def part_1() -> int:
     return simulate_rope(size=2)
 
 
-print(part_1())
-
-
 def part_2() -> int:
     return simulate_rope(size=10)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
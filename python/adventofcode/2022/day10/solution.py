@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from pathlib import Path
 from typing import List, Set, Tuple
 
 from adventofcode.utils import load_list
@@ -107,22 +106,21 @@ def part_1() -> int:
     )[0]
 
 
-print(part_1())
-
-
-def draw_screen(pixels: List[str], width: int, height: int) -> None:
+def draw_screen(pixels: List[str], width: int, height: int) -> str:
     screen = []
     for row in range(height):
         screen.append(pixels[row * width : (row + 1) * width])
 
-    with open(Path(__file__).parent / "screen.txt", "w") as file:
-        file.write("\n".join("".join(row) for row in screen))
+    return "\n".join("".join(row) for row in screen)
 
 
-def part_2() -> int:
+def part_2() -> str:
     pixels = execute(get_instructions(), signal_strength_cycles={})[1]
 
-    draw_screen(pixels, width=40, height=6)
+    # We'll need to manually read the screen to get the solution
+    return draw_screen(pixels, width=40, height=6)
 
 
-part_2()
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -1,10 +1,11 @@
 from collections import deque
 from dataclasses import dataclass
 from functools import partial
+from itertools import islice, tee
 from operator import add, mul
-from typing import Callable, Deque, List
+from typing import Callable, Deque, Iterator, List, Tuple
 
-from adventofcode.utils import load_input
+from adventofcode.utils import find_cycle, load_input
 
 
 @dataclass
@@ -56,13 +57,24 @@ def get_monkeys() -> List[Monkey]:
     return monkeys
 
 
-def simulate(monkeys: List[Monkey], rounds: int, reduce_worry: bool) -> int:
-    inspection_counts = [0] * len(monkeys)
-
+def get_mod(monkeys: List[Monkey]) -> int:
+    """Return a number worry levels can be reduced mod without changing any test."""
     mod = 1
     for m in monkeys:
         mod *= m.divisible_arg
 
+    return mod
+
+
+def get_monkey_business(inspection_counts: List[int]) -> int:
+    largest_inspection_counts = sorted(inspection_counts, reverse=True)
+    return largest_inspection_counts[0] * largest_inspection_counts[1]
+
+
+def simulate(monkeys: List[Monkey], rounds: int, reduce_worry: bool) -> int:
+    inspection_counts = [0] * len(monkeys)
+    mod = get_mod(monkeys)
+
     for _ in range(rounds):
         for index, monkey in enumerate(monkeys):
             while monkey.items:
@@ -78,19 +90,80 @@ def simulate(monkeys: List[Monkey], rounds: int, reduce_worry: bool) -> int:
                 new_monkey = monkeys[monkey.test(new_item)]
                 new_monkey.items.append(new_item)
 
-    largest_inspection_counts = sorted(inspection_counts, reverse=True)
-    return largest_inspection_counts[0] * largest_inspection_counts[1]
+    return get_monkey_business(inspection_counts)
 
 
-def part_1() -> int:
-    return simulate(get_monkeys(), rounds=20, reduce_worry=True)
+def follow_item(
+    monkeys: List[Monkey], index: int, worry: int
+) -> Iterator[Tuple[Tuple[int, int], Tuple[int, ...]]]:
+    """
+    Follow one item forever, without reducing worry, starting with monkey `index`.
+
+    Yield the monkey holding it and its worry level before each round, and the
+    monkeys that inspected it during the round. Monkeys take turns in order, so an
+    item thrown to a later monkey is inspected again in the same round.
+    """
+    mod = get_mod(monkeys)
 
+    while True:
+        state = (index, worry)
+        inspected = [index]
 
-print(part_1())
+        while True:
+            monkey = monkeys[index]
+            worry = monkey.operation(worry) % mod
+            next_index = monkey.test(worry)
+
+            if next_index < index:
+                break
+
+            index = next_index
+            inspected.append(index)
+
+        index = next_index
+        yield state, tuple(inspected)
+
+
+def count_inspections(monkeys: List[Monkey], rounds: int) -> List[int]:
+    """
+    Count how many items each monkey inspects in `rounds` rounds, without reducing
+    worry.
+
+    Worry levels only change when the item is inspected, so every item moves
+    independently of the others. Each one usually starts repeating its path within a
+    few dozen rounds, and then we can stop following it.
+    """
+    inspection_counts = [0] * len(monkeys)
+
+    for index, monkey in enumerate(monkeys):
+        for worry in monkey.items:
+            # Keep a copy of the rounds, in case the item doesn't repeat in time
+            steps, followed = tee(follow_item(monkeys, index, worry))
+            cycle = find_cycle(steps, limit=rounds)
+
+            if cycle is None:
+                # Then we've already followed it for every round
+                for _, inspected in islice(followed, rounds):
+                    for inspector in inspected:
+                        inspection_counts[inspector] += 1
+
+                continue
+
+            for count, inspected in zip(cycle.occurrences(rounds), cycle.values):
+                for inspector in inspected:
+                    inspection_counts[inspector] += count
+
+    return inspection_counts
+
+
+def part_1() -> int:
+    return simulate(get_monkeys(), rounds=20, reduce_worry=True)
 
 
 def part_2() -> int:
-    return simulate(get_monkeys(), rounds=10_000, reduce_worry=False)
+    return get_monkey_business(count_inspections(get_monkeys(), rounds=10_000))
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -1,90 +1,59 @@
 import sys
-from collections import deque
-from typing import List, Set, Tuple
+from typing import Final, Iterator, List, Tuple
 
-from adventofcode.utils import load_list
+from adventofcode.utils import Grid, bfs, load_grid
 
+# Too high to ever climb to, so we never step off the map
+EDGE: Final = ord("z") + 2
 
-def get_heights() -> List[str]:
-    return load_list()
 
+def get_heights() -> Tuple[Grid, int, int]:
+    """Return the height map, where we start, and where we end."""
+    heights = load_grid(parser=ord, border=EDGE)
+    start = heights.find_all(ord("S"))[0]
+    end = heights.find_all(ord("E"))[0]
 
-def find_positions_of_char(heights: List[str], char: str) -> Set[Tuple[int, int]]:
-    positions = set()
+    # The start is at height "a" and the end is at height "z"
+    heights[start] = ord("a")
+    heights[end] = ord("z")
 
-    for row in range(len(heights)):
-        for col in range(len(heights[0])):
-            if heights[row][col] == char:
-                positions.add((row, col))
+    return heights, start, end
 
-    return positions
 
+def find_steps(heights: Grid, starts: List[int], end: int) -> int:
+    """
+    Return the fewest steps from any of `starts` to `end`.
 
-def find_steps(heights: List[str], start: Tuple[int, int]) -> int:
-    end = find_positions_of_char(heights, "E").pop()
-    to_visit = deque([(*start, 0)])
-    visited = {start}
+    BFS from all of the starts at once. The first time we reach the end is the
+    shortest path from the closest start.
+    """
+    cells = heights.cells
+    offsets = heights.orthogonal_offsets
 
-    while to_visit:
-        row, col, steps = to_visit.popleft()
-        cur = (row, col)
+    def get_neighbors(index: int) -> Iterator[int]:
+        # Make sure the new height is at most one more
+        max_height = cells[index] + 1
 
-        if cur == end:
-            return steps
+        return (index + o for o in offsets if cells[index + o] <= max_height)
 
-        height = heights[row][col]
-
-        for y, x in (
-            (1, 0),  # up
-            (0, 1),  # right
-            (-1, 0),  # down
-            (0, -1),  # left
-        ):
-            new_row = row + y
-            new_col = col + x
-
-            if new_row < 0 or new_row >= len(heights):
-                continue
-
-            if new_col < 0 or new_col >= len(heights[0]):
-                continue
-
-            new_height = heights[new_row][new_col]
-
-            # Don't visit again
-            if (new_row, new_col) in visited:
-                continue
-
-            # We have to be on a "z" to finish the path
-            if new_height == "E" and height != "z":
-                continue
-
-            # From start we can go anywhere. Otherwise, make sure the new height is at
-            # most one more
-            if height == "S" or ord(new_height) - ord(height) <= 1:
-                to_visit.append((new_row, new_col, steps + 1))
-                visited.add((new_row, new_col))
+    result = bfs(starts, get_neighbors, goals={end})
 
     # If we can't find a path, return a huge value
-    return sys.maxsize
-
-
-def find_min_steps_from_starting_char(starting_char: str) -> int:
-    heights = get_heights()
-    starts = find_positions_of_char(heights, starting_char)
-
-    return min(find_steps(heights, s) for s in starts)
+    return sys.maxsize if result.goal is None else result.distance
 
 
 def part_1() -> int:
-    return find_min_steps_from_starting_char("S")
-
+    heights, start, end = get_heights()
 
-print(part_1())
+    return find_steps(heights, [start], end)
 
 
 def part_2() -> int:
-    return find_min_steps_from_starting_char("a")
+    heights, _, end = get_heights()
+
+    return find_steps(heights, heights.find_all(ord("a")), end)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -70,9 +70,6 @@ def part_1() -> int:
     )
 
 
-print(part_1())
-
-
 def part_2() -> int:
     first_divider_packet = [[2]]
     second_divider_packet = [[6]]
@@ -87,4 +84,6 @@ def part_2() -> int:
     )
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -2,7 +2,7 @@ from typing import List, Tuple
 
 from more_itertools import flatten
 
-from adventofcode.utils import Line, Point, load_list
+from adventofcode.utils import Line, Point, count, load_list, timer
 
 
 def get_lines() -> List[Line]:
@@ -67,8 +67,12 @@ def format(structure: List[List[str]]) -> str:
     return "\n".join("".join(l) for l in structure)
 
 
-def simulate(include_floor: bool = False) -> int:
-    structure, bounds = create_structure(get_lines(), include_floor=include_floor)
+def pour_sand(
+    structure: List[List[str]],
+    bounds: Tuple[Point, Point],
+    include_floor: bool = False,
+) -> int:
+    """Return how many units of sand settle before it stops, filling in `structure`."""
     top_left, bottom_right = bounds
     source = Point(500, 0).relative_to(top_left)
 
@@ -107,15 +111,29 @@ def simulate(include_floor: bool = False) -> int:
             cur = source
 
 
-def part_1():
-    return simulate(include_floor=False)
+def simulate(include_floor: bool = False) -> int:
+    with timer("parse"):
+        lines = get_lines()
+
+    with timer("build"):
+        structure, bounds = create_structure(lines, include_floor=include_floor)
 
+    with timer("solve"):
+        sand_units = pour_sand(structure, bounds, include_floor=include_floor)
 
-print(part_1())
+    count("sand units", sand_units)
+
+    return sand_units
+
+
+def part_1():
+    return simulate(include_floor=False)
 
 
 def part_2():
     return simulate(include_floor=True)
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -2,11 +2,11 @@ from collections import defaultdict
 from dataclasses import dataclass
 from functools import cached_property
 from itertools import combinations, product
-from typing import Iterable, List, Tuple
+from typing import List, Tuple
 
-from more_itertools import flatten, pairwise, quantify
+from more_itertools import flatten
 
-from adventofcode.utils import Line, Point, load_list
+from adventofcode.utils import IntervalSet, Line, Point, load_list
 
 
 @dataclass
@@ -40,108 +40,58 @@ class Sensor:
         )
 
 
-def get_sensors() -> List[Sensor]:
-    halves = load_list(parser=lambda line: line.split(": "))
-
-    def get_point(token: str) -> Tuple[int, int]:
-        x, y = token.split("at ")[1].split(", ")
-
-        return Point(int(x.split("x=")[1]), int(y.split("y=")[1]))
-
-    return [
-        Sensor(get_point(raw_sensor), get_point(raw_beacon))
-        for raw_sensor, raw_beacon in halves
-    ]
+def parse_point(token: str) -> Point:
+    x, y = token.split("at ")[1].split(", ")
 
+    return Point(int(x.split("x=")[1]), int(y.split("y=")[1]))
 
-def get_invalid_lines(sensors: List[Sensor], row: int) -> List[Line]:
-    """Return the line from each sensor where a beacon cannot be."""
-    invalid_lines = []
 
-    for sensor in sensors:
-        x, y = sensor.location.as_tuple()
-
-        if row < y - sensor.distance_to_beacon or y + sensor.distance_to_beacon < row:
-            # The sensor doesn't apply to this row
-            continue
+def parse_sensor(line: str) -> Sensor:
+    raw_sensor, raw_beacon = line.split(": ")
 
-        dist_to_row = abs(y - row)
-        width = sensor.distance_to_beacon - dist_to_row
-        invalid_line = Line(Point(x - width, row), Point(x + width, row))
-        invalid_lines.append(invalid_line)
+    return Sensor(parse_point(raw_sensor), parse_point(raw_beacon))
 
-    return invalid_lines
 
+def get_sensors() -> List[Sensor]:
+    return load_list(parser=parse_sensor)
 
-def remove_full_overlaps(lines: List[Line]) -> Tuple[List[Line], List[Line]]:
-    """
-    Remove the fully overlapping lines from `lines`.
 
-    Returns non fully overlapping lines and fully overlapping lines.
-    """
-    without_full_overlaps = []
-    fully_overlapped = []
+def get_invalid_intervals(sensors: List[Sensor], row: int) -> IntervalSet:
+    """Return the x values in `row` where a beacon cannot be."""
+    intervals = []
 
-    # Sort from starting point left to right. We want the biggest endpoint to be first,
-    # so the longest line consumes any contained ones
-    lines.sort(key=lambda l: (l.start.x, -l.end.x))
+    for sensor in sensors:
+        x, y = sensor.location
+        # How far the sensor's area extends left and right in this row
+        width = sensor.distance_to_beacon - abs(y - row)
 
-    cur = lines[0]
-    index = 1
-    while index < len(lines):
-        next_ = lines[index]
-        if not (cur.start.x <= next_.start.x and cur.end.x >= next_.end.x):
-            # `cur` does not fully overlap `next_`
-            without_full_overlaps.append(cur)
-            cur = next_
-        else:
-            fully_overlapped.append(next_)
+        # The sensor doesn't apply to this row
+        if width < 0:
+            continue
 
-        index += 1
-    # Don't forget the last one. We didn't compare it to anything, so we didn't add it
-    # to any list
-    without_full_overlaps.append(cur)
+        intervals.append((x - width, x + width + 1))
 
-    return without_full_overlaps, fully_overlapped
+    # The sensor areas can overlap. The set merges them, so nothing is double counted
+    return IntervalSet(intervals)
 
 
-def part_1(row: int) -> int:
+def part_1(row: int = 2000000) -> int:
     sensors = get_sensors()
-    invalid_lines = get_invalid_lines(sensors, row)
-    not_fully_overlapped, fully_overlapped = remove_full_overlaps(invalid_lines)
-
-    # This contains duplicates, since the sensor areas can overlap. We'll need to remove
-    # them
-    invalid_point_count = sum(l.point_count for l in invalid_lines)
-    overlapping_point_count = sum(
-        left.find_overlapping_point_count(right)
-        for left, right in pairwise(not_fully_overlapped)
-    )
-    fully_overlapped_point_count = sum(l.point_count for l in fully_overlapped)
-
-    def count_contained_in_lines(points: Iterable[Point]) -> int:
-        return quantify(
-            any(l.contains_point(p) for l in not_fully_overlapped) for p in points
-        )
-
-    sensor_point_count = count_contained_in_lines((s.location for s in sensors))
-    # Make sure to use a set so we don't double count any beacons
-    # (multiple sensors can have the same closest beacon)
-    beacon_point_count = count_contained_in_lines({s.closest_beacon for s in sensors})
-
-    return (
-        invalid_point_count
-        - fully_overlapped_point_count
-        - overlapping_point_count
-        - sensor_point_count
-        - beacon_point_count
-    )
-
+    invalid = get_invalid_intervals(sensors, row)
+
+    # Don't count the sensors and beacons themselves. Make sure to use a set so we
+    # don't double count any beacons (multiple sensors can have the same closest
+    # beacon)
+    occupied = {
+        p.x
+        for p in (*(s.location for s in sensors), *(s.closest_beacon for s in sensors))
+        if p.y == row
+    }
 
-print(part_1(row=2000000))
+    return invalid.total_length - sum(x in invalid for x in occupied)
 
 
-def part_2(bound: int) -> int:
+def part_2(bound: int = 4000000) -> int:
     sensors = get_sensors()
     perimiter_lines = list(flatten(s.perimiter for s in sensors))
     # Find all the places where two sensor perimiters overlap
@@ -197,4 +147,6 @@ def part_2(bound: int) -> int:
             return 4000000 * beacon.x + beacon.y
 
 
-print(part_2(4000000))
+if __name__ == "__main__":
+    print(part_1(row=2000000))
+    print(part_2(4000000))
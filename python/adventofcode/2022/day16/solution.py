@@ -7,7 +7,7 @@ from typing import Dict, List, Set, Tuple
 
 from more_itertools import quantify
 
-from adventofcode.utils import load_list
+from adventofcode.utils import LRUCache, load_list
 
 
 @dataclass
@@ -22,6 +22,11 @@ class Volcano:
     def get_neighbors(self, name: str) -> Set[Valve]:
         return self.graph[name]
 
+    @cached_property
+    def bits(self) -> Dict[str, int]:
+        """Map each valve to its bit, so a set of valves can be stored as an int."""
+        return {name: 1 << i for i, name in enumerate(self.valves)}
+
     @cached_property
     def count_of_valves_with_positive_flow(self) -> int:
         return quantify(v.flow_rate > 0 for v in self.valves.values())
@@ -65,16 +70,21 @@ def get_volcano() -> Volcano:
 
 def simulate(
     volcano: Volcano,
-    valves_opened: Set[str],
+    valves_opened: int,
     minutes_remaining: int,
     pressure_released: int,
-    cache: Dict[Tuple[int, str], int],
+    cache: LRUCache[Tuple[int, int, str], int],
     pos: str,
 ) -> int:
+    """
+    Return the most pressure that can be released from `pos`.
+
+    `valves_opened` has the bits (see `Volcano.bits`) of the valves that are open.
+    """
     # If we ran out of time or we opened all the valves that have flow, we're done
     if (
         minutes_remaining <= 0
-        or len(valves_opened) == volcano.count_of_valves_with_positive_flow
+        or valves_opened.bit_count() == volcano.count_of_valves_with_positive_flow
     ):
         return pressure_released
 
@@ -83,13 +93,13 @@ def simulate(
 
     # If we've been here with the same amount of time remaining and valves open, we'll
     # only continue if we're the path that has the most pressure released
-    key = ("-".join(sorted(valves_opened)), minutes_remaining, pos)
+    key = (valves_opened, minutes_remaining, pos)
     cached_result = cache.get(key, -1)
     if cached_result >= pressure_released:
         return cached_result
 
     def next_step(
-        valves_opened: Set[str], minutes_remaining: int, pressure_released: int
+        valves_opened: int, minutes_remaining: int, pressure_released: int
     ) -> int:
         return max(
             simulate(
@@ -108,19 +118,19 @@ def simulate(
     # the difference between opening it and not. Sometimes, it's better to wait to open
     # it since it takes a minute to do so.
     valve = volcano.get_valve(pos)
+    bit = volcano.bits[pos]
     max_pressure_release_open = -1
-    if pos not in valves_opened and valve.flow_rate > 0:
+    if not valves_opened & bit and valve.flow_rate > 0:
         max_pressure_release_open = next_step(
             # Make sure to include the valve we just opened
-            valves_opened={*valves_opened, pos},
+            valves_opened=valves_opened | bit,
             # It takes a minute to open the valve
             minutes_remaining=minutes_remaining - 1,
             # Add the cumulative pressure released from this valve
             pressure_released=pressure_released + valve.flow_rate * minutes_remaining,
         )
     max_pressure_release_closed = next_step(
-        # Make a copy; paths shouldn't interfere with each other
-        valves_opened=set(valves_opened),
+        valves_opened=valves_opened,
         minutes_remaining=minutes_remaining,
         pressure_released=pressure_released,
     )
@@ -133,12 +143,13 @@ def simulate(
 def part_1() -> int:
     return simulate(
         volcano=get_volcano(),
-        valves_opened=set(),
+        valves_opened=0,
         minutes_remaining=30,
         pressure_released=0,
-        cache={},
+        cache=LRUCache(name=f"{__name__}.simulate"),
         pos="AA",
     )
 
 
-print(part_1())
+if __name__ == "__main__":
+    print(part_1())
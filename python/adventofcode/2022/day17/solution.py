@@ -1,8 +1,14 @@
-from itertools import cycle
+from itertools import count, islice
 from pathlib import Path
-from typing import Iterable, Set
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
-from adventofcode.utils import Line, Point, load_input
+from adventofcode.utils import (
+    Line,
+    Point,
+    find_cycle,
+    load_input,
+    translate_points,
+)
 
 
 def get_horizontal_line(height: int) -> Set[Point]:
@@ -37,8 +43,9 @@ def get_square(height: int) -> Set[Point]:
     )
 
 
-def move(points: Iterable[Point], x: int = 0, y: int = 0) -> Set[Point]:
-    return {p.translate(x=x, y=y) for p in points}
+def move(points: Iterable[Point], x: int = 0, y: int = 0) -> List[Point]:
+    # A rock is only a handful of points, so a list is cheaper to build than a set
+    return translate_points(points, x=x, y=y)
 
 
 def draw(points: Set[Point], width: int, height: int) -> str:
@@ -51,39 +58,96 @@ def draw(points: Set[Point], width: int, height: int) -> str:
         file.write("\n".join("".join(l) for l in grid))
 
 
-def part_1(width: int, rock_count: int) -> int:
+SHAPE_FACTORIES = (
+    get_horizontal_line,
+    get_cross,
+    get_backwards_l,
+    get_vertical_line,
+    get_square,
+)
+
+# The next shape, the next jet, and which cells a rock could reach in each row from
+# the top of the tower down, as bits
+Fingerprint = Tuple[int, int, Tuple[int, ...]]
+
+
+def get_reachable(rows: List[int], width: int) -> Tuple[int, ...]:
+    """
+    Return which empty cells can be reached from above the tower in each row, from
+    the top down, stopping at the first row none can be reached in.
+
+    Each row is a bit mask of the cells with rock in them. Rocks only move sideways
+    and down, so every cell next to these is either rock or a wall.
+    """
+    full = (1 << width) - 1
+    reachable = []
+    # Every cell above the tower can be reached
+    above = full
+
+    for row in reversed(rows):
+        empty = full & ~row
+        cells = above & empty
+
+        # Spread sideways through the empty cells until there's nowhere new to go
+        while True:
+            spread = (cells | (cells << 1) | (cells >> 1)) & empty
+            if spread == cells:
+                break
+            cells = spread
+
+        if not cells:
+            break
+
+        reachable.append(cells)
+        above = cells
+
+    return tuple(reachable)
+
+
+def drop_rocks(
+    jets: str, width: int = 7, fingerprint: bool = True
+) -> Iterator[Tuple[Optional[Fingerprint], int]]:
+    """
+    Drop rocks forever.
+
+    Yield a fingerprint of the chamber before each rock and how much taller the rock
+    made the tower. Rocks can only ever be in the empty cells reachable from above
+    the tower, so those cells are all that affects what happens next. If
+    `fingerprint` is False, we don't need to find them, so yield None instead.
+    """
     all_points = set()
-    jets = cycle(load_input())
-    shape_factories = cycle(
-        iter(
-            (
-                get_horizontal_line,
-                get_cross,
-                get_backwards_l,
-                get_vertical_line,
-                get_square,
-            )
-        )
-    )
+    # Which cells have rock in them in each row, as bits
+    rows: List[int] = []
+    # The height of the highest rock in each column
+    column_heights = [0] * width
     height = 0
+    jet_index = 0
+
+    for rock_index in count():
+        shape_index = rock_index % len(SHAPE_FACTORIES)
+        state = (
+            (shape_index, jet_index, get_reachable(rows, width))
+            if fingerprint
+            else None
+        )
 
-    for _ in range(rock_count):
-        cur_points = next(shape_factories)(height + 3)
+        cur_points = SHAPE_FACTORIES[shape_index](height + 3)
         while True:
-            jet = next(jets)
+            jet = jets[jet_index]
+            jet_index = (jet_index + 1) % len(jets)
             # Move according to the jet
             next_points = move(cur_points, x=-1 if jet == "<" else 1)
 
-            if all(
-                0 <= p.x < width for p in next_points
-            ) and not all_points.intersection(next_points):
+            if all(0 <= p.x < width for p in next_points) and all_points.isdisjoint(
+                next_points
+            ):
                 cur_points = next_points
 
             # Move down
             next_points = move(cur_points, y=-1)
 
             # We couldn't move down. Add the rock's points to the settled points
-            if any(p.y <= 0 for p in cur_points) or all_points.intersection(
+            if any(p.y <= 0 for p in cur_points) or not all_points.isdisjoint(
                 next_points
             ):
                 all_points.update(cur_points)
@@ -92,9 +156,35 @@ def part_1(width: int, rock_count: int) -> int:
             # Otherwise we could move down. Just keep going
             cur_points = next_points
 
-        height = max(height, max(p.y + 1 for p in cur_points))
+        for p in cur_points:
+            column_heights[p.x] = max(column_heights[p.x], p.y + 1)
+
+            while len(rows) <= p.y:
+                rows.append(0)
+            rows[p.y] |= 1 << p.x
+
+        new_height = max(height, max(column_heights))
+        yield state, new_height - height
+        height = new_height
+
+
+def part_1(width: int = 7, rock_count: int = 2022) -> int:
+    rocks = drop_rocks(load_input(), width=width, fingerprint=False)
+
+    return sum(growth for _, growth in islice(rocks, rock_count))
+
+
+def part_2(width: int = 7, rock_count: int = 1_000_000_000_000) -> int:
+    # The jets and shapes repeat, so eventually the tower does too
+    cycle = find_cycle(drop_rocks(load_input(), width=width), limit=rock_count)
+
+    # The rocks ran out before the tower repeated, so we dropped them all anyway
+    if cycle is None:
+        return part_1(width=width, rock_count=rock_count)
 
-    return height
+    return cycle.total(rock_count)
 
 
-print(part_1(width=7, rock_count=2022))
+if __name__ == "__main__":
+    print(part_1(width=7, rock_count=2022))
+    print(part_2(width=7, rock_count=1_000_000_000_000))
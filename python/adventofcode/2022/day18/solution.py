@@ -40,4 +40,5 @@ def part_1() -> int:
     return get_surface_area()
 
 
-print(part_1())
+if __name__ == "__main__":
+    print(part_1())
@@ -73,9 +73,6 @@ def part_1() -> int:
     return get_root(raise_for_human=False).get_value()
 
 
-print(part_1())
-
-
 def part_2() -> int:
     cur = get_root(raise_for_human=True)
 
@@ -119,4 +116,6 @@ def part_2() -> int:
     return result
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -3,8 +3,6 @@ from collections import defaultdict, deque
 from pathlib import Path
 from typing import Deque, Final, Iterable, Set, Tuple
 
-from more_itertools import collapse
-
 from adventofcode.utils import Line, Point, load_list
 
 
@@ -33,10 +31,10 @@ class Mover(ABC):
 
     @classmethod
     def move(cls, elves: Set[Point], elf: Point) -> Point:
-        if any(elf.translate(*n.as_tuple()) in elves for n in cls.get_neighbors()):
+        if any(p in elves for p in elf.translate_all(cls.get_neighbors())):
             return elf
 
-        return elf.translate(*cls.get_direction().as_tuple())
+        return elf.translate(*cls.get_direction())
 
 
 class NorthMover(Mover):
@@ -134,7 +132,7 @@ def tick(elves: Set[Point], movers: Deque[Mover]) -> Tuple[Set[Point], bool]:
     new_to_old = defaultdict(set)
     for elf in elves:
         # If there are no neighbors, we don't do anything
-        if all(elf.translate(*n.as_tuple()) not in elves for n in DIRECTIONS.values()):
+        if all(p not in elves for p in elf.neighbors):
             new_to_old[elf].add(elf)
             continue
 
@@ -142,12 +140,14 @@ def tick(elves: Set[Point], movers: Deque[Mover]) -> Tuple[Set[Point], bool]:
 
     # If only one elf moved somewhere, keep the new spot. Otherwise, keep all of the
     # old spots, i.e. no elves that would have moved to that spot can move
-    elves = set(
-        collapse(
-            new if len(old_positions) == 1 else old_positions
-            for new, old_positions in new_to_old.items()
-        )
-    )
+    elves = set()
+    for new, old_positions in new_to_old.items():
+        # Points are tuples, so don't flatten them with the groups of old spots
+        if len(old_positions) == 1:
+            elves.add(new)
+        else:
+            elves.update(old_positions)
+
     elf_moved = any(
         len(old_positions) == 1 and new != next(iter(old_positions))
         for new, old_positions in new_to_old.items()
@@ -204,11 +204,10 @@ def part_1() -> int:
     return get_empty_tile_count(simulate(get_elves(), rounds=10))
 
 
-print(part_1())
-
-
 def part_2() -> int:
     return simulate_until_done(get_elves())
 
 
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
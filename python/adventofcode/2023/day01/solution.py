@@ -1,6 +1,6 @@
 from typing import Callable, Final, Optional
 
-from adventofcode.utils import load_input
+from adventofcode.utils import iter_lines
 
 DIGITS: Final = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
 
@@ -56,7 +56,7 @@ def get_number(line: str, match: MatchT) -> int:
 
 
 def sum_numbers(match: MatchT) -> int:
-    return sum(get_number(l, match) for l in load_input().splitlines())
+    return sum(get_number(l, match) for l in iter_lines())
 
 
 def part_1() -> int:
@@ -67,5 +67,6 @@ def part_2() -> int:
     return sum_numbers(lambda *args: get_digit(*args) or get_written_digit(*args))
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -69,5 +69,6 @@ def part_2() -> int:
     return sum(game.get_minimum_cube_counts().power for game in get_games())
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -114,5 +114,6 @@ def part_2() -> int:
     return sum(reduce(lambda a, b: a.value * b.value, g) for g in gears)
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
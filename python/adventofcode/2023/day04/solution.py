@@ -67,5 +67,6 @@ def part_2() -> int:
     return sum(copies)
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
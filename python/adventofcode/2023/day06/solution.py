@@ -82,5 +82,6 @@ def part_2() -> int:
     return get_multiplied_ways_to_win(parser=lambda v: [v.replace(" ", "")])
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
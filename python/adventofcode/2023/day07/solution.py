@@ -174,5 +174,6 @@ def part_2() -> int:
     return get_winnings(WildHand)
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -95,5 +95,6 @@ def part_2() -> int:
     return reduce(lcm, path_lengths)
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
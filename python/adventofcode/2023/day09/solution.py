@@ -49,5 +49,6 @@ def part_2() -> int:
     return sum_predictions(get_prediction_left)
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -1,7 +1,6 @@
-from collections import deque
-from typing import Final
+from typing import Final, Iterable
 
-from adventofcode.utils import Direction, Point, get_area, load_list
+from adventofcode.utils import Direction, Point, bfs, get_area, load_list
 
 PIPE_TO_DIRECTIONS: Final = {
     "|": {Direction.UP, Direction.DOWN},
@@ -30,14 +29,14 @@ def find_starting_neighbors(grid: list[list[str]], start: Point) -> list[Point]:
     starting_neighbors = []
 
     for direction in Direction:
-        neighbor_position = start.translate(*direction.value.as_tuple())
+        neighbor_position = start.translate(*direction.value)
         neighbor_pipe = grid[neighbor_position.y][neighbor_position.x]
 
         if neighbor_pipe == ".":
             continue
 
         if any(
-            neighbor_position.translate(*d.value.as_tuple()) == start
+            neighbor_position.translate(*d.value) == start
             for d in PIPE_TO_DIRECTIONS[neighbor_pipe]
         ):
             starting_neighbors.append(neighbor_position)
@@ -51,28 +50,16 @@ def get_distance_to_farthest_loop_point() -> int:
     start = find_start(grid)
     starting_neighbors = find_starting_neighbors(grid, start)
 
-    max_distance = 0
-    seen = {start}
-    to_process = deque(((1, n) for n in starting_neighbors))
+    def get_neighbors(point: Point) -> Iterable[Point]:
+        # We don't know what pipe is under the start
+        if point == start:
+            return starting_neighbors
 
-    while to_process:
-        distance, point = to_process.popleft()
-
-        if point in seen:
-            continue
-
-        seen.add(point)
-
-        max_distance = max(distance, max_distance)
-        new_distance = distance + 1
         pipe = grid[point.y][point.x]
+        return (point.translate(*d.value) for d in PIPE_TO_DIRECTIONS[pipe])
 
-        to_process.extend(
-            (new_distance, point.translate(*d.value.as_tuple()))
-            for d in PIPE_TO_DIRECTIONS[pipe]
-        )
-
-    return max_distance
+    # Going both ways around the loop at once, the farthest point is reached last
+    return max(bfs([start], get_neighbors).distances.values())
 
 
 def part_1() -> int:
@@ -94,9 +81,7 @@ def get_perimeter() -> list[Point]:
             perimeter.append(current)
 
         pipe = grid[current.y][current.x]
-        new_points = (
-            current.translate(*d.value.as_tuple()) for d in PIPE_TO_DIRECTIONS[pipe]
-        )
+        new_points = (current.translate(*d.value) for d in PIPE_TO_DIRECTIONS[pipe])
         # Make sure we don't go backwards
         last, current = current, next(p for p in new_points if p != last)
 
@@ -107,5 +92,6 @@ def part_2() -> int:
     return get_area(get_perimeter())
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -1,78 +1,53 @@
-from itertools import combinations
+from bisect import bisect_left
+from typing import Final
 
-from adventofcode.utils import Point, load_list
+from adventofcode.utils import ByteGrid, Point, load_grid_bytes
 
+GALAXY: Final = ord("#")
 
-def get_grid() -> list[list[str]]:
-    return load_list(parser=list)
 
+def get_galaxy_locations(grid: ByteGrid) -> list[Point]:
+    return [Point(x, y) for x, y in grid.find_all(b"#")]
 
-def get_galaxy_locations(grid: list[list[str]]) -> list[Point]:
-    locations = []
 
-    for row_index, row in enumerate(grid):
-        for col_index, value in enumerate(row):
-            if value == "#":
-                locations.append(Point(col_index, row_index))
+def get_empty_rows(grid: ByteGrid) -> list[int]:
+    # Scan the bytes in place rather than creating a string per cell
+    return [y for y in range(grid.height) if GALAXY not in grid.row(y)]
 
-    return locations
 
+def get_empty_cols(grid: ByteGrid) -> list[int]:
+    return [x for x in range(grid.width) if GALAXY not in grid.column(x)]
 
-def get_empty_rows(grid: list[list[str]]) -> list[int]:
-    empty_rows = []
 
-    for row_index, row in enumerate(grid):
-        if all(v == "." for v in row):
-            empty_rows.append(row_index)
+def expand(
+    coordinates: list[int], empty: list[int], expansion_factor: int
+) -> list[int]:
+    # Each empty row (or column) before a galaxy pushes it out. Galaxies are never in
+    # an empty one, so this is the same as counting the ones between two galaxies.
+    return [c + bisect_left(empty, c) * (expansion_factor - 1) for c in coordinates]
 
-    return empty_rows
 
+def sum_pair_distances(coordinates: list[int]) -> int:
+    """Return the sum of the distances between every pair of `coordinates`."""
+    count = len(coordinates)
 
-def get_empty_cols(grid: list[list[str]]) -> list[int]:
-    empty_cols = []
-
-    for col_index, _ in enumerate(grid[0]):
-        if all(row[col_index] == "." for row in grid):
-            empty_cols.append(col_index)
-
-    return empty_cols
-
-
-def get_distance(
-    a: Point,
-    b: Point,
-    empty_rows: list[int],
-    empty_cols: list[int],
-    expansion_factor: int,
-) -> int:
-    expansion_distance = expansion_factor - 1
-    # The distance is just how many times we need to go left/right and up/down
-    distance = abs(a.y - b.y) + abs(a.x - b.x)
-
-    # If an empty row comes between the two galaxies we're considering, add the
-    # expansion factor
-    for row in empty_rows:
-        if min(a.y, b.y) < row < max(a.y, b.y):
-            distance += expansion_distance
-
-    for col in empty_cols:
-        if min(a.x, b.x) < col < max(a.x, b.x):
-            distance += expansion_distance
-
-    return distance
+    # Once they're sorted, each coordinate is the larger one in its pairs with the
+    # coordinates before it, and the smaller one in its pairs with those after it
+    return sum(c * (2 * i - count + 1) for i, c in enumerate(sorted(coordinates)))
 
 
 def sum_galaxy_pair_distances(expansion_factor: int) -> int:
-    grid = get_grid()
-    galaxy_locations = get_galaxy_locations(grid)
-    empty_rows = get_empty_rows(grid)
-    empty_cols = get_empty_cols(grid)
+    with load_grid_bytes() as grid:
+        galaxy_locations = get_galaxy_locations(grid)
+        empty_rows = get_empty_rows(grid)
+        empty_cols = get_empty_cols(grid)
+
+    # The distance is just how many times we need to go left/right and up/down, so
+    # we can sum the pairs on each axis separately rather than looking at every pair
+    xs = expand([g.x for g in galaxy_locations], empty_cols, expansion_factor)
+    ys = expand([g.y for g in galaxy_locations], empty_rows, expansion_factor)
 
-    # Sum the distances for every pair of galaxies
-    return sum(
-        get_distance(*c, empty_rows, empty_cols, expansion_factor)
-        for c in combinations(galaxy_locations, 2)
-    )
+    return sum_pair_distances(xs) + sum_pair_distances(ys)
 
 
 def part_1() -> int:
@@ -83,5 +58,6 @@ def part_2() -> int:
     return sum_galaxy_pair_distances(expansion_factor=1_000_000)
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from functools import cache
 
-from adventofcode.utils import load_list
+from adventofcode.utils import load_list, memoize
 
 
-@cache
+def get_arrangements_key(
+    springs: str, contiguous_group_counts: tuple[int, ...], in_dots=True
+) -> tuple[int, str, int, int, bool]:
+    """
+    Return a small key for `get_arrangements` that's unique while solving one row.
+
+    The springs are always one spring followed by the end of the row's springs, and
+    the counts are always a (possibly reduced) count followed by the end of the row's
+    counts. So the lengths and the first items are all that can differ.
+    """
+    return (
+        len(springs),
+        springs[0],
+        len(contiguous_group_counts),
+        contiguous_group_counts[0] if contiguous_group_counts else -1,
+        in_dots,
+    )
+
+
+@memoize(key=get_arrangements_key)
 def get_arrangements(
     springs: str, contiguous_group_counts: tuple[int, ...], in_dots=True
 ) -> int:
@@ -55,11 +73,11 @@ def get_arrangements(
             return get_arrangements(
                 f"#{springs[index:]}",
                 contiguous_group_counts,
-                in_dots=in_dots,
+                in_dots,
             ) + get_arrangements(
                 f".{springs[index:]}",
                 contiguous_group_counts,
-                in_dots=in_dots,
+                in_dots,
             )
 
         else:
@@ -96,7 +114,9 @@ class Row:
         )
 
     def get_arrangements(self) -> int:
-        return get_arrangements(self.springs, self.contiguous_group_counts)
+        # Keys are only unique within a row, which also keeps the cache small
+        with get_arrangements.scope():
+            return get_arrangements(self.springs, self.contiguous_group_counts)
 
 
 def part_1() -> int:
@@ -111,5 +131,6 @@ def part_2() -> int:
     return sum(r.unfold(5).get_arrangements() for r in rows)
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
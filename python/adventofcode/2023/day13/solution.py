@@ -120,5 +120,6 @@ def part_2() -> int:
     return summarize(tolerance=1)
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -88,5 +88,6 @@ def part_2() -> int:
     return sum(b.focusing_power for b in boxes)
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
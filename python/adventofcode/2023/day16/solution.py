@@ -1,23 +1,29 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections import defaultdict, deque
-from dataclasses import dataclass
+from collections.abc import Iterable
+from typing import NamedTuple
 
-from adventofcode.utils import Direction, Point, is_valid_point, load_list
+from adventofcode.utils import (
+    Direction,
+    Point,
+    bfs,
+    count,
+    is_valid_point,
+    load_list,
+    timer,
+)
 
 
-@dataclass
-class Beam:
+class Beam(NamedTuple):
 
+    # A tuple, so beams are cheap to hash as nodes in the search
     position: Point
     direction: Direction
 
     def tick(self) -> Beam:
         """Return a new beam after moving one step."""
-        return Beam(
-            self.position.translate(*self.direction.value.as_tuple()), self.direction
-        )
+        return Beam(self.position.translate(*self.direction.value), self.direction)
 
 
 class Device(ABC):
@@ -41,8 +47,7 @@ class Device(ABC):
         raise ValueError(f"Unknown device `{value}`")
 
     @abstractmethod
-    def process(self, beam: Beam) -> list[Beam]:
-        ...
+    def process(self, beam: Beam) -> list[Beam]: ...
 
 
 class EmptySpace(Device):
@@ -111,63 +116,64 @@ class HorizontalSplitter(Device):
         raise ValueError(f"Unknown direction {beam.direction}")
 
 
-def get_devices() -> list[list[Device]]:
-    return [[Device.parse(value) for _, value in enumerate(row)] for row in load_list()]
+def parse_row(row: str) -> list[Device]:
+    return [Device.parse(value) for value in row]
 
 
-def process_light(
-    devices: list[list[Device]], starting_beam: Beam
-) -> dict[Point, set[Direction]]:
-    to_process = deque([starting_beam])
-    seen: dict[Point, set[Direction]] = defaultdict(set)
+def get_devices() -> list[list[Device]]:
+    return load_list(parser=parse_row)
 
-    while to_process:
-        beam = to_process.popleft()
 
-        if (
-            # We're outside of the grid
-            not is_valid_point(*beam.position.as_tuple(), devices)
-            # There's already a beam at this position *moving in the same direction*.
-            # We can't just check that there's a beam here already, if they're moving
-            # in different directions, they'll likely have different outcomes.
-            or beam.direction in seen[beam.position]
-        ):
-            continue
+def process_light(devices: list[list[Device]], starting_beam: Beam) -> Iterable[Beam]:
+    """Return every beam of light, i.e. each position and direction light passes."""
 
+    def get_neighbors(beam: Beam) -> Iterable[Beam]:
         device = devices[beam.position.y][beam.position.x]
 
-        to_process.extend(device.process(beam))
-        seen[beam.position].add(beam.direction)
+        # Light that leaves the grid is gone
+        return (b for b in device.process(beam) if is_valid_point(*b.position, devices))
 
-    return seen
+    # If there's already a beam at a position *moving in the same direction*, it'll
+    # have the same outcome, so the search only visits it once. We can't just check
+    # that there's a beam at the position already, if they're moving in different
+    # directions, they'll likely have different outcomes.
+    beams = bfs([starting_beam], get_neighbors).distances
+    count("beams", len(beams))
+
+    return beams.keys()
 
 
 def get_energized_tile_count(devices: list[list[Device]], starting_beam: Beam) -> int:
     # The number of tiles that have at least one beam moving in any direction
-    return len(process_light(devices, starting_beam).values())
+    return len({beam.position for beam in process_light(devices, starting_beam)})
 
 
 def part_1() -> int:
-    devices = get_devices()
+    with timer("parse"):
+        devices = get_devices()
 
-    return get_energized_tile_count(
-        devices, starting_beam=Beam(Point(0, 0), Direction.RIGHT)
-    )
+    with timer("solve"):
+        return get_energized_tile_count(
+            devices, starting_beam=Beam(Point(0, 0), Direction.RIGHT)
+        )
 
 
 def part_2() -> int:
-    devices = get_devices()
+    with timer("parse"):
+        devices = get_devices()
 
     from_left = (Beam(Point(0, y), Direction.RIGHT) for y, _ in enumerate(devices))
     from_right = (Beam(Point(0, y), Direction.LEFT) for y, _ in enumerate(devices))
     from_top = (Beam(Point(x, 0), Direction.DOWN) for x, _ in enumerate(devices[0]))
     from_bottom = (Beam(Point(x, 0), Direction.UP) for x, _ in enumerate(devices[0]))
 
-    return max(
-        get_energized_tile_count(devices, starting_beam)
-        for starting_beam in (*from_left, *from_right, *from_top, *from_bottom)
-    )
+    with timer("solve"):
+        return max(
+            get_energized_tile_count(devices, starting_beam)
+            for starting_beam in (*from_left, *from_right, *from_top, *from_bottom)
+        )
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -83,5 +83,6 @@ def part_2() -> int:
     return get_area_from_instructions(i.decode() for i in get_instructions())
 
 
-print(part_1())
-print(part_2())
+if __name__ == "__main__":
+    print(part_1())
+    print(part_2())
@@ -57,5 +57,7 @@ def part2() -> int:
 
     return password
 
-print(part1())
-print(part2())
+
+if __name__ == "__main__":
+    print(part1())
+    print(part2())
@@ -75,5 +75,7 @@ def part2() -> int:
 
     return sum(invalid)
 
-print(part1())
-print(part2())
+
+if __name__ == "__main__":
+    print(part1())
+    print(part2())
@@ -44,5 +44,6 @@ def part2() -> int:
     return solve(length=12)
 
 
-print(part1())
-print(part2())
+if __name__ == "__main__":
+    print(part1())
+    print(part2())
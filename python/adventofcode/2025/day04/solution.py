@@ -1,38 +1,29 @@
-from adventofcode.utils import load_input, Point, is_valid_point
+from adventofcode.utils import Grid, load_grid
 
-def get_accessible_rolls(grid: list[list[str]]) -> set[Point]:
-    can_be_accessed = set()
+def get_grid() -> Grid:
+    # 1 for a roll and 0 for empty space, so counting neighbors is just a sum. Nothing
+    # outside the grid is a roll
+    return load_grid(parser=lambda c: int(c == '@'), border=0)
 
-    for y, row in enumerate(grid):
-        for x, col in enumerate(row):
-            point = Point(x, y)
+def get_accessible_rolls(grid: Grid) -> list[int]:
+    cells = grid.cells
+    offsets = grid.neighbor_offsets
 
-            if col == '.':
-                continue
+    return [
+        index
+        for index in grid.indices
+        if cells[index] and sum(cells[index + o] for o in offsets) < 4
+    ]
 
-            count = 0
-            for neighbor in point.neighbors:
-                if not is_valid_point(*neighbor.as_tuple(), grid):
-                    continue
-
-                if grid[neighbor.y][neighbor.x] == '@':
-                    count += 1
-
-            if count < 4:
-                can_be_accessed.add(point)
-
-    return can_be_accessed
-
-def remove_rolls(grid: list[list[str]], accessible: set[Point]) -> None:
+def remove_rolls(grid: Grid, accessible: list[int]) -> None:
     for roll in accessible:
-        grid[roll.y][roll.x] = '.'
+        grid[roll] = 0
 
 def part1():
-    grid = [list(r) for r in load_input().splitlines()]
-    return len(get_accessible_rolls(grid))
+    return len(get_accessible_rolls(get_grid()))
 
 def part2():
-    grid = [list(r) for r in load_input().splitlines()]
+    grid = get_grid()
     removed = 0
 
     while accessible_rolls := get_accessible_rolls(grid):
@@ -42,5 +33,6 @@ def part2():
     return removed
 
 
-print(part1())
-print(part2())
+if __name__ == "__main__":
+    print(part1())
+    print(part2())
@@ -87,5 +87,6 @@ def part2() -> int:
     return sum(p.solution for p in parse_cephalopod_problems())
 
 
-print(part1())
-print(part2())
+if __name__ == "__main__":
+    print(part1())
+    print(part2())
@@ -106,5 +106,6 @@ def part2() -> int:
     return Manifold.from_input().process().timelines
 
 
-print(part1())
-print(part2())
+if __name__ == "__main__":
+    print(part1())
+    print(part2())
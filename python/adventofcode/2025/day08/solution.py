@@ -110,5 +110,7 @@ def part2() -> int:
 
     return reduce(mul, (p.x for p in pair))
 
-print(part1())
-print(part2())
+
+if __name__ == "__main__":
+    print(part1())
+    print(part2())
@@ -0,0 +1,467 @@
+"""
+Run solutions from the command line.
+
+Examples:
+    python -m adventofcode run 2022 15
+    python -m adventofcode run 2022 15 --part 2
+    python -m adventofcode run 2022 23 --part 2 --profile
+    python -m adventofcode run 2022 15 --verify
+    python -m adventofcode run 2023 11 --size 1000
+    python -m adventofcode generate 2023 11 --size 1000 --output input.txt
+    python -m adventofcode run-all 2022 --timeout 60
+    python -m adventofcode run-all --verify
+    python -m adventofcode batch 2022 16 inputs/ --workers 4
+    python -m adventofcode bench 2023 --repeat 3
+    python -m adventofcode bench --save
+    python -m adventofcode bench 2021 15 --instrument
+    python -m adventofcode complexity 2023 11
+    python -m adventofcode startup 2022 --budget 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from adventofcode.registry import Solver, get_solvers
+
+# Each command imports the modules it needs when it runs. Some of them pull in heavy
+# parts of the standard library (e.g. multiprocessing), which would otherwise slow down
+# every command, even just running a quick solution
+if TYPE_CHECKING:
+    from adventofcode.answers import AnswerStore
+
+
+def check_answer(
+    store: AnswerStore,
+    solver: Solver,
+    answer: Any,
+    input_path: Optional[Path] = None,
+) -> bool:
+    """
+    Compare a fresh `answer` to the one stored last for the same input, and store it.
+
+    Return False if they're different. In that case, the old answer is kept, since
+    it's the one we trusted so far.
+    """
+    stored = store.get_latest(solver, input_path)
+
+    if stored is not None and stored.answer != answer:
+        print(f"{solver}: expected {stored.answer!r}, got {answer!r}")
+        return False
+
+    store.put(solver, answer, input_path)
+
+    return True
+
+
+def run(args: argparse.Namespace) -> int:
+    from adventofcode.answers import AnswerStore
+    from adventofcode.utils import use_input_path
+
+    solvers = get_solvers(args.year, args.day, args.part)
+
+    if not solvers:
+        raise SystemExit(f"No solvers found for {args.year} day {args.day:02}")
+
+    # Solve a generated input instead of the real one
+    input_path = None
+    input_context = nullcontext()
+    if args.size:
+        from adventofcode import generators
+
+        input_path = generators.write_input(args.year, args.day, args.size, args.seed)
+        input_context = use_input_path(input_path)
+
+    store = AnswerStore()
+    ok = True
+
+    with input_context:
+        for solver in solvers:
+            if not args.profile and not args.memory:
+                stored = store.get(solver, input_path)
+
+                # Nothing changed since the answer was stored
+                if stored is not None and not args.verify:
+                    print(stored.answer)
+                    continue
+
+                answer = solver()
+                print(answer)
+                ok = check_answer(store, solver, answer, input_path) and ok
+                continue
+
+            from adventofcode import profiling
+
+            # Profile time and memory in separate runs, so neither skews the other
+            if args.profile:
+                answer, paths = profiling.profile_time(solver, top=args.top)
+                print(answer)
+                for path in paths:
+                    print(f"Wrote {path}")
+
+            if args.memory:
+                answer, path = profiling.profile_memory(solver, top=args.top)
+                if not args.profile:
+                    print(answer)
+                print(f"Wrote {path}")
+
+    return 0 if ok else 1
+
+
+def generate(args: argparse.Namespace) -> int:
+    from adventofcode import generators
+
+    try:
+        generator = generators.get_generator(args.year, args.day)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    text = generator.generate(args.size or generator.sizes[0], args.seed)
+
+    if args.output:
+        args.output.write_text(text)
+    else:
+        print(text)
+
+    return 0
+
+
+def run_all(args: argparse.Namespace) -> int:
+    from adventofcode import benchmark, parallel
+    from adventofcode.answers import AnswerStore
+
+    start = time.perf_counter()
+    solvers = get_solvers(args.year, args.day)
+    store = AnswerStore()
+
+    # Only run the solvers whose input or source changed since we stored their answer
+    stored = {}
+    if not args.verify:
+        stored = {s: store.get(s) for s in solvers}
+        stored = {s: a for s, a in stored.items() if a is not None}
+
+    results = parallel.run_all(
+        [s for s in solvers if s not in stored],
+        max_workers=args.workers,
+        timeout=args.timeout,
+        timings=benchmark.load_baseline(
+            args.baseline or benchmark.DEFAULT_BASELINE_PATH
+        ),
+    )
+    results_by_solver = {r.solver: r for r in results}
+    ok = all(r.ok for r in results)
+
+    for solver in solvers:
+        if solver in stored:
+            answer = str(stored[solver].answer)
+            elapsed = "stored"
+        else:
+            result = results_by_solver[solver]
+
+            if not result.ok:
+                print(f"{result.solver}: {result.error}")
+                continue
+
+            ok = check_answer(store, solver, result.answer) and ok
+            answer = str(result.answer)
+            elapsed = benchmark.format_value("median", result.elapsed)
+
+        # Put multiline answers (like text drawn on a screen) on their own lines
+        separator = "\n" if "\n" in answer else " "
+        print(f"{solver} ({elapsed}):{separator}{answer}")
+
+    elapsed = benchmark.format_value("median", time.perf_counter() - start)
+    print(f"Finished {len(solvers)} parts in {elapsed} " f"({len(stored)} were stored)")
+
+    return 0 if ok else 1
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    from adventofcode import batch
+
+    solvers = get_solvers(args.year, args.day, args.part)
+
+    if not solvers:
+        raise SystemExit(f"No solvers found for {args.year} day {args.day:02}")
+
+    ok = True
+
+    for input_path, results in batch.run_batch(
+        solvers,
+        batch.get_input_paths(args.directory),
+        max_workers=args.workers,
+        timeout=args.timeout,
+    ):
+        for result in results:
+            ok = ok and result.ok
+            # Flush so whatever reads the lines gets each one as soon as it's ready
+            print(batch.format_result(input_path, result), flush=True)
+
+    return 0 if ok else 1
+
+
+def bench(args: argparse.Namespace) -> int:
+    from adventofcode import benchmark
+    from adventofcode.utils import PARSE_CACHE_ENV_VAR
+
+    baseline = args.baseline or benchmark.DEFAULT_BASELINE_PATH
+
+    if args.parse_cache:
+        # Set in the environment so the benchmark processes inherit it
+        os.environ[PARSE_CACHE_ENV_VAR] = "1"
+
+    solvers = get_solvers(args.year, args.day, args.part)
+    results = benchmark.run_benchmarks(solvers, repeat=args.repeat, warmup=args.warmup)
+    print(benchmark.format_report(results))
+
+    if args.instrument:
+        report = benchmark.format_instrumentation(
+            {s.key: benchmark.measure_instrumentation(s) for s in solvers}
+        )
+        if report:
+            print(f"\n{report}")
+
+    if args.save:
+        benchmark.save_baseline(results, baseline)
+        return 0
+
+    regressions = benchmark.find_regressions(
+        results, benchmark.load_baseline(baseline), threshold=args.threshold
+    )
+    for regression in regressions:
+        print(regression)
+
+    # Fail so this can be used as a check
+    return 1 if regressions else 0
+
+
+def measure_complexity(args: argparse.Namespace) -> int:
+    from adventofcode import complexity
+
+    tolerance = args.tolerance
+    if tolerance is None:
+        tolerance = complexity.DEFAULT_TOLERANCE
+
+    try:
+        results = complexity.run_complexity(
+            get_solvers(args.year, args.day, args.part),
+            steps=args.steps,
+            seed=args.seed,
+            repeat=args.repeat,
+            max_time=args.max_time,
+            budget=args.budget,
+        )
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    print(complexity.format_report(results, tolerance=tolerance))
+
+    # Fail so this can be used as a check
+    return 1 if any(r.is_over_budget(tolerance) for r in results) else 0
+
+
+def measure_startup(args: argparse.Namespace) -> int:
+    from adventofcode import startup
+
+    budget = args.budget if args.budget is not None else startup.DEFAULT_BUDGET
+    results = startup.run_startup(
+        startup.get_modules(get_solvers(args.year, args.day)), repeat=args.repeat
+    )
+    print(startup.format_report(results, budget=budget, top=args.top))
+
+    # Fail so this can be used as a check
+    return 1 if any(r.cumulative > budget for r in results) else 0
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m adventofcode")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the solution for a day")
+    run_parser.add_argument("year", type=int)
+    run_parser.add_argument("day", type=int)
+    run_parser.add_argument(
+        "--part", type=int, help="Only run this part. By default, run every part"
+    )
+    run_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile with cProfile. Reports are written next to the solution",
+    )
+    run_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Trace memory allocations. Reports are written next to the solution",
+    )
+    run_parser.add_argument(
+        "--top", type=int, default=20, help="The number of entries in each report"
+    )
+    run_parser.add_argument(
+        "--size", type=int, help="Solve a generated input of this size instead"
+    )
+    run_parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Solve even if the answer is stored, and fail if it's different",
+    )
+    run_parser.add_argument(
+        "--seed", type=int, default=0, help="Seed for the generated input"
+    )
+    run_parser.set_defaults(handler=run)
+
+    generate_parser = subparsers.add_parser(
+        "generate", help="Generate an input of any size for a day"
+    )
+    generate_parser.add_argument("year", type=int)
+    generate_parser.add_argument("day", type=int)
+    generate_parser.add_argument(
+        "--size", type=int, help="Defaults to about the size of the real input"
+    )
+    generate_parser.add_argument("--seed", type=int, default=0)
+    generate_parser.add_argument(
+        "--output", type=Path, help="Write to this file instead of printing"
+    )
+    generate_parser.set_defaults(handler=generate)
+
+    run_all_parser = subparsers.add_parser(
+        "run-all", help="Run every solution in parallel"
+    )
+    run_all_parser.add_argument("year", type=int, nargs="?")
+    run_all_parser.add_argument("day", type=int, nargs="?")
+    run_all_parser.add_argument(
+        "--workers", type=int, help="Defaults to the number of CPUs"
+    )
+    run_all_parser.add_argument(
+        "--timeout", type=float, help="Seconds each part can run before it's stopped"
+    )
+    run_all_parser.add_argument(
+        "--baseline",
+        type=Path,
+        help="Benchmark baseline used to start the slowest parts first. Defaults to "
+        "benchmark_baseline.json",
+    )
+    run_all_parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Solve even if the answers are stored, and fail if any are different",
+    )
+    run_all_parser.set_defaults(handler=run_all)
+
+    batch_parser = subparsers.add_parser(
+        "batch", help="Solve every input in a directory, printing JSON lines"
+    )
+    batch_parser.add_argument("year", type=int)
+    batch_parser.add_argument("day", type=int)
+    batch_parser.add_argument("directory", type=Path)
+    batch_parser.add_argument("--part", type=int)
+    batch_parser.add_argument(
+        "--workers", type=int, help="Defaults to the number of CPUs"
+    )
+    batch_parser.add_argument(
+        "--timeout", type=float, help="Seconds each part can run before it's stopped"
+    )
+    batch_parser.set_defaults(handler=run_batch)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="Benchmark solutions and compare them to a baseline"
+    )
+    bench_parser.add_argument("year", type=int, nargs="?")
+    bench_parser.add_argument("day", type=int, nargs="?")
+    bench_parser.add_argument("--part", type=int)
+    bench_parser.add_argument(
+        "--repeat", type=int, default=5, help="Timed runs per part"
+    )
+    bench_parser.add_argument(
+        "--warmup", type=int, default=1, help="Untimed runs per part before timing"
+    )
+    bench_parser.add_argument(
+        "--baseline", type=Path, help="Defaults to benchmark_baseline.json"
+    )
+    bench_parser.add_argument(
+        "--save", action="store_true", help="Save the results as the new baseline"
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Fraction a part can get worse before it's a regression",
+    )
+    bench_parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="Cache parsed inputs on disk so runs measure solving, not parsing",
+    )
+    bench_parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help="Also show the phase times and counts each part records",
+    )
+    bench_parser.set_defaults(handler=bench)
+
+    complexity_parser = subparsers.add_parser(
+        "complexity",
+        help="Fit how solutions' run times grow on bigger and bigger generated inputs",
+    )
+    complexity_parser.add_argument("year", type=int, nargs="?")
+    complexity_parser.add_argument("day", type=int, nargs="?")
+    complexity_parser.add_argument("--part", type=int)
+    complexity_parser.add_argument(
+        "--steps", type=int, default=4, help="The number of sizes to time"
+    )
+    complexity_parser.add_argument("--seed", type=int, default=0)
+    complexity_parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per size"
+    )
+    complexity_parser.add_argument(
+        "--max-time",
+        type=float,
+        default=10,
+        help="Stop a run after this many seconds and don't try bigger sizes",
+    )
+    complexity_parser.add_argument(
+        "--budget",
+        type=float,
+        help="Fail if the exponent is bigger than this. Defaults to the generator's",
+    )
+    complexity_parser.add_argument(
+        "--tolerance",
+        type=float,
+        help="How far past the budget the exponent can be, since timings are noisy. "
+        "Defaults to 0.5",
+    )
+    complexity_parser.set_defaults(handler=measure_complexity)
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="Measure how long each solution takes to import"
+    )
+    startup_parser.add_argument("year", type=int, nargs="?")
+    startup_parser.add_argument("day", type=int, nargs="?")
+    startup_parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed imports per module"
+    )
+    startup_parser.add_argument(
+        "--budget",
+        type=float,
+        help="Fail if a module takes more seconds than this to import. Defaults to 0.1",
+    )
+    startup_parser.add_argument(
+        "--top", type=int, default=3, help="The number of slowest imports to show"
+    )
+    startup_parser.set_defaults(handler=measure_startup)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = get_parser().parse_args(argv)
+
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
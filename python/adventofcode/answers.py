@@ -0,0 +1,175 @@
+"""
+Store answers so a solver only runs again once its input or source changes.
+
+Answers are appended to a JSON lines file in the cache dir, one per line, e.g.
+
+    {"key": "2022/16/1", "input_hash": "9f86...", "source_hash": "60303...",
+     "answer": 1651}
+
+The input hash is of the file the solver reads. The source hash is of its
+`solution.py` and `utils.py`, which every solution builds on. A stored answer is only
+returned if both still match. Later lines win, so storing never rewrites the file.
+
+Answers that don't survive a round trip through JSON unchanged (e.g. tuples) aren't
+stored, so a stored answer always prints the same as a fresh one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from adventofcode import utils
+from adventofcode.registry import Solver
+from adventofcode.utils import CACHE_DIR
+
+ANSWERS_PATH = CACHE_DIR / "answers.jsonl"
+
+
+@dataclass(frozen=True)
+class StoredAnswer:
+
+    # `year/day/part`, like benchmark keys
+    key: str
+    input_hash: str
+    source_hash: str
+    answer: Any
+
+
+def _hash_files(*paths: Path) -> str:
+    digest = hashlib.sha256()
+
+    for path in paths:
+        digest.update(path.read_bytes())
+        # Separate files so moving code from one to the other changes the hash
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+class AnswerStore:
+    def __init__(self, path: Path = ANSWERS_PATH) -> None:
+        self.path = path
+        # Hashes of the files we've read so far
+        self._hashes: Dict[Tuple[Path, ...], str] = {}
+
+    @cached_property
+    def _answers(self) -> Dict[Tuple[str, str, str], StoredAnswer]:
+        answers = {}
+
+        if not self.path.exists():
+            return answers
+
+        with open(self.path, "r") as file:
+            for line in file:
+                try:
+                    stored = StoredAnswer(**json.loads(line))
+                except (json.JSONDecodeError, TypeError):
+                    # Skip a line left incomplete by a run that was killed
+                    continue
+
+                self._add(answers, stored)
+
+        return answers
+
+    @staticmethod
+    def _add(
+        answers: Dict[Tuple[str, str, str], StoredAnswer], stored: StoredAnswer
+    ) -> None:
+        key = (stored.key, stored.input_hash, stored.source_hash)
+        # Remove it first so it moves to the end. That way the answers stay ordered
+        # by when they were last stored
+        answers.pop(key, None)
+        answers[key] = stored
+
+    def _hash(self, *paths: Path) -> str:
+        if paths not in self._hashes:
+            self._hashes[paths] = _hash_files(*paths)
+
+        return self._hashes[paths]
+
+    def get_input_hash(self, solver: Solver, input_path: Optional[Path] = None) -> str:
+        return self._hash(input_path or solver.input_path)
+
+    def get_source_hash(self, solver: Solver) -> str:
+        return self._hash(solver.directory / "solution.py", Path(utils.__file__))
+
+    def get(
+        self, solver: Solver, input_path: Optional[Path] = None
+    ) -> Optional[StoredAnswer]:
+        """
+        Return the answer stored for `solver` on its current input and source.
+
+        `input_path` is the input the solver reads, if it isn't its `input.txt`.
+        """
+        try:
+            input_hash = self.get_input_hash(solver, input_path)
+        except FileNotFoundError:
+            return None
+
+        return self._answers.get((solver.key, input_hash, self.get_source_hash(solver)))
+
+    def get_latest(
+        self, solver: Solver, input_path: Optional[Path] = None
+    ) -> Optional[StoredAnswer]:
+        """
+        Return the answer stored last for `solver` on its current input, whatever
+        source it came from.
+
+        This is what a changed solution should still get, e.g. after a refactor.
+        """
+        try:
+            input_hash = self.get_input_hash(solver, input_path)
+        except FileNotFoundError:
+            return None
+
+        key = solver.key
+        latest = None
+
+        for stored in self._answers.values():
+            if stored.key == key and stored.input_hash == input_hash:
+                latest = stored
+
+        return latest
+
+    def put(
+        self, solver: Solver, answer: Any, input_path: Optional[Path] = None
+    ) -> bool:
+        """Store `answer`, returning whether it could be."""
+        try:
+            line = json.dumps(
+                asdict(
+                    StoredAnswer(
+                        solver.key,
+                        self.get_input_hash(solver, input_path),
+                        self.get_source_hash(solver),
+                        answer,
+                    )
+                )
+            )
+        except TypeError:
+            return False
+
+        # A tuple would come back as a list, for example
+        stored = StoredAnswer(**json.loads(line))
+        if stored.answer != answer or type(stored.answer) is not type(answer):
+            return False
+
+        # Already stored, e.g. when verifying
+        if (
+            self._answers.get((stored.key, stored.input_hash, stored.source_hash))
+            == stored
+        ):
+            return True
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as file:
+            file.write(f"{line}\n")
+
+        self._add(self._answers, stored)
+
+        return True
@@ -0,0 +1,75 @@
+"""
+Solve a directory of inputs for one day, e.g. one input per account.
+
+Starting an interpreter per input means importing the solution (and everything it
+imports) every time. Instead, each worker process imports it once and then solves one
+input after another, given as strings rather than found next to the solution.
+
+Results are streamed as JSON lines as each input finishes, one line per part, e.g.
+
+    {"input": "alice.txt", "part": 1, "answer": 1651, "elapsed": 0.012, "error": null}
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from adventofcode.parallel import Result, run_solver
+from adventofcode.registry import Solver
+from adventofcode.utils import use_input
+
+
+def get_input_paths(directory: Path) -> List[Path]:
+    # Skip hidden files, like .DS_Store
+    return sorted(
+        p for p in directory.iterdir() if p.is_file() and not p.name.startswith(".")
+    )
+
+
+def solve_input(
+    solvers: List[Solver], input_path: Path, timeout: Optional[float] = None
+) -> List[Result]:
+    """Solve the input in `input_path` with each of `solvers`, in this process."""
+    with use_input(input_path.read_text()):
+        return [run_solver(s, timeout) for s in solvers]
+
+
+def run_batch(
+    solvers: List[Solver],
+    input_paths: List[Path],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> Iterator[Tuple[Path, List[Result]]]:
+    """
+    Yield each input path and its results, in the order they finish.
+
+    Args:
+        solvers: The parts to solve each input with
+        input_paths: The inputs to solve
+        max_workers: The number of processes. Defaults to the number of CPUs
+        timeout: Seconds each part can run before it's interrupted
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(solve_input, solvers, p, timeout): p for p in input_paths
+        }
+
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def format_result(input_path: Path, result: Result) -> str:
+    return json.dumps(
+        {
+            "input": input_path.name,
+            "part": result.solver.part,
+            "answer": result.answer,
+            "elapsed": round(result.elapsed, 6),
+            "error": result.error,
+        },
+        # Answers are usually numbers or strings, but anything else still gets a line
+        default=str,
+    )
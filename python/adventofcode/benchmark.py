@@ -0,0 +1,233 @@
+"""
+Benchmark solvers and compare the results to a stored baseline.
+
+Each solver is measured in a fresh process so its peak RSS isn't polluted by the
+solvers that ran before it. A baseline is a JSON file mapping `year/day/part` to the
+measurements, e.g.
+
+    {
+        "2022/16/1": {
+            "min": 1.52,
+            "median": 1.55,
+            "p95": 1.61,
+            "peak_rss": 61865984,
+            "repeat": 5
+        }
+    }
+
+Solvers can also record phase timings and counts with `utils.timer` and
+`utils.count`. Those are collected in a separate run, so recording them doesn't skew
+the measurements.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from dataclasses import asdict, dataclass
+from math import ceil
+from pathlib import Path
+from statistics import median
+from typing import Dict, Iterable, List
+
+from adventofcode.registry import ROOT, Solver
+from adventofcode.utils import Instrumentation, instrument
+
+DEFAULT_BASELINE_PATH = ROOT.parent / "benchmark_baseline.json"
+
+
+@dataclass
+class Measurement:
+
+    # Wall times in seconds
+    min: float
+    median: float
+    p95: float
+    # Bytes
+    peak_rss: int
+    repeat: int
+
+    @classmethod
+    def from_times(cls, times: List[float], peak_rss: int) -> Measurement:
+        times = sorted(times)
+        # Nearest rank percentile
+        p95_index = max(ceil(0.95 * len(times)) - 1, 0)
+
+        return cls(
+            min=times[0],
+            median=median(times),
+            p95=times[p95_index],
+            peak_rss=peak_rss,
+            repeat=len(times),
+        )
+
+
+@dataclass
+class Regression:
+
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    def __str__(self) -> str:
+        return (
+            f"{self.key} {self.metric} regressed {self.ratio:.2f}x "
+            f"({format_value(self.metric, self.baseline)} -> "
+            f"{format_value(self.metric, self.current)})"
+        )
+
+
+def get_peak_rss() -> int:
+    """Return the peak resident set size of this process in bytes."""
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # macOS reports bytes, Linux reports kilobytes
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def _measure_in_process(solver: Solver, repeat: int, warmup: int) -> Measurement:
+    part = solver.load()
+
+    # Warmup runs also absorb one-time costs, like importing the solution module
+    for _ in range(warmup):
+        part()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        part()
+        times.append(time.perf_counter() - start)
+
+    return Measurement.from_times(times, get_peak_rss())
+
+
+def measure(solver: Solver, repeat: int = 5, warmup: int = 1) -> Measurement:
+    """Measure `solver` in a fresh process."""
+    with multiprocessing.Pool(processes=1) as pool:
+        return pool.apply(_measure_in_process, (solver, repeat, warmup))
+
+
+def _instrument_in_process(solver: Solver) -> Instrumentation:
+    part = solver.load()
+
+    with instrument() as instrumentation:
+        part()
+
+    return instrumentation
+
+
+def measure_instrumentation(solver: Solver) -> Instrumentation:
+    """Record what `solver` times and counts in one run in a fresh process."""
+    with multiprocessing.Pool(processes=1) as pool:
+        return pool.apply(_instrument_in_process, (solver,))
+
+
+def run_benchmarks(
+    solvers: Iterable[Solver], repeat: int = 5, warmup: int = 1
+) -> Dict[str, Measurement]:
+    return {s.key: measure(s, repeat=repeat, warmup=warmup) for s in solvers}
+
+
+def load_baseline(path: Path = DEFAULT_BASELINE_PATH) -> Dict[str, Measurement]:
+    if not path.exists():
+        return {}
+
+    with open(path, "r") as file:
+        return {key: Measurement(**value) for key, value in json.load(file).items()}
+
+
+def save_baseline(
+    results: Dict[str, Measurement], path: Path = DEFAULT_BASELINE_PATH
+) -> None:
+    # Keep measurements for solvers we didn't run this time
+    baseline = {**load_baseline(path), **results}
+
+    with open(path, "w") as file:
+        json.dump({k: asdict(v) for k, v in sorted(baseline.items())}, file, indent=4)
+        file.write("\n")
+
+
+def find_regressions(
+    results: Dict[str, Measurement],
+    baseline: Dict[str, Measurement],
+    threshold: float = 0.2,
+) -> List[Regression]:
+    """
+    Return the measurements in `results` that got worse than `baseline`.
+
+    A measurement regressed if it's more than `threshold` (a fraction) worse. We compare
+    the median wall time, since it's the least noisy, and the peak RSS.
+    """
+    regressions = []
+
+    for key, current in results.items():
+        if key not in baseline:
+            continue
+
+        for metric in ("median", "peak_rss"):
+            baseline_value = getattr(baseline[key], metric)
+            current_value = getattr(current, metric)
+
+            if baseline_value and current_value > baseline_value * (1 + threshold):
+                regressions.append(
+                    Regression(key, metric, baseline_value, current_value)
+                )
+
+    return regressions
+
+
+def format_value(metric: str, value: float) -> str:
+    if metric == "peak_rss":
+        return f"{value / 2 ** 20:.1f} MiB"
+
+    return f"{value * 1000:.1f} ms"
+
+
+def format_report(results: Dict[str, Measurement]) -> str:
+    """Format a table of `results`, ordered from the slowest to the fastest."""
+    total = sum(m.median for m in results.values())
+    lines = [
+        f"{'solver':<12}{'min':>12}{'median':>12}{'p95':>12}{'peak rss':>14}"
+        f"{'share':>8}"
+    ]
+
+    for key, m in sorted(results.items(), key=lambda kv: -kv[1].median):
+        lines.append(
+            f"{key:<12}"
+            f"{format_value('min', m.min):>12}"
+            f"{format_value('median', m.median):>12}"
+            f"{format_value('p95', m.p95):>12}"
+            f"{format_value('peak_rss', m.peak_rss):>14}"
+            f"{m.median / total if total else 0:>8.1%}"
+        )
+
+    lines.append(f"{'total':<12}{'':>12}{format_value('median', total):>12}")
+
+    return "\n".join(lines)
+
+
+def format_instrumentation(results: Dict[str, Instrumentation]) -> str:
+    """Format each solver's phases and counts, skipping ones that didn't record any."""
+    lines = []
+
+    for key, instrumentation in sorted(results.items()):
+        phases = ", ".join(
+            f"{name} {format_value('median', seconds)}"
+            for name, seconds in instrumentation.timings.items()
+        )
+        counts = ", ".join(
+            f"{name} {value:,}" for name, value in instrumentation.counts.items()
+        )
+
+        if phases or counts:
+            lines.append(f"{key:<12}{'; '.join(s for s in (phases, counts) if s)}")
+
+    return "\n".join(lines)
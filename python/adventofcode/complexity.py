@@ -0,0 +1,225 @@
+"""
+Measure how each solver's run time grows with the size of its input.
+
+The real inputs are small enough that an O(n^2) solution can be as fast as an O(n)
+one. Instead, we time each solver on generated inputs (see `adventofcode.generators`)
+at sizes spread evenly on a log scale, then fit the times against n, n log n, n^2,
+and n^3. We also fit the exponent k of n^k directly, which is the slope of the times
+on a log-log plot.
+
+A generator can declare a budget, the largest exponent its solutions should grow by.
+A solver over budget (by more than a tolerance, since timings are noisy) fails the
+check, e.g. if an all-pairs loop creeps back into a solution that didn't need one.
+
+A run that takes longer than the time limit is stopped, and the sweep ends there.
+Each generator's sizes are ones its solutions should handle, so with a budget that's
+a failure too.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from dataclasses import dataclass
+from math import log, nan
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from adventofcode.benchmark import format_value
+from adventofcode.generators import get_generator, write_input
+from adventofcode.registry import Solver
+from adventofcode.utils import clear_input_cache, use_input_path
+
+DEFAULT_TOLERANCE = 0.5
+
+
+@dataclass(frozen=True)
+class GrowthModel:
+
+    name: str
+    function: Callable[[float], float]
+
+
+MODELS = (
+    GrowthModel("n", lambda n: n),
+    GrowthModel("n log n", lambda n: n * log(n)),
+    GrowthModel("n^2", lambda n: n**2),
+    GrowthModel("n^3", lambda n: n**3),
+)
+
+
+@dataclass
+class ComplexityResult:
+
+    key: str
+    # (size, seconds) for each size that was timed, smallest first
+    timings: List[Tuple[int, float]]
+    budget: Optional[float] = None
+    # The size that was stopped at the time limit, if any
+    timed_out_size: Optional[int] = None
+
+    @property
+    def exponent(self) -> float:
+        """Return the best fitting k of n^k, or nan if there aren't enough timings."""
+        if len(self.timings) < 2:
+            return nan
+
+        # Least squares fit of a line to log(time) against log(size)
+        xs = [log(size) for size, _ in self.timings]
+        ys = [log(seconds) for _, seconds in self.timings]
+        mean_x = sum(xs) / len(xs)
+        mean_y = sum(ys) / len(ys)
+
+        return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / sum(
+            (x - mean_x) ** 2 for x in xs
+        )
+
+    @property
+    def best_model(self) -> Optional[GrowthModel]:
+        if len(self.timings) < 2:
+            return None
+
+        return min(MODELS, key=self.get_error)
+
+    def get_error(self, model: GrowthModel) -> float:
+        """
+        Return how badly `model` fits, the squared error in log space.
+
+        The only free parameter is the constant factor, and the best one is the mean of
+        the residuals. Working in log space keeps the largest timings from dominating.
+        """
+        residuals = [
+            log(seconds) - log(model.function(size)) for size, seconds in self.timings
+        ]
+        constant = sum(residuals) / len(residuals)
+
+        return sum((r - constant) ** 2 for r in residuals)
+
+    def is_over_budget(self, tolerance: float = DEFAULT_TOLERANCE) -> bool:
+        if self.budget is None:
+            return False
+
+        # Comparing to nan is always false, so too few timings only fail if one of
+        # the sizes timed out
+        return (
+            self.timed_out_size is not None or self.exponent > self.budget + tolerance
+        )
+
+
+def get_sizes(smallest: int, largest: int, steps: int) -> List[int]:
+    """
+    Return up to `steps` sizes from `smallest` to `largest`, evenly spaced on a log
+    scale.
+    """
+    if steps < 2 or smallest == largest:
+        return [smallest]
+
+    ratio = largest / smallest
+    sizes = (round(smallest * ratio ** (i / (steps - 1))) for i in range(steps))
+
+    # Small ranges can round to the same size more than once
+    return sorted(set(sizes))
+
+
+def _time_in_process(solver: Solver, input_path: Path) -> float:
+    part = solver.load()
+    # Read the input inside the timed run every time, so every size is timed the same
+    clear_input_cache()
+
+    with use_input_path(input_path):
+        start = time.perf_counter()
+        part()
+
+        return time.perf_counter() - start
+
+
+def measure(
+    solver: Solver,
+    steps: int = 4,
+    seed: int = 0,
+    repeat: int = 3,
+    max_time: float = 10,
+    budget: Optional[float] = None,
+) -> ComplexityResult:
+    """
+    Time `solver` on generated inputs in a fresh process and fit the results.
+
+    The sizes go from the generator's smallest to its largest. Stop once a run takes
+    more than `max_time` seconds. `budget` overrides the generator's.
+    """
+    generator = get_generator(solver.year, solver.day)
+    result = ComplexityResult(
+        solver.key, [], budget if budget is not None else generator.budget
+    )
+
+    # Leaving the pool terminates its process, so this also stops a run that timed out
+    with multiprocessing.Pool(processes=1) as pool:
+        for size in get_sizes(generator.sizes[0], generator.sizes[-1], steps):
+            input_path = write_input(solver.year, solver.day, size, seed)
+            times = []
+
+            try:
+                for _ in range(repeat):
+                    run = pool.apply_async(_time_in_process, (solver, input_path))
+                    times.append(run.get(timeout=max_time))
+            except multiprocessing.TimeoutError:
+                result.timed_out_size = size
+                break
+
+            # Noise only ever makes a run slower, so the fastest is the best estimate
+            result.timings.append((size, min(times)))
+
+    return result
+
+
+def run_complexity(
+    solvers: Iterable[Solver],
+    steps: int = 4,
+    seed: int = 0,
+    repeat: int = 3,
+    max_time: float = 10,
+    budget: Optional[float] = None,
+) -> List[ComplexityResult]:
+    return [
+        measure(
+            s, steps=steps, seed=seed, repeat=repeat, max_time=max_time, budget=budget
+        )
+        for s in solvers
+    ]
+
+
+def format_report(
+    results: List[ComplexityResult], tolerance: float = DEFAULT_TOLERANCE
+) -> str:
+    lines = [
+        f"{'solver':<12}{'sizes':>18}{'slowest':>12}{'best fit':>10}{'exponent':>10}"
+        f"{'budget':>8}"
+    ]
+
+    for result in results:
+        sizes = slowest = "-"
+        if result.timings:
+            sizes = f"{result.timings[0][0]}-{result.timings[-1][0]}"
+            slowest = format_value("median", result.timings[-1][1])
+
+        model = result.best_model
+        budget = "" if result.budget is None else f"{result.budget:g}"
+        notes = []
+
+        if result.timed_out_size is not None:
+            notes.append(f"timed out at {result.timed_out_size}")
+
+        if result.is_over_budget(tolerance):
+            notes.append("over budget")
+
+        lines.append(
+            f"{result.key:<12}"
+            f"{sizes:>18}"
+            f"{slowest:>12}"
+            f"{model.name if model else '-':>10}"
+            f"{result.exponent:>10.2f}"
+            f"{budget:>8}"
+            f"{'  ' + ', '.join(notes) if notes else ''}"
+        )
+
+    return "\n".join(lines)
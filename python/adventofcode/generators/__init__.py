@@ -0,0 +1,109 @@
+"""
+Generate inputs of any size for every solution, so we can see how they scale.
+
+The real inputs are small, so a solution that's quadratic (or worse) in its input can
+look fast. Each generator takes a seeded `random.Random` and a size and returns an
+input in the same format as the puzzle's. What the size means depends on the puzzle,
+e.g. the number of lines or the width of a grid, and is documented on each generator.
+The same year, day, size, and seed always give the same input.
+
+Examples:
+    generate(2023, 11, size=500)
+
+    for size, text in get_generator(2023, 11).sweep():
+        ...
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from random import Random
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from adventofcode.utils import CACHE_DIR
+
+GENERATED_DIR = CACHE_DIR / "generated"
+
+# Takes a random number generator and a size and returns the input
+GeneratorFunction = Callable[[Random, int], str]
+
+# Map (year, day) to its generator. Populated as each year's module is imported
+_GENERATORS: Dict[Tuple[int, int], InputGenerator] = {}
+
+
+@dataclass(frozen=True)
+class InputGenerator:
+
+    year: int
+    day: int
+    function: GeneratorFunction
+    # Increasing sizes to time the solution with, from around the size of the real
+    # input to well beyond it (as far as the solution can go in reasonable time)
+    sizes: Tuple[int, ...]
+    # The largest exponent k the solutions' run times should grow by, as in O(size^k).
+    # Checked by `adventofcode.complexity`
+    budget: Optional[float] = None
+
+    @property
+    def description(self) -> str:
+        """Describe what the size means for this puzzle."""
+        return (self.function.__doc__ or "").strip()
+
+    def generate(self, size: int, seed: int = 0) -> str:
+        if size < 1:
+            raise ValueError(f"Size must be positive, got {size}")
+
+        # Mix the puzzle into the seed so days don't share random streams
+        return self.function(Random(f"{self.year}-{self.day}-{seed}"), size)
+
+    def sweep(
+        self, seed: int = 0, sizes: Optional[Tuple[int, ...]] = None
+    ) -> Iterator[Tuple[int, str]]:
+        """Yield (size, input) for each size, smallest first."""
+        for size in sizes or self.sizes:
+            yield size, self.generate(size, seed)
+
+    def __str__(self) -> str:
+        return f"{self.year} day {self.day:02}"
+
+
+def register(
+    year: int, day: int, sizes: Tuple[int, ...], budget: Optional[float] = None
+) -> Callable[[GeneratorFunction], GeneratorFunction]:
+    """Register the decorated function as the generator for `year` and `day`."""
+
+    def decorator(function: GeneratorFunction) -> GeneratorFunction:
+        _GENERATORS[(year, day)] = InputGenerator(year, day, function, sizes, budget)
+        return function
+
+    return decorator
+
+
+def get_generator(year: int, day: int) -> InputGenerator:
+    try:
+        # Generators register themselves when their year's module is imported
+        import_module(f"adventofcode.generators.year{year}")
+    except ModuleNotFoundError:
+        pass
+
+    if (year, day) not in _GENERATORS:
+        raise ValueError(f"No input generator for {year} day {day:02}")
+
+    return _GENERATORS[(year, day)]
+
+
+def generate(year: int, day: int, size: int, seed: int = 0) -> str:
+    return get_generator(year, day).generate(size, seed)
+
+
+def write_input(year: int, day: int, size: int, seed: int = 0) -> Path:
+    """Generate an input and write it under the cache dir, returning its path."""
+    path = GENERATED_DIR / f"{year}" / f"day{day:02}" / f"size{size}_seed{seed}.txt"
+
+    # Always write it, since the generator may have changed since the last time
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(generate(year, day, size, seed))
+
+    return path
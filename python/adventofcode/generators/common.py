@@ -0,0 +1,48 @@
+"""Building blocks shared by the generators for each year."""
+
+from __future__ import annotations
+
+from random import Random
+from string import ascii_lowercase
+from typing import Collection, List, Optional, Sequence
+
+
+def char_grid(
+    rng: Random,
+    width: int,
+    height: int,
+    chars: Sequence[str],
+    weights: Optional[Sequence[float]] = None,
+) -> List[List[str]]:
+    """Return a `height` by `width` grid of `chars` picked at random."""
+    return [rng.choices(chars, weights, k=width) for _ in range(height)]
+
+
+def format_grid(grid: List[List[str]]) -> str:
+    return "\n".join("".join(row) for row in grid)
+
+
+def digit_grid(rng: Random, width: int, height: int, digits: str = "0123456789") -> str:
+    return format_grid(char_grid(rng, width, height, digits))
+
+
+def unique_names(
+    rng: Random,
+    count: int,
+    length: int,
+    alphabet: str = ascii_lowercase,
+    exclude: Collection[str] = (),
+) -> List[str]:
+    """Return `count` different random names, none of which are in `exclude`."""
+    if count > len(alphabet) ** length - len(exclude):
+        raise ValueError(f"Can't make {count} names of length {length}")
+
+    names = {}
+
+    while len(names) < count:
+        name = "".join(rng.choices(alphabet, k=length))
+        if name not in exclude:
+            # Use a dict rather than a set to keep the order deterministic
+            names[name] = None
+
+    return list(names)
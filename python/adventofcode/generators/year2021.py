@@ -0,0 +1,426 @@
+from __future__ import annotations
+
+from random import Random
+from string import ascii_lowercase, ascii_uppercase
+from typing import List, Set, Tuple
+
+from adventofcode.generators import register
+from adventofcode.generators.common import (
+    char_grid,
+    digit_grid,
+    format_grid,
+    unique_names,
+)
+from adventofcode.utils import NEIGHBOR_OFFSETS
+
+# The segments lit for each digit on a seven segment display
+SEGMENTS = (
+    "abcefg",
+    "cf",
+    "acdeg",
+    "acdfg",
+    "bcdf",
+    "abdfg",
+    "abdefg",
+    "acf",
+    "abcdefg",
+    "abcdfg",
+)
+
+OPENING_TO_CLOSING = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+@register(2021, 1, sizes=(2_000, 20_000, 200_000, 1_000_000))
+def sonar_sweep(rng: Random, size: int) -> str:
+    """`size` depths."""
+    depths = [rng.randint(100, 200)]
+
+    for _ in range(size - 1):
+        depths.append(max(depths[-1] + rng.randint(-5, 10), 0))
+
+    return "\n".join(str(d) for d in depths)
+
+
+@register(2021, 2, sizes=(1_000, 10_000, 100_000, 1_000_000))
+def dive(rng: Random, size: int) -> str:
+    """`size` commands."""
+    return "\n".join(
+        f"{rng.choice(('forward', 'forward', 'down', 'up'))} {rng.randint(1, 9)}"
+        for _ in range(size)
+    )
+
+
+def _has_co2_rating(numbers: List[int], bits: int) -> bool:
+    """
+    Return True if filtering for the least common bits leaves exactly one number.
+
+    If every remaining number has the same bit, the least common group is empty.
+    """
+    for bit in reversed(range(bits)):
+        if len(numbers) == 1:
+            return True
+
+        ones = [n for n in numbers if n >> bit & 1]
+        zeros = [n for n in numbers if not n >> bit & 1]
+
+        if not ones or not zeros:
+            return False
+
+        numbers = ones if len(ones) < len(zeros) else zeros
+
+    return len(numbers) == 1
+
+
+@register(2021, 3, sizes=(1_000, 10_000, 100_000, 1_000_000))
+def binary_diagnostic(rng: Random, size: int) -> str:
+    """`size` different binary numbers."""
+    # The ratings filter until one number is left, so there can't be duplicates
+    bits = max(12, size.bit_length() + 1)
+    numbers = rng.sample(range(2**bits), size)
+
+    while size > 1 and not _has_co2_rating(numbers, bits):
+        numbers = rng.sample(range(2**bits), size)
+
+    return "\n".join(f"{n:0{bits}b}" for n in numbers)
+
+
+@register(2021, 4, sizes=(100, 300, 1_000, 3_000))
+def giant_squid(rng: Random, size: int) -> str:
+    """`size` bingo boards."""
+    # Draw every number, so every board wins eventually
+    numbers = list(range(max(100, size)))
+    rng.shuffle(numbers)
+
+    boards = []
+    for _ in range(size):
+        values = rng.sample(numbers, 25)
+        rows = (values[i : i + 5] for i in range(0, 25, 5))
+        boards.append("\n".join(" ".join(f"{v:>2}" for v in row) for row in rows))
+
+    return "\n\n".join((",".join(str(n) for n in numbers), *boards))
+
+
+@register(2021, 5, sizes=(500, 1_000, 2_000, 4_000))
+def hydrothermal_venture(rng: Random, size: int) -> str:
+    """`size` lines of vents, in a square that grows with the count."""
+    extent = max(size * 2, 10)
+    lines = []
+
+    for _ in range(size):
+        x1, y1 = rng.randrange(extent), rng.randrange(extent)
+        dx, dy = rng.choice(((1, 0), (0, 1), (1, 1), (1, -1)))
+
+        # Keep the line in the square. Diagonals have to move the same in x and y
+        length = rng.randint(0, extent // 3)
+        if dx:
+            length = min(length, extent - 1 - x1)
+        if dy:
+            length = min(length, extent - 1 - y1 if dy > 0 else y1)
+
+        x2, y2 = x1 + dx * length, y1 + dy * length
+
+        if rng.random() < 0.5:
+            x1, y1, x2, y2 = x2, y2, x1, y1
+
+        lines.append(f"{x1},{y1} -> {x2},{y2}")
+
+    return "\n".join(lines)
+
+
+@register(2021, 6, sizes=(300, 3_000, 30_000, 300_000))
+def lanternfish(rng: Random, size: int) -> str:
+    """`size` fish."""
+    return ",".join(str(rng.randint(1, 5)) for _ in range(size))
+
+
+@register(2021, 7, sizes=(1_000, 3_000, 10_000))
+def treachery_of_whales(rng: Random, size: int) -> str:
+    """`size` crabs, spread over about twice as many positions."""
+    return ",".join(str(int(rng.expovariate(1 / size))) for _ in range(size))
+
+
+@register(2021, 8, sizes=(200, 2_000, 20_000, 100_000))
+def seven_segment_search(rng: Random, size: int) -> str:
+    """`size` displays."""
+    lines = []
+
+    for _ in range(size):
+        # Each display has its own wiring
+        wires = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+
+        def encode(digit: int) -> str:
+            return "".join(
+                rng.sample([wires[s] for s in SEGMENTS[digit]], k=len(SEGMENTS[digit]))
+            )
+
+        patterns = [encode(d) for d in rng.sample(range(10), 10)]
+        outputs = [encode(rng.randrange(10)) for _ in range(4)]
+        lines.append(f"{' '.join(patterns)} | {' '.join(outputs)}")
+
+    return "\n".join(lines)
+
+
+@register(2021, 9, sizes=(100, 200, 500, 1_000))
+def smoke_basin(rng: Random, size: int) -> str:
+    """A `size` by `size` height map."""
+    # Real maps have a lot of 9s, which split the map into basins
+    return format_grid(
+        char_grid(rng, size, size, "0123456789", weights=(2,) * 9 + (7,))
+    )
+
+
+def _get_bracket_line(rng: Random, length: int, corrupted: bool) -> str:
+    chars = []
+    stack = []
+    # Where we'll close with the wrong char
+    corrupt_at = rng.randrange(length // 2, length) if corrupted else -1
+
+    for index in range(length):
+        if not stack or rng.random() < 0.55:
+            opening = rng.choice("([{<")
+            stack.append(opening)
+            chars.append(opening)
+            continue
+
+        closing = OPENING_TO_CLOSING[stack.pop()]
+        if index >= corrupt_at >= 0:
+            closing = rng.choice([c for c in ")]}>" if c != closing])
+            corrupt_at = -1
+
+        chars.append(closing)
+
+    # An incomplete line has to have something left to close, and a corrupted line
+    # needs a wrong closing char even if we never got to `corrupt_at`
+    if not stack:
+        stack.append(rng.choice("([{<"))
+        chars.append(stack[-1])
+
+    if corrupt_at >= 0:
+        closing = OPENING_TO_CLOSING[stack[-1]]
+        chars.append(rng.choice([c for c in ")]}>" if c != closing]))
+
+    return "".join(chars)
+
+
+@register(2021, 10, sizes=(100, 1_000, 10_000, 100_000))
+def syntax_scoring(rng: Random, size: int) -> str:
+    """`size` lines of brackets."""
+    corrupted = [rng.random() < 0.5 for _ in range(size)]
+
+    # The middle score needs an odd number of incomplete lines
+    if corrupted.count(False) % 2 == 0:
+        corrupted[-1] = not corrupted[-1]
+
+    return "\n".join(_get_bracket_line(rng, rng.randint(90, 110), c) for c in corrupted)
+
+
+def _synchronizes(levels: List[int], size: int, max_steps: int) -> bool:
+    """Return True if every octopus flashes in the same step within `max_steps`."""
+    levels = list(levels)
+    neighbors = [
+        [
+            (y + dy) * size + x + dx
+            for dx, dy in NEIGHBOR_OFFSETS
+            if 0 <= x + dx < size and 0 <= y + dy < size
+        ]
+        for y in range(size)
+        for x in range(size)
+    ]
+
+    for _ in range(max_steps):
+        levels = [level + 1 for level in levels]
+        to_flash = [i for i, level in enumerate(levels) if level > 9]
+        flashed = set(to_flash)
+
+        while to_flash:
+            for neighbor in neighbors[to_flash.pop()]:
+                levels[neighbor] += 1
+                if levels[neighbor] > 9 and neighbor not in flashed:
+                    flashed.add(neighbor)
+                    to_flash.append(neighbor)
+
+        if len(flashed) == len(levels):
+            return True
+
+        for index in flashed:
+            levels[index] = 0
+
+    return False
+
+
+@register(2021, 11, sizes=(10, 50, 100, 200))
+def dumbo_octopus(rng: Random, size: int) -> str:
+    """A `size` by `size` grid of energy levels."""
+    # Part 2 runs until every octopus flashes at once, which a grid of random levels
+    # may never do. Mostly equal levels with some noise usually sync up quickly, but
+    # check, and fall back to levels that are already in sync.
+    for _ in range(10):
+        level = rng.randint(0, 9)
+        levels = [
+            rng.randint(0, 9) if rng.random() < 0.1 else level
+            for _ in range(size * size)
+        ]
+
+        if _synchronizes(levels, size, max_steps=1_000):
+            break
+    else:
+        levels = [rng.randint(0, 9)] * (size * size)
+
+    return "\n".join(
+        "".join(str(v) for v in levels[y * size : (y + 1) * size]) for y in range(size)
+    )
+
+
+@register(2021, 12, sizes=(20, 24, 28))
+def passage_pathing(rng: Random, size: int) -> str:
+    """
+    `size` tunnels.
+
+    The number of paths grows exponentially, so the sizes stay small.
+    """
+    small = unique_names(rng, max(size // 4, 2), 2, ascii_lowercase)
+    big = unique_names(rng, max(size // 10, 1), 2, ascii_uppercase)
+    caves = [*small, *big]
+
+    edges: Set[Tuple[str, str]] = set()
+
+    def add_edge(a: str, b: str) -> None:
+        # Two big caves next to each other would let a path loop forever
+        if a == b or (a in big and b in big) or (b, a) in edges:
+            return
+
+        edges.add((a, b))
+
+    add_edge("start", rng.choice(caves))
+    add_edge(rng.choice(caves), "end")
+
+    while len(edges) < size:
+        a, b = rng.sample(["start", "end", *caves], 2)
+        add_edge(a, b)
+
+    # Sort before shuffling, since set order changes between runs
+    edges = sorted(edges)
+    rng.shuffle(edges)
+
+    return "\n".join(f"{a}-{b}" for a, b in edges)
+
+
+def _get_valid_coordinates(length: int, folds: List[int]) -> List[int]:
+    """Return the coordinates that never land on a fold line after each fold."""
+
+    def is_valid(value: int) -> bool:
+        for fold in folds:
+            if value == fold:
+                return False
+
+            if value > fold:
+                value = 2 * fold - value
+
+        return True
+
+    return [v for v in range(length) if is_valid(v)]
+
+
+@register(2021, 13, sizes=(1_000, 10_000, 100_000, 500_000))
+def transparent_origami(rng: Random, size: int) -> str:
+    """About `size` dots."""
+    # Start from the folded size and unfold, like the real 40 by 6 code
+    width, height = 40, 6
+    x_folds, y_folds = [], []
+
+    for _ in range(5):
+        x_folds.insert(0, width)
+        width = 2 * width + 1
+
+    for _ in range(6):
+        y_folds.insert(0, height)
+        height = 2 * height + 1
+
+    xs = _get_valid_coordinates(width, x_folds)
+    ys = _get_valid_coordinates(height, y_folds)
+    dots = sorted({(rng.choice(xs), rng.choice(ys)) for _ in range(size)})
+    rng.shuffle(dots)
+
+    # Alternate the axes, with the extra y folds at the end
+    folds = [f"fold along x={x}\nfold along y={y}" for x, y in zip(x_folds, y_folds)]
+    folds.extend(f"fold along y={y}" for y in y_folds[len(x_folds) :])
+
+    return "\n".join((*(f"{x},{y}" for x, y in dots), "", *folds))
+
+
+@register(2021, 14, sizes=(10, 15, 20, 26))
+def extended_polymerization(rng: Random, size: int) -> str:
+    """`size` elements (at most 26), with a rule for every pair of them."""
+    if size > len(ascii_uppercase):
+        raise ValueError(f"There are only {len(ascii_uppercase)} elements")
+
+    elements = rng.sample(ascii_uppercase, size)
+    template = "".join(rng.choices(elements, k=20))
+    rules = [f"{a}{b} -> {rng.choice(elements)}" for a in elements for b in elements]
+    rng.shuffle(rules)
+
+    return "\n".join((template, "", *rules))
+
+
+@register(2021, 15, sizes=(100, 200, 300))
+def chiton(rng: Random, size: int) -> str:
+    """A `size` by `size` risk map."""
+    return digit_grid(rng, size, size, digits="123456789")
+
+
+def _get_packet(rng: Random, count: int) -> str:
+    """Return the bits for a packet that contains `count` packets, including itself."""
+    version = f"{rng.randrange(8):03b}"
+
+    if count == 1:
+        value = f"{rng.randint(0, 2**rng.randint(1, 16)):b}"
+        # Pad to a multiple of 4 bits, then prefix each group with whether it's last
+        value = value.zfill(-(-len(value) // 4) * 4)
+        groups = [value[i : i + 4] for i in range(0, len(value), 4)]
+        return "".join(
+            (
+                version,
+                "100",
+                *(f"{int(i < len(groups) - 1)}{g}" for i, g in enumerate(groups)),
+            )
+        )
+
+    # Comparisons need exactly two sub-packets
+    type_ids = [0, 1, 2, 3] if count < 3 else [0, 1, 2, 3, 5, 6, 7]
+    type_id = rng.choice(type_ids)
+    sub_packet_count = 2 if type_id >= 5 else rng.randint(1, min(count - 1, 4))
+
+    # Split the remaining packets between the sub-packets
+    sizes = [1] * sub_packet_count
+    for _ in range(count - 1 - sub_packet_count):
+        sizes[rng.randrange(sub_packet_count)] += 1
+
+    sub_packets = "".join(_get_packet(rng, s) for s in sizes)
+
+    if len(sub_packets) < 2**15 and rng.random() < 0.5:
+        header = f"0{len(sub_packets):015b}"
+    else:
+        header = f"1{sub_packet_count:011b}"
+
+    return f"{version}{type_id:03b}{header}{sub_packets}"
+
+
+@register(2021, 16, sizes=(100, 1_000, 10_000, 50_000))
+def packet_decoder(rng: Random, size: int) -> str:
+    """A transmission with `size` packets."""
+    bits = _get_packet(rng, size)
+    # Pad to a whole number of hex digits
+    bits += "0" * (-len(bits) % 4)
+
+    return f"{int(bits, 2):0{len(bits) // 4}X}"
+
+
+@register(2021, 17, sizes=(150, 1_000, 10_000, 100_000))
+def trick_shot(rng: Random, size: int) -> str:
+    """A target area about `size` away from the probe."""
+    min_x = rng.randint(size, size * 2)
+    min_y = -rng.randint(size, size * 2)
+    max_x = min_x + rng.randint(1, max(size // 5, 1))
+    max_y = min_y + rng.randint(1, max(size // 3, 1))
+
+    return f"target area: x={min_x}..{max_x}, y={min_y}..{max_y}"
@@ -0,0 +1,529 @@
+from __future__ import annotations
+
+import json
+from random import Random
+from string import ascii_letters, ascii_lowercase, ascii_uppercase
+from typing import Dict, List, Tuple, Union
+
+from adventofcode.generators import register
+from adventofcode.generators.common import (
+    char_grid,
+    digit_grid,
+    format_grid,
+    unique_names,
+)
+
+# Worry levels past this mean an item was squared too many times to simulate
+MAX_WORRY = 10**30
+
+
+@register(2022, 1, sizes=(250, 2_500, 25_000, 250_000))
+def calorie_counting(rng: Random, size: int) -> str:
+    """`size` elves."""
+    return "\n\n".join(
+        "\n".join(str(rng.randint(1_000, 60_000)) for _ in range(rng.randint(1, 15)))
+        for _ in range(size)
+    )
+
+
+@register(2022, 2, sizes=(2_500, 25_000, 250_000, 1_000_000))
+def rock_paper_scissors(rng: Random, size: int) -> str:
+    """`size` rounds."""
+    return "\n".join(f"{rng.choice('ABC')} {rng.choice('XYZ')}" for _ in range(size))
+
+
+def _get_rucksack(rng: Random, pool: List[str], badge: str) -> str:
+    """
+    Return a rucksack made from `pool` and `badge`.
+
+    Only one item type is in both compartments.
+    """
+    shared, *rest = rng.sample(pool, len(pool))
+    left_pool, right_pool = rest[: len(rest) // 2], rest[len(rest) // 2 :]
+    (left_pool if rng.random() < 0.5 else right_pool).append(badge)
+
+    length = rng.randint(8, 24)
+    left = [shared, *rng.choices(left_pool, k=length - 1)]
+    right = [shared, *rng.choices(right_pool, k=length - 1)]
+
+    # Make sure the badge is in the rucksack
+    if badge not in left and badge not in right:
+        (left if badge in left_pool else right)[-1] = badge
+
+    rng.shuffle(left)
+    rng.shuffle(right)
+
+    return "".join((*left, *right))
+
+
+@register(2022, 3, sizes=(300, 3_000, 30_000, 300_000))
+def rucksack_reorganization(rng: Random, size: int) -> str:
+    """`size` rucksacks, rounded up to a whole group of three."""
+    rucksacks = []
+
+    for _ in range(-(-size // 3)):
+        badge = rng.choice(ascii_letters)
+        # Give each elf in the group different items, so the badge is the only one
+        # they all share
+        items = [c for c in ascii_letters if c != badge]
+        rng.shuffle(items)
+        rucksacks.extend(_get_rucksack(rng, items[i::3], badge) for i in range(3))
+
+    return "\n".join(rucksacks)
+
+
+@register(2022, 4, sizes=(1_000, 10_000, 100_000, 1_000_000))
+def camp_cleanup(rng: Random, size: int) -> str:
+    """`size` pairs of assignments."""
+
+    def get_assignment() -> str:
+        start = rng.randint(1, 99)
+        return f"{start}-{rng.randint(start, 99)}"
+
+    return "\n".join(f"{get_assignment()},{get_assignment()}" for _ in range(size))
+
+
+@register(2022, 5, sizes=(500, 5_000, 50_000, 500_000))
+def supply_stacks(rng: Random, size: int) -> str:
+    """`size` moves between 9 stacks."""
+    stacks = [rng.choices(ascii_uppercase, k=rng.randint(1, 8)) for _ in range(9)]
+    height = max(len(s) for s in stacks)
+
+    drawing = [
+        " ".join(f"[{s[row]}]" if row < len(s) else "   " for s in stacks).rstrip()
+        for row in reversed(range(height))
+    ]
+    drawing.append(" " + "   ".join(str(i + 1) for i in range(len(stacks))))
+
+    # Play the moves as we go, so we never move more crates than a stack has. Leave at
+    # least one crate behind, so every stack has a crate on top at the end.
+    moves = []
+    while len(moves) < size:
+        source, destination = rng.sample(range(len(stacks)), 2)
+        if len(stacks[source]) < 2:
+            continue
+
+        crate_count = rng.randint(1, min(len(stacks[source]) - 1, 10))
+        stacks[destination].extend(stacks[source][-crate_count:])
+        del stacks[source][-crate_count:]
+        moves.append(f"move {crate_count} from {source + 1} to {destination + 1}")
+
+    return "\n".join((*drawing, "", *moves))
+
+
+@register(2022, 6, sizes=(4_096, 40_960, 409_600, 4_096_000))
+def tuning_trouble(rng: Random, size: int) -> str:
+    """A datastream of about `size` chars, with the markers near the end."""
+    # With only 13 letters there can't be 14 different ones in a row, so the only
+    # start-of-message marker is the one we put in
+    stream = rng.choices(ascii_lowercase[:13], k=max(size, 60))
+    marker_index = rng.randint(len(stream) * 3 // 4, len(stream) - 15)
+    stream[marker_index : marker_index + 14] = rng.sample(ascii_lowercase, 14)
+
+    return "".join(stream)
+
+
+@register(2022, 7, sizes=(200, 2_000, 20_000, 100_000))
+def no_space_left_on_device(rng: Random, size: int) -> str:
+    """A filesystem with `size` directories besides the root."""
+    # Each directory is its parent's index. Use a few top level directories so the
+    # largest one is big enough to free up the space we need.
+    parents = [None] + [0] * min(size, 4)
+    parents.extend(rng.randint(1, i - 1) for i in range(len(parents), size + 1))
+    children: Dict[int, List[int]] = {i: [] for i in range(len(parents))}
+    for index, parent in enumerate(parents[1:], start=1):
+        children[parent].append(index)
+
+    files = {i: rng.randint(0, 3) for i in children}
+    # Fill the disk most of the way, so part 2 has to free up some space
+    weights = [rng.random() for _ in range(sum(files.values()))]
+    total = rng.randint(41_000_000, 45_000_000)
+    scale = total / (sum(weights) or 1)
+    sizes = iter(max(int(w * scale), 1) for w in weights)
+
+    lines = []
+
+    def list_directory(index: int) -> None:
+        names = unique_names(
+            rng, files[index] + len(children[index]), rng.randint(3, 8)
+        )
+        lines.append("$ ls")
+        lines.extend(f"dir {n}" for n in names[: len(children[index])])
+        lines.extend(
+            f"{next(sizes)} {n}{rng.choice(('.txt', '.dat', '.log', ''))}"
+            for n in names[len(children[index]) :]
+        )
+
+        for child, name in zip(children[index], names):
+            lines.append(f"$ cd {name}")
+            list_directory(child)
+            lines.append("$ cd ..")
+
+    lines.append("$ cd /")
+    list_directory(0)
+
+    return "\n".join(lines)
+
+
+@register(2022, 8, sizes=(99, 200, 500, 1_000))
+def treetop_tree_house(rng: Random, size: int) -> str:
+    """A `size` by `size` grid of tree heights."""
+    return digit_grid(rng, size, size)
+
+
+@register(2022, 9, sizes=(2_000, 20_000, 200_000, 1_000_000))
+def rope_bridge(rng: Random, size: int) -> str:
+    """`size` moves."""
+    return "\n".join(f"{rng.choice('LRUD')} {rng.randint(1, 19)}" for _ in range(size))
+
+
+@register(2022, 10, sizes=(150, 1_500, 15_000, 150_000))
+def cathode_ray_tube(rng: Random, size: int) -> str:
+    """`size` instructions."""
+    register_value = 1
+    instructions = []
+
+    for _ in range(size):
+        if rng.random() < 0.3:
+            instructions.append("noop")
+            continue
+
+        # Keep the sprite somewhere on the screen
+        value = rng.randint(-10, 10)
+        if not -5 <= register_value + value <= 45:
+            value = -value
+
+        register_value += value
+        instructions.append(f"addx {value}")
+
+    return "\n".join(instructions)
+
+
+def _get_primes(amount: int) -> List[int]:
+    primes: List[int] = []
+    candidate = 2
+
+    while len(primes) < amount:
+        if all(candidate % p for p in primes):
+            primes.append(candidate)
+        candidate += 1
+
+    return primes
+
+
+def _worry_stays_small(
+    monkeys: List[Tuple[List[int], str, int, int, int]], rounds: int
+) -> bool:
+    """Simulate with relief like part 1 and check every worry level stays small."""
+    items = [list(m[0]) for m in monkeys]
+
+    for _ in range(rounds):
+        for index, (_, operation, divisor, if_true, if_false) in enumerate(monkeys):
+            for item in items[index]:
+                operand = item if operation.endswith("old") else int(operation[2:])
+                item = (item * operand if operation[0] == "*" else item + operand) // 3
+
+                if item > MAX_WORRY:
+                    return False
+
+                items[if_false if item % divisor else if_true].append(item)
+
+            items[index] = []
+
+    return True
+
+
+@register(2022, 11, sizes=(8, 16, 32, 64))
+def monkey_in_the_middle(rng: Random, size: int) -> str:
+    """`size` monkeys."""
+    # The tests use different primes, like the real input
+    divisors = _get_primes(size)
+    rng.shuffle(divisors)
+
+    for _ in range(10):
+        monkeys = []
+
+        for index, divisor in enumerate(divisors):
+            operation = rng.choice(
+                (f"* {rng.randint(2, 19)}", f"+ {rng.randint(1, 8)}")
+            )
+            others = [i for i in range(size) if i != index] or [index]
+            monkeys.append(
+                (
+                    [rng.randint(50, 99) for _ in range(rng.randint(1, 8))],
+                    operation,
+                    divisor,
+                    rng.choice(others),
+                    rng.choice(others),
+                )
+            )
+
+        # One monkey squares the worry level. Make sure it doesn't square the same
+        # items so often that they get too big to work with.
+        squarer = rng.randrange(size)
+        squared = [*monkeys]
+        squared[squarer] = (monkeys[squarer][0], "* old", *monkeys[squarer][2:])
+        if _worry_stays_small(squared, rounds=20):
+            monkeys = squared
+            break
+
+    return "\n\n".join(
+        "\n".join(
+            (
+                f"Monkey {index}:",
+                f"  Starting items: {', '.join(str(i) for i in items)}",
+                f"  Operation: new = old {operation}",
+                f"  Test: divisible by {divisor}",
+                f"    If true: throw to monkey {if_true}",
+                f"    If false: throw to monkey {if_false}",
+            )
+        )
+        for index, (items, operation, divisor, if_true, if_false) in enumerate(monkeys)
+    )
+
+
+@register(2022, 12, sizes=(144, 300, 600, 1_200))
+def hill_climbing_algorithm(rng: Random, size: int) -> str:
+    """A height map `size` wide (at least 26) and a third as tall."""
+    width, height = max(size, 26), max(size // 3, 3)
+    path_row = rng.randrange(height)
+    rows = []
+
+    for y in range(height):
+        row = []
+        for x in range(width):
+            # Rise from `a` on the left to `z` on the right. The path row has no dips,
+            # so there's always a way to the end.
+            base = x * 25 // (width - 1)
+            dip = 0 if y == path_row else rng.choice((0, 0, 1, 2, 3))
+            row.append(chr(ord("a") + max(base - dip, 0)))
+        rows.append(row)
+
+    rows[path_row][0] = "S"
+    rows[path_row][-1] = "E"
+
+    return format_grid(rows)
+
+
+def _get_packet(rng: Random, depth: int) -> List:
+    packet: List[Union[int, List]] = []
+
+    for _ in range(rng.randint(0, 5)):
+        if depth < 4 and rng.random() < 0.3:
+            packet.append(_get_packet(rng, depth + 1))
+        else:
+            packet.append(rng.randint(0, 10))
+
+    return packet
+
+
+@register(2022, 13, sizes=(150, 1_500, 15_000, 150_000))
+def distress_signal(rng: Random, size: int) -> str:
+    """`size` pairs of packets."""
+    return "\n\n".join(
+        "\n".join(
+            json.dumps(_get_packet(rng, 0), separators=(",", ":")) for _ in range(2)
+        )
+        for _ in range(size)
+    )
+
+
+@register(2022, 14, sizes=(150, 200, 250))
+def regolith_reservoir(rng: Random, size: int) -> str:
+    """`size` paths of rock, in a cave that gets deeper with the count."""
+    depth = 20 + size
+    paths = []
+
+    # Make sure the rock spans the source of the sand
+    y = rng.randint(depth // 2, depth)
+    paths.append([(rng.randint(490, 499), y), (rng.randint(501, 510), y)])
+
+    while len(paths) < size:
+        x, y = rng.randint(500 - depth, 500 + depth), rng.randint(10, depth)
+        path = [(x, y)]
+        horizontal = rng.random() < 0.5
+
+        for _ in range(rng.randint(1, 5)):
+            distance = rng.randint(1, 8) * rng.choice((-1, 1))
+            if horizontal:
+                x += distance
+            else:
+                y = max(y + distance, 1)
+            path.append((x, y))
+            horizontal = not horizontal
+
+        paths.append(path)
+
+    return "\n".join(" -> ".join(f"{x},{y}" for x, y in path) for path in paths)
+
+
+@register(2022, 15, sizes=(25, 50, 100, 200))
+def beacon_exclusion_zone(rng: Random, size: int) -> str:
+    """
+    `size` sensors.
+
+    Part 2 needs the sensors to cover everything but one point, which random sensors
+    don't, so it may not find a beacon.
+    """
+    lines = []
+
+    for _ in range(size):
+        sensor_x, sensor_y = rng.randint(0, 4_000_000), rng.randint(0, 4_000_000)
+        distance = rng.randint(100_000, 1_000_000)
+        dx = rng.randint(-distance, distance)
+        dy = (distance - abs(dx)) * rng.choice((-1, 1))
+        lines.append(
+            f"Sensor at x={sensor_x}, y={sensor_y}: "
+            f"closest beacon is at x={sensor_x + dx}, y={sensor_y + dy}"
+        )
+
+    return "\n".join(lines)
+
+
+@register(2022, 16, sizes=(20, 30, 45, 60))
+def proboscidea_volcanium(rng: Random, size: int) -> str:
+    """
+    `size` valves, about a quarter of which have flow.
+
+    Part 1 is exponential in the number of valves with flow, so the sizes stay small.
+    """
+    names = ["AA", *unique_names(rng, size - 1, 2, ascii_uppercase, exclude={"AA"})]
+    rng.shuffle(names)
+    tunnels: Dict[str, set] = {n: set() for n in names}
+
+    def connect(a: str, b: str) -> None:
+        tunnels[a].add(b)
+        tunnels[b].add(a)
+
+    # A random tree keeps every valve reachable, then add a few loops
+    for index, name in enumerate(names[1:], start=1):
+        connect(name, names[rng.randrange(index)])
+    for _ in range(size // 4):
+        a, b = rng.sample(names, 2)
+        connect(a, b)
+
+    lines = []
+    for name in names:
+        flow_rate = rng.randint(1, 25) if name != "AA" and rng.random() < 0.25 else 0
+        neighbors = sorted(tunnels[name])
+        rng.shuffle(neighbors)
+        tunnel = (
+            "tunnels lead to valves" if len(neighbors) > 1 else "tunnel leads to valve"
+        )
+        lines.append(
+            f"Valve {name} has flow rate={flow_rate}; {tunnel} {', '.join(neighbors)}"
+        )
+
+    return "\n".join(lines)
+
+
+@register(2022, 17, sizes=(10_000, 100_000, 1_000_000, 10_000_000))
+def pyroclastic_flow(rng: Random, size: int) -> str:
+    """`size` jets."""
+    return "".join(rng.choices("<>", k=size))
+
+
+@register(2022, 18, sizes=(2_000, 5_000, 10_000))
+def boiling_boulders(rng: Random, size: int) -> str:
+    """`size` cubes, filling about a third of a box."""
+    side = round((size * 3) ** (1 / 3)) + 1
+    cubes = set()
+
+    while len(cubes) < size:
+        cubes.add(tuple(rng.randrange(side) for _ in range(3)))
+
+    cubes = sorted(cubes)
+    rng.shuffle(cubes)
+
+    return "\n".join(",".join(str(v) for v in cube) for cube in cubes)
+
+
+class _MonkeyNames:
+    """Hand out unique four letter names, skipping the reserved ones."""
+
+    def __init__(self, rng: Random) -> None:
+        self._rng = rng
+        self._used = {"root", "humn"}
+
+    def __call__(self) -> str:
+        while True:
+            name = "".join(self._rng.choices(ascii_lowercase, k=4))
+            if name not in self._used:
+                self._used.add(name)
+                return name
+
+
+def _add_monkeys(
+    rng: Random, lines: List[str], names: _MonkeyNames, count_: int
+) -> Tuple[str, int]:
+    """
+    Add a tree of about `count_` monkeys to `lines`.
+
+    Return the name of the monkey at the top of the tree and the number it yells.
+    """
+    name = names()
+
+    if count_ < 3:
+        value = rng.randint(1, 20)
+        lines.append(f"{name}: {value}")
+        return name, value
+
+    # Split evenly-ish so the tree stays shallow
+    left_count = rng.randint((count_ - 1) // 3, 2 * (count_ - 1) // 3)
+    left, left_value = _add_monkeys(rng, lines, names, left_count)
+    right, right_value = _add_monkeys(rng, lines, names, count_ - 1 - left_count)
+
+    # Only use operations that keep every number a positive integer
+    values = {"+": left_value + right_value}
+    if left_value * right_value < 10**12:
+        values["*"] = left_value * right_value
+    if left_value > right_value:
+        values["-"] = left_value - right_value
+    if left_value % right_value == 0:
+        values["/"] = left_value // right_value
+
+    operation = rng.choice(sorted(values))
+    lines.append(f"{name}: {left} {operation} {right}")
+
+    return name, values[operation]
+
+
+@register(2022, 21, sizes=(2_000, 20_000, 200_000, 1_000_000))
+def monkey_math(rng: Random, size: int) -> str:
+    """About `size` monkeys."""
+    names = _MonkeyNames(rng)
+    lines = [f"humn: {rng.randint(1, 20)}"]
+
+    # Part 2 works back up from the human, so only use operations on its path that can
+    # be undone exactly. Each step adds a tree of other monkeys beside the path.
+    path_length = size.bit_length() * 4
+    answer = rng.randint(1, 5_000)
+    name, value = "humn", answer
+
+    for _ in range(path_length):
+        other, other_value = _add_monkeys(
+            rng, lines, names, max(size // path_length - 2, 1)
+        )
+        operation = rng.choice("+*") if value * other_value < 10**15 else "+"
+        value = value + other_value if operation == "+" else value * other_value
+
+        parent = names()
+        pair = (name, other) if rng.random() < 0.5 else (other, name)
+        lines.append(f"{parent}: {pair[0]} {operation} {pair[1]}")
+        name = parent
+
+    # The other side of the root has to equal the path when the human yells `answer`
+    other = names()
+    lines.append(f"{other}: {value}")
+    pair = (name, other) if rng.random() < 0.5 else (other, name)
+    lines.append(f"root: {pair[0]} + {pair[1]}")
+
+    rng.shuffle(lines)
+
+    return "\n".join(lines)
+
+
+@register(2022, 23, sizes=(50, 73, 100))
+def unstable_diffusion(rng: Random, size: int) -> str:
+    """A `size` by `size` grid, about half elves."""
+    return format_grid(char_grid(rng, size, size, "#."))
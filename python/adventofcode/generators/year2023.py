@@ -0,0 +1,469 @@
+from __future__ import annotations
+
+from math import comb
+from random import Random
+from string import ascii_lowercase, ascii_uppercase
+from typing import List, Tuple
+
+from adventofcode.generators import register
+from adventofcode.generators.common import char_grid, format_grid
+
+DIGITS = ("one", "two", "three", "four", "five", "six", "seven", "eight", "nine")
+
+MAP_NAMES = (
+    "seed",
+    "soil",
+    "fertilizer",
+    "water",
+    "light",
+    "temperature",
+    "humidity",
+    "location",
+)
+
+# Letters a node name can end with when it's neither a start nor an end
+MIDDLE_LETTERS = ascii_uppercase[1:-1]
+
+# Map each direction to how it moves a point, with y increasing downwards
+DIRECTION_MOVES = {"U": (0, -1), "D": (0, 1), "L": (-1, 0), "R": (1, 0)}
+
+# Map the directions a pipe connects to the pipe
+PIPES = {
+    frozenset("UD"): "|",
+    frozenset("LR"): "-",
+    frozenset("UR"): "L",
+    frozenset("UL"): "J",
+    frozenset("DL"): "7",
+    frozenset("DR"): "F",
+}
+
+OPPOSITE_DIRECTIONS = {"U": "D", "D": "U", "L": "R", "R": "L"}
+
+
+@register(2023, 1, sizes=(1_000, 10_000, 100_000, 1_000_000))
+def trebuchet(rng: Random, size: int) -> str:
+    """`size` lines of calibration values."""
+    lines = []
+
+    for _ in range(size):
+        parts = []
+        for _ in range(rng.randint(2, 8)):
+            kind = rng.random()
+            if kind < 0.3:
+                parts.append(str(rng.randint(1, 9)))
+            elif kind < 0.6:
+                parts.append(rng.choice(DIGITS))
+            else:
+                parts.append("".join(rng.choices(ascii_lowercase, k=rng.randint(1, 5))))
+
+        # Part 1 needs at least one digit
+        if not any(p.isdigit() for p in parts):
+            parts.insert(rng.randint(0, len(parts)), str(rng.randint(1, 9)))
+
+        lines.append("".join(parts))
+
+    return "\n".join(lines)
+
+
+@register(2023, 2, sizes=(100, 1_000, 10_000, 100_000))
+def cube_conundrum(rng: Random, size: int) -> str:
+    """`size` games."""
+    games = []
+
+    for game_id in range(1, size + 1):
+        reveals = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(("red", "green", "blue"), rng.randint(1, 3))
+            reveals.append(", ".join(f"{rng.randint(1, 20)} {c}" for c in colors))
+        games.append(f"Game {game_id}: {'; '.join(reveals)}")
+
+    return "\n".join(games)
+
+
+@register(2023, 3, sizes=(140, 300, 600, 1_000))
+def gear_ratios(rng: Random, size: int) -> str:
+    """A `size` by `size` engine schematic."""
+    grid = [["."] * size for _ in range(size)]
+
+    for row in grid:
+        x = rng.randint(0, 4)
+        while x < size:
+            if rng.random() < 0.15:
+                row[x] = rng.choice("*#+$/@=%&-")
+                x += rng.randint(2, 6)
+                continue
+
+            # Leave a gap after each number so it doesn't run into the next one
+            number = str(rng.randint(1, 999))[: size - x]
+            row[x : x + len(number)] = number
+            x += len(number) + rng.randint(1, 8)
+
+    return format_grid(grid)
+
+
+@register(2023, 4, sizes=(200, 2_000, 20_000, 100_000))
+def scratchcards(rng: Random, size: int) -> str:
+    """`size` cards."""
+    cards = []
+
+    for index in range(size):
+        winning = rng.sample(range(1, 100), 10)
+        # Cards never win copies of cards past the end of the table. Most cards don't
+        # win anything, or the number of copies gets out of hand.
+        remaining = size - index - 1
+        match_count = 0
+        if remaining and rng.random() < 0.4:
+            match_count = rng.randint(1, min(5, remaining))
+
+        others = [n for n in range(1, 100) if n not in winning]
+        yours = rng.sample(winning, match_count) + rng.sample(others, 25 - match_count)
+        rng.shuffle(yours)
+
+        cards.append(
+            f"Card {index + 1:>3}: {' '.join(f'{n:>2}' for n in winning)} | "
+            f"{' '.join(f'{n:>2}' for n in yours)}"
+        )
+
+    return "\n".join(cards)
+
+
+@register(2023, 5, sizes=(30, 300, 3_000, 30_000))
+def if_you_give_a_seed_a_fertilizer(rng: Random, size: int) -> str:
+    """Seeds and maps with `size` ranges each."""
+    limit = 2**32
+    seeds = []
+    for _ in range(10):
+        start = rng.randrange(limit - 2**29)
+        seeds.extend((start, rng.randint(1, 2**29)))
+
+    blocks = [f"seeds: {' '.join(str(s) for s in seeds)}"]
+
+    for source, destination in zip(MAP_NAMES, MAP_NAMES[1:]):
+        # Cut the values into ranges that don't overlap, and skip some to leave gaps
+        cuts = sorted(rng.sample(range(1, limit), 2 * size))
+        lines = [f"{source}-to-{destination} map:"]
+
+        for start, end in zip(cuts[::2], cuts[1::2]):
+            destination_start = rng.randrange(limit - (end - start))
+            lines.append(f"{destination_start} {start} {end - start}")
+
+        blocks.append("\n".join(lines))
+
+    return "\n\n".join(blocks)
+
+
+@register(2023, 6, sizes=(4, 6, 8))
+def wait_for_it(rng: Random, size: int) -> str:
+    """
+    `size` races.
+
+    Part 2 finds the hold time with `math.ceil`, which goes through a float, and
+    floats stop being exact at around 16 digits. That's only about 8 races.
+    """
+
+    def get_max_distance(time: int) -> int:
+        return (time // 2) * (time - time // 2)
+
+    while True:
+        times = [rng.randint(7, 99) for _ in range(size)]
+        # The record has to be beatable
+        records = [rng.randint(0, get_max_distance(t) - 1) for t in times]
+
+        # Part 2 reads all the digits as one race, which has to be beatable too
+        time = int("".join(str(t) for t in times))
+        record = int("".join(str(r) for r in records))
+        if record < get_max_distance(time):
+            break
+
+    width = max(len(str(v)) for v in (*times, *records)) + 3
+
+    return "\n".join(
+        (
+            "Time:    " + "".join(f"{t:>{width}}" for t in times),
+            "Distance:" + "".join(f"{r:>{width}}" for r in records),
+        )
+    )
+
+
+@register(2023, 7, sizes=(1_000, 10_000, 100_000, 1_000_000))
+def camel_cards(rng: Random, size: int) -> str:
+    """`size` hands."""
+    return "\n".join(
+        f"{''.join(rng.choices('23456789TJQKA', k=5))} {rng.randint(1, 1_000)}"
+        for _ in range(size)
+    )
+
+
+def _get_node_names(
+    rng: Random, count: int, length: int, last_letters: str, reserved: str = ""
+) -> List[str]:
+    """
+    Return `count` different names ending in one of `last_letters`.
+
+    If `reserved` is given, it's always the first name.
+    """
+    names = [reserved] if reserved else []
+
+    for index in rng.sample(range(26 ** (length - 1) * len(last_letters)), count):
+        index, last_letter = divmod(index, len(last_letters))
+        name = last_letters[last_letter]
+
+        for _ in range(length - 1):
+            index, letter = divmod(index, 26)
+            name = f"{ascii_uppercase[letter]}{name}"
+
+        if name != reserved:
+            names.append(name)
+
+    return names[:count]
+
+
+@register(2023, 8, sizes=(750, 3_000, 12_000, 48_000))
+def haunted_wasteland(rng: Random, size: int) -> str:
+    """
+    A network of about `size` nodes.
+
+    Each start leads around a loop that passes one end, and loops back so reaching the
+    end again takes as long as reaching it the first time, like the real input. The
+    loops go the same way whichever instruction is followed.
+    """
+    ghost_count = min(6, max(size // 10, 1))
+    # Vary the loop lengths so the ghosts don't all line up on the first lap
+    average_length = max(size // ghost_count - 1, 4)
+    loop_lengths = [
+        rng.randint(average_length // 2, average_length * 3 // 2)
+        for _ in range(ghost_count)
+    ]
+    # Longer names once we've run out of three letter ones
+    length = 3 if size < len(MIDDLE_LETTERS) * 26**2 else 4
+
+    # Part 1 goes from AAA to ZZZ, so those have to be one of the loops
+    starts = _get_node_names(rng, ghost_count, length, "A", reserved="AAA")
+    ends = _get_node_names(rng, ghost_count, length, "Z", reserved="ZZZ")
+    middles = iter(
+        _get_node_names(rng, sum(loop_lengths) - ghost_count, length, MIDDLE_LETTERS)
+    )
+
+    nodes = []
+    for start, end, loop_length in zip(starts, ends, loop_lengths):
+        loop = [next(middles) for _ in range(loop_length - 1)]
+
+        # start -> loop -> end -> back to the start of the loop
+        path = [start, *loop, end, loop[0]]
+        nodes.extend(zip(path, path[1:]))
+
+    rng.shuffle(nodes)
+    instructions = "".join(rng.choices("LR", k=rng.randint(100, 300)))
+
+    return "\n".join(
+        (instructions, "", *(f"{node} = ({next_}, {next_})" for node, next_ in nodes))
+    )
+
+
+@register(2023, 9, sizes=(200, 2_000, 20_000, 200_000))
+def mirage_maintenance(rng: Random, size: int) -> str:
+    """`size` histories of 21 values."""
+    histories = []
+
+    for _ in range(size):
+        # A polynomial written in the binomial basis has integer values everywhere
+        coefficients = [rng.randint(-10, 10) for _ in range(rng.randint(1, 8))]
+        histories.append(
+            " ".join(
+                str(sum(c * comb(x, k) for k, c in enumerate(coefficients)))
+                for x in range(21)
+            )
+        )
+
+    return "\n".join(histories)
+
+
+def _get_loop(rng: Random, width: int, height: int) -> List[Tuple[int, int]]:
+    """
+    Return the points on a loop that fits inside `width` and `height` with a margin.
+
+    The loop is a skyline. It goes up the left side, along the tops of columns of
+    random heights, down the right side, and back along the bottom.
+    """
+    bottom = height - 2
+    # The top of each column from x=1 to x=width-2
+    tops = [rng.randint(1, bottom - 1) for _ in range(width - 2)]
+    # The right side goes down from the last column's top, so the loop can't reach it
+    # going up, or it would double back on itself
+    tops[-1] = max(tops[-1], tops[-2])
+
+    points = [(1, y) for y in range(bottom, tops[0] - 1, -1)]
+    # Step right at the height of the last column, then up or down to this one's top
+    for x, (last_top, top) in enumerate(zip(tops, tops[1:]), start=2):
+        step = 1 if top >= last_top else -1
+        points.extend((x, y) for y in range(last_top, top + step, step))
+    points.extend((width - 2, y) for y in range(tops[-1] + 1, bottom + 1))
+    points.extend((x, bottom) for x in range(width - 3, 1, -1))
+
+    return points
+
+
+def _get_direction(a: Tuple[int, int], b: Tuple[int, int]) -> str:
+    move = (b[0] - a[0], b[1] - a[1])
+    return next(d for d, m in DIRECTION_MOVES.items() if m == move)
+
+
+@register(2023, 10, sizes=(140, 300, 600, 1_000))
+def pipe_maze(rng: Random, size: int) -> str:
+    """A `size` by `size` grid (at least 5) with one loop of pipe."""
+    size = max(size, 5)
+    # Fill the grid with junk pipes, like the real input
+    grid = char_grid(rng, size, size, "|-LJ7F.")
+    loop = _get_loop(rng, size, size)
+
+    for index, point in enumerate(loop):
+        before, after = loop[index - 1], loop[(index + 1) % len(loop)]
+        directions = frozenset(
+            (
+                OPPOSITE_DIRECTIONS[_get_direction(before, point)],
+                _get_direction(point, after),
+            )
+        )
+        x, y = point
+        grid[y][x] = PIPES[directions]
+
+    # Junk next to the start can't look connected to it, so clear it
+    start_x, start_y = rng.choice(loop)
+    on_loop = set(loop)
+    for dx, dy in DIRECTION_MOVES.values():
+        if (start_x + dx, start_y + dy) not in on_loop:
+            grid[start_y + dy][start_x + dx] = "."
+    grid[start_y][start_x] = "S"
+
+    return format_grid(grid)
+
+
+@register(2023, 11, sizes=(140, 400, 1_000, 2_000), budget=2)
+def cosmic_expansion(rng: Random, size: int) -> str:
+    """A `size` by `size` image, with about 1 in 45 pixels a galaxy."""
+    grid = char_grid(rng, size, size, ".#", weights=(44, 1))
+
+    # Empty some rows and columns so there's something to expand
+    for y in rng.sample(range(size), size // 20):
+        grid[y] = ["."] * size
+    for x in rng.sample(range(size), size // 20):
+        for row in grid:
+            row[x] = "."
+
+    return format_grid(grid)
+
+
+@register(2023, 12, sizes=(1_000, 3_000, 10_000))
+def hot_springs(rng: Random, size: int) -> str:
+    """`size` rows of springs."""
+    rows = []
+
+    for _ in range(size):
+        springs = rng.choices("#.", k=rng.randint(5, 20))
+        # There has to be at least one group of damaged springs
+        springs[rng.randrange(len(springs))] = "#"
+        groups = [len(g) for g in "".join(springs).split(".") if g]
+
+        # Hide about half of them
+        springs = [s if rng.random() < 0.5 else "?" for s in springs]
+        rows.append(f"{''.join(springs)} {','.join(str(g) for g in groups)}")
+
+    return "\n".join(rows)
+
+
+def _get_pattern(rng: Random) -> List[str]:
+    """
+    Return a pattern with a perfect reflection and one that's off by one smudge.
+
+    Rows are mirrored across a horizontal line, for part 1. Every row is also mirrored
+    across a vertical line, except a row below the horizontal reflection that has one
+    smudge, for part 2.
+    """
+    width = rng.randint(9, 17)
+    column = rng.randint(1, width - 1)
+    span = min(column, width - column)
+
+    def get_row() -> List[str]:
+        row = rng.choices("#.", k=width)
+        for offset in range(span):
+            row[column + offset] = row[column - offset - 1]
+        return row
+
+    top = [get_row() for _ in range(rng.randint(2, 8))]
+    rows = [*top, *reversed(top)]
+
+    smudged = get_row()
+    offset = rng.randrange(span)
+    smudged[column + offset] = "#" if smudged[column - offset - 1] == "." else "."
+    rows.append(smudged)
+
+    return ["".join(r) for r in rows]
+
+
+@register(2023, 13, sizes=(100, 1_000, 10_000, 100_000))
+def point_of_incidence(rng: Random, size: int) -> str:
+    """`size` patterns."""
+    return "\n\n".join("\n".join(_get_pattern(rng)) for _ in range(size))
+
+
+@register(2023, 15, sizes=(4_000, 40_000, 400_000, 4_000_000))
+def lens_library(rng: Random, size: int) -> str:
+    """`size` steps."""
+    labels = [
+        "".join(rng.choices(ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(size // 8, 1))
+    ]
+
+    return ",".join(
+        f"{label}={rng.randint(1, 9)}" if rng.random() < 0.6 else f"{label}-"
+        for label in rng.choices(labels, k=size)
+    )
+
+
+@register(2023, 16, sizes=(110, 130, 150))
+def the_floor_will_be_lava(rng: Random, size: int) -> str:
+    """A `size` by `size` contraption."""
+    return format_grid(
+        char_grid(rng, size, size, "./\\|-", weights=(90, 2.5, 2.5, 2.5, 2.5))
+    )
+
+
+def _get_dig_plan(rng: Random, columns: int, scale: int) -> List[Tuple[str, int]]:
+    """
+    Return the (direction, distance) steps to dig a skyline with `columns` columns.
+
+    There are `2 * columns + 2` steps.
+    """
+    heights = [rng.randint(1, scale)]
+    while len(heights) < columns:
+        height = rng.randint(1, scale)
+        # Consecutive columns need different heights, or we'd move by 0
+        if height != heights[-1]:
+            heights.append(height)
+
+    widths = [rng.randint(1, scale) for _ in heights]
+    plan = [("U", heights[0])]
+
+    for width, height, next_height in zip(widths, heights, heights[1:]):
+        plan.append(("R", width))
+        plan.append(("U" if next_height > height else "D", abs(next_height - height)))
+
+    plan.extend((("R", widths[-1]), ("D", heights[-1]), ("L", sum(widths))))
+
+    return plan
+
+
+@register(2023, 18, sizes=(344, 3_440, 34_400, 344_000))
+def lavaduct_lagoon(rng: Random, size: int) -> str:
+    """A dig plan with about `size` steps."""
+    columns = max((size - 2) // 2, 2)
+    plan = _get_dig_plan(rng, columns, scale=10)
+    # The colors are a second, much bigger plan with the same number of steps
+    decoded_plan = _get_dig_plan(rng, columns, scale=1_000_000)
+
+    return "\n".join(
+        f"{direction} {distance} (#{decoded_distance:05x}{'RDLU'.index(decoded)})"
+        for (direction, distance), (decoded, decoded_distance) in zip(
+            plan, decoded_plan
+        )
+    )
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from random import Random
+from typing import List
+
+from adventofcode.generators import register
+from adventofcode.generators.common import char_grid, digit_grid, format_grid
+
+
+@register(2025, 1, sizes=(4_000, 40_000, 400_000, 4_000_000))
+def secret_entrance(rng: Random, size: int) -> str:
+    """`size` rotations."""
+    return "\n".join(f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(size))
+
+
+@register(2025, 2, sizes=(35, 70, 140, 280))
+def gift_shop(rng: Random, size: int) -> str:
+    """`size` ranges of product IDs."""
+    ranges = []
+
+    for _ in range(size):
+        digit_count = rng.randint(1, 10)
+        start = rng.randint(10 ** (digit_count - 1), 10**digit_count - 1)
+        # Some ranges cross into numbers with another digit
+        end = start + rng.randint(0, 10 ** max(digit_count - 3, 1))
+        ranges.append(f"{start}-{end}")
+
+    return ",".join(ranges)
+
+
+@register(2025, 3, sizes=(200, 2_000, 10_000))
+def lobby(rng: Random, size: int) -> str:
+    """`size` banks of 100 batteries."""
+    return digit_grid(rng, 100, size, digits="123456789")
+
+
+@register(2025, 4, sizes=(136, 300, 600, 1_000))
+def printing_department(rng: Random, size: int) -> str:
+    """A `size` by `size` grid, with rolls of paper in about 60% of it."""
+    return format_grid(char_grid(rng, size, size, "@.", weights=(3, 2)))
+
+
+@register(2025, 5, sizes=(1_000, 10_000, 100_000, 1_000_000))
+def cafeteria(rng: Random, size: int) -> str:
+    """`size` ingredient IDs, and a fifth as many fresh ranges."""
+    limit = 10**15
+    ranges = []
+
+    for _ in range(max(size // 5, 1)):
+        start = rng.randint(1, limit)
+        ranges.append(f"{start}-{start + rng.randint(0, limit // 1_000)}")
+
+    ids = (str(rng.randint(1, limit)) for _ in range(size))
+
+    return "\n".join((*ranges, "", *ids))
+
+
+def _get_problem_rows(rng: Random, row_count: int) -> List[str]:
+    """
+    Return the rows of one problem, padded to the same width.
+
+    Part 2 reads each column of digits top to bottom as a number, so a column can
+    only have spaces above or below its digits, never between them. Sorting the
+    lengths makes sure of that, whichever way the numbers are aligned.
+    """
+    lengths = sorted(
+        (rng.randint(1, 4) for _ in range(row_count)), reverse=rng.random() < 0.5
+    )
+    width = max(lengths)
+    numbers = [str(rng.randint(10 ** (l - 1), 10**l - 1)) for l in lengths]
+
+    if rng.random() < 0.5:
+        return [n.ljust(width) for n in numbers]
+
+    return [n.rjust(width) for n in numbers]
+
+
+@register(2025, 6, sizes=(1_000, 10_000, 100_000, 1_000_000))
+def trash_compactor(rng: Random, size: int) -> str:
+    """`size` problems, each with 4 numbers."""
+    problems = [_get_problem_rows(rng, 4) for _ in range(size)]
+    rows = [" ".join(p[row] for p in problems) for row in range(4)]
+    # The operator is under the first column of each problem
+    operators = " ".join(f"{rng.choice('+*'):<{len(p[0])}}" for p in problems)
+
+    return "\n".join((*rows, operators))
+
+
+@register(2025, 7, sizes=(141, 300, 600, 1_000))
+def laboratories(rng: Random, size: int) -> str:
+    """A `size` by `size` manifold."""
+    size = max(size, 3)
+    grid = [["."] * size for _ in range(size)]
+    grid[0][size // 2] = "S"
+
+    # Every other row has splitters, away from the edges so beams stay inside
+    for row in grid[2::2]:
+        for x in rng.sample(range(1, size - 1), (size - 2) // 4):
+            row[x] = "^"
+
+    return format_grid(grid)
+
+
+@register(2025, 8, sizes=(1_000, 1_500, 2_000))
+def playground(rng: Random, size: int) -> str:
+    """
+    `size` junction boxes (at least 46).
+
+    Part 1 connects the closest 1000 pairs, so there have to be that many.
+    """
+    return "\n".join(
+        ",".join(str(rng.randint(0, 99_999)) for _ in range(3))
+        for _ in range(max(size, 46))
+    )
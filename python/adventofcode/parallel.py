@@ -0,0 +1,94 @@
+"""
+Run many solvers at once across a pool of processes.
+
+Jobs are submitted longest first, using historical timings from a benchmark baseline,
+so the slowest solvers don't start last and hold up the whole run. Results are still
+returned in the order the solvers were given.
+"""
+
+from __future__ import annotations
+
+import signal
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from adventofcode.benchmark import Measurement
+from adventofcode.registry import Solver
+
+
+@dataclass
+class Result:
+
+    solver: Solver
+    answer: Any = None
+    # Seconds
+    elapsed: float = 0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _raise_timeout(signum: int, frame: Any) -> None:
+    raise TimeoutError("Timed out")
+
+
+def run_solver(solver: Solver, timeout: Optional[float] = None) -> Result:
+    """
+    Run `solver` and capture its answer or error.
+
+    If `timeout` (seconds) is provided, the solver is interrupted with a `TimeoutError`
+    once it runs that long. The worker process survives, so it can take the next job.
+    """
+    if timeout:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+
+    start = time.perf_counter()
+    try:
+        return Result(solver, answer=solver(), elapsed=time.perf_counter() - start)
+    except Exception as ex:
+        return Result(
+            solver,
+            elapsed=time.perf_counter() - start,
+            error=f"{type(ex).__name__}: {ex}",
+        )
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def get_expected_duration(solver: Solver, timings: Dict[str, Measurement]) -> float:
+    # Solvers we've never timed could be slow, so start them early
+    measurement = timings.get(solver.key)
+
+    return measurement.median if measurement else float("inf")
+
+
+def run_all(
+    solvers: List[Solver],
+    max_workers: Optional[int] = None,
+    timeout: Optional[float] = None,
+    timings: Optional[Dict[str, Measurement]] = None,
+) -> List[Result]:
+    """
+    Run `solvers` in parallel and return their results in the same order.
+
+    Args:
+        solvers: The solvers to run
+        max_workers: The number of processes. Defaults to the number of CPUs
+        timeout: Seconds each solver can run before it's interrupted
+        timings: Historical measurements used to schedule the longest jobs first
+    """
+    timings = timings or {}
+    schedule = sorted(
+        solvers, key=lambda s: get_expected_duration(s, timings), reverse=True
+    )
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {s: executor.submit(run_solver, s, timeout) for s in schedule}
+
+        return [futures[s].result() for s in solvers]
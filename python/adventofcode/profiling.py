@@ -0,0 +1,244 @@
+"""
+Profile a solver's run time or memory and write reports next to its solution.
+
+Time profiles are written to `profile_partN.txt`, the functions with the most
+cumulative time and how well each cache (see `utils.memoize`) worked, and
+`profile_partN.collapsed`, collapsed stacks that flame graph
+tools like https://github.com/brendangregg/FlameGraph and speedscope can read.
+Memory profiles are written to `memory_partN.txt`, the peak allocation and the lines
+holding the most memory when usage was highest.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import re
+import threading
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from adventofcode.registry import Solver
+from adventofcode.utils import (
+    MemoStats,
+    clear_input_cache,
+    get_memo_stats,
+    reset_memo_stats,
+)
+
+# A function in `pstats`, (file name, line number, function name)
+_Function = Tuple[str, int, str]
+
+# Don't write stacks that took less time than this. Otherwise the output is
+# dominated by tiny one-off calls. Seconds
+_MIN_STACK_TIME = 1e-6
+
+
+def get_report_path(solver: Solver, kind: str, suffix: str = ".txt") -> Path:
+    return solver.directory / f"{kind}_part{solver.part}{suffix}"
+
+
+def _format_function(function: _Function) -> str:
+    file_name, line, name = function
+
+    # Builtins don't have a file. Drop their addresses, e.g.
+    # "<built-in method __new__ of type object at 0x7f...>", so the output is stable
+    if file_name == "~":
+        return re.sub(r" at 0x[0-9a-f]+", "", name)
+
+    return f"{name} ({Path(file_name).name}:{line})"
+
+
+def get_collapsed_stacks(stats: pstats.Stats) -> Dict[str, float]:
+    """
+    Return the seconds spent in each stack of calls in `stats`.
+
+    cProfile only records which function called which, not whole stacks, so we rebuild
+    them from the call graph. When a function is called from multiple places, its
+    calls are split between them by how much time each caller spent in it. This is
+    the same estimate tools like gprof2dot make.
+    """
+    raw_stats = stats.stats  # type: ignore[attr-defined]
+    # Map caller to callee to the callee's (own time, cumulative time) in those calls
+    calls: Dict[_Function, Dict[_Function, Tuple[float, float]]] = defaultdict(dict)
+    for function, (_, _, _, _, callers) in raw_stats.items():
+        for caller, (_, _, own_time, cumulative_time) in callers.items():
+            calls[caller][function] = (own_time, cumulative_time)
+
+    stacks: Dict[str, float] = defaultdict(float)
+
+    def visit(function: _Function, stack: List[str], cumulative_time: float) -> None:
+        _, _, own_time, total_cumulative_time, _ = raw_stats[function]
+        # The fraction of this function's time spent on this stack
+        share = cumulative_time / total_cumulative_time if total_cumulative_time else 0
+        stack = [*stack, _format_function(function)]
+        stacks[";".join(stack)] += own_time * share
+
+        for callee, (_, callee_time) in calls[function].items():
+            callee_time *= share
+
+            # Recursive calls are already counted in the caller's time
+            if callee_time >= _MIN_STACK_TIME and _format_function(callee) not in stack:
+                visit(callee, stack, callee_time)
+
+    # Start from the functions that nothing (we profiled) called. Skip turning off the
+    # profiler, it isn't part of the solution
+    for function, (_, _, _, cumulative_time, callers) in raw_stats.items():
+        if not callers and "_lsprof.Profiler" not in function[2]:
+            visit(function, [], cumulative_time)
+
+    return {s: t for s, t in stacks.items() if t >= _MIN_STACK_TIME}
+
+
+def format_memo_stats(memo_stats: Dict[str, MemoStats]) -> str:
+    """Format a table of the caches that were used, from the most lookups down."""
+    used = [(n, s) for n, s in memo_stats.items() if s.hits or s.misses]
+    if not used:
+        return ""
+
+    lines = [
+        "Caches:",
+        f"{'hits':>12}{'misses':>12}{'hit rate':>10}{'evictions':>12}{'peak size':>12}"
+        "  name",
+    ]
+    for name, stats in sorted(used, key=lambda ns: -(ns[1].hits + ns[1].misses)):
+        lines.append(
+            f"{stats.hits:>12}{stats.misses:>12}{stats.hit_rate:>10.1%}"
+            f"{stats.evictions:>12}{stats.peak_size:>12}  {name}"
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def profile_time(solver: Solver, top: int = 20) -> Tuple[Any, List[Path]]:
+    """
+    Run `solver` under cProfile.
+
+    Return its answer and the paths of the reports.
+    """
+    part = solver.load()
+    # Only count the lookups from this run, and include reading the input even if
+    # an earlier run in this process already has
+    reset_memo_stats()
+    clear_input_cache()
+    profiler = cProfile.Profile()
+    answer = profiler.runcall(part)
+
+    output = io.StringIO()
+    stats = pstats.Stats(profiler, stream=output)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+    stats_path = get_report_path(solver, "profile")
+    stats_path.write_text(
+        f"{solver}\n{output.getvalue()}{format_memo_stats(get_memo_stats())}"
+    )
+
+    # Flame graph tools expect integer sample counts, so use microseconds
+    collapsed_path = get_report_path(solver, "profile", ".collapsed")
+    collapsed_path.write_text(
+        "".join(
+            f"{stack} {round(seconds * 1e6)}\n"
+            for stack, seconds in sorted(get_collapsed_stacks(stats).items())
+        )
+    )
+
+    return answer, [stats_path, collapsed_path]
+
+
+class _HighWaterSnapshots(threading.Thread):
+    """
+    Snapshot traced memory whenever usage reaches a new high.
+
+    tracemalloc can tell us the peak, but not what was allocated at the time. By the
+    time a part returns, most of what it allocated has been freed, so we check usage
+    in the background and keep the snapshot from when it was highest.
+    """
+
+    def __init__(self, interval: float) -> None:
+        super().__init__(daemon=True)
+        self.interval = interval
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self._highest = -1
+        self._stopped = threading.Event()
+
+    def sample(self) -> None:
+        current, _ = tracemalloc.get_traced_memory()
+
+        if current > self._highest:
+            self._highest = current
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+        # Parts faster than the interval are never sampled while running
+        self.sample()
+
+
+def _format_size(size: int) -> str:
+    # Small inputs use well under a MiB, which would round to nothing
+    if size < 2**20:
+        return f"{size / 2 ** 10:.1f} KiB"
+
+    return f"{size / 2 ** 20:.1f} MiB"
+
+
+def profile_memory(
+    solver: Solver, top: int = 20, interval: float = 0.05
+) -> Tuple[Any, Path]:
+    """
+    Run `solver` while tracing memory allocations.
+
+    Return its answer and the path of the report. Usage is checked every `interval`
+    seconds to find the lines holding the most memory.
+    """
+    part = solver.load()
+    # Otherwise the input is already in memory if the solver was run before (e.g.
+    # by `profile_time`), and we wouldn't count it
+    clear_input_cache()
+
+    tracemalloc.start()
+    snapshots = _HighWaterSnapshots(interval)
+    snapshots.start()
+    try:
+        answer = part()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        snapshots.stop()
+        tracemalloc.stop()
+
+    assert snapshots.snapshot is not None
+    # Leave out what profiling itself allocated
+    snapshot = snapshots.snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, tracemalloc.__file__),
+        ]
+    )
+
+    lines = [
+        f"{solver}",
+        f"Peak traced memory: {_format_size(peak)}",
+        "",
+        f"Top {top} lines when usage was highest "
+        f"({_format_size(sum(s.size for s in snapshot.statistics('filename')))}):",
+    ]
+    for stat in snapshot.statistics("lineno")[:top]:
+        frame = stat.traceback[0]
+        lines.append(
+            f"{stat.size / 2 ** 10:>10.1f} KiB {stat.count:>8} blocks  "
+            f"{frame.filename}:{frame.lineno}"
+        )
+
+    path = get_report_path(solver, "memory")
+    path.write_text("\n".join(lines) + "\n")
+
+    return answer, path
@@ -0,0 +1,115 @@
+"""
+Find the solver for each year, day, and part without running anything.
+
+Solutions live in `adventofcode/<year>/dayNN/solution.py` and define one function per
+part, either `part_1`/`part_2` or `part1`/`part2`. We find those functions by reading
+the source, so a solution module is only imported when one of its parts is loaded.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+ROOT = Path(__file__).parent
+
+# Matches top level part functions, e.g. `def part_1(` or `def part2(`
+_PART_PATTERN = re.compile(r"^def (part_?(\d+))\(", re.MULTILINE)
+
+
+@dataclass(frozen=True)
+class Solver:
+
+    year: int
+    day: int
+    part: int
+    # The name of the function in the solution module, e.g. `part_1`
+    function_name: str
+
+    @property
+    def key(self) -> str:
+        """Identify the solver in stored results, e.g. "2022/16/1"."""
+        return f"{self.year}/{self.day}/{self.part}"
+
+    @property
+    def module_name(self) -> str:
+        return f"adventofcode.{self.year}.day{self.day:02}.solution"
+
+    @property
+    def directory(self) -> Path:
+        return ROOT / str(self.year) / f"day{self.day:02}"
+
+    @property
+    def input_path(self) -> Path:
+        return self.directory / "input.txt"
+
+    def load(self) -> Callable[[], Any]:
+        """Import the solution module (if it isn't already) and return the part."""
+        return getattr(import_module(self.module_name), self.function_name)
+
+    def __call__(self) -> Any:
+        return self.load()()
+
+    def solve(self, input_text: str) -> Any:
+        """Solve `input_text` instead of the input next to the solution."""
+        # Only needed here, and importing utils would slow down finding solvers
+        from adventofcode.utils import use_input
+
+        with use_input(input_text):
+            return self()
+
+    def __str__(self) -> str:
+        return f"{self.year} day {self.day:02} part {self.part}"
+
+
+def _find_parts(solution_path: Path) -> Dict[int, str]:
+    """Return a mapping from part number to the function that solves it."""
+    source = solution_path.read_text()
+
+    return {int(part): name for name, part in _PART_PATTERN.findall(source)}
+
+
+def get_solvers(
+    year: Optional[int] = None, day: Optional[int] = None, part: Optional[int] = None
+) -> List[Solver]:
+    """
+    Return every solver, ordered by year, day, then part.
+
+    Filter by `year`, `day`, and `part` if they're provided.
+    """
+    solvers = []
+
+    for solution_path in sorted(
+        ROOT.glob("[0-9][0-9][0-9][0-9]/day[0-9][0-9]/solution.py")
+    ):
+        solution_year = int(solution_path.parent.parent.name)
+        # Remove the `day` prefix
+        solution_day = int(solution_path.parent.name[3:])
+
+        if year is not None and year != solution_year:
+            continue
+
+        if day is not None and day != solution_day:
+            continue
+
+        for solution_part, function_name in sorted(_find_parts(solution_path).items()):
+            if part is not None and part != solution_part:
+                continue
+
+            solvers.append(
+                Solver(solution_year, solution_day, solution_part, function_name)
+            )
+
+    return solvers
+
+
+def get_solver(year: int, day: int, part: int) -> Solver:
+    solvers = get_solvers(year, day, part)
+
+    if not solvers:
+        raise ValueError(f"No solver for {year} day {day:02} part {part}")
+
+    return solvers[0]
@@ -0,0 +1,150 @@
+"""
+Measure how long it takes to import each solution, and what that time is spent on.
+
+Each module is imported in a fresh interpreter with `python -X importtime`, which
+reports how long every import took, including the imports under it. Quick solutions
+finish in a few milliseconds, so a slow import can easily be most of their run time.
+
+We measure every solution module, `adventofcode.utils`, and the command line entry
+point, and report each one's time and the modules it imports that took the longest.
+A module that takes longer than the budget fails the check.
+
+Python only saves compiled bytecode if it's allowed to (e.g. not with
+PYTHONDONTWRITEBYTECODE set). Without it, every import compiles from source, so the
+times are much longer.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from adventofcode.benchmark import format_value
+from adventofcode.registry import Solver
+
+# Seconds each module can take to import, including everything it imports
+DEFAULT_BUDGET = 0.1
+
+# Modules measured along with the solutions. Every solution imports utils, and every
+# command imports the entry point
+SHARED_MODULES = ("adventofcode.utils", "adventofcode.__main__")
+
+
+@dataclass
+class ImportTime:
+
+    module: str
+    # Seconds, including the modules it imported
+    cumulative: float
+    # Map each module it imported directly to the seconds it took, including the
+    # modules that one imported
+    imports: Dict[str, float]
+
+    def get_slowest_imports(self, count: int) -> List[Tuple[str, float]]:
+        return sorted(self.imports.items(), key=lambda kv: -kv[1])[:count]
+
+
+def parse_import_times(output: str, module: str) -> Optional[ImportTime]:
+    """
+    Find the time `module` took to import in the output of `python -X importtime`.
+
+    Each line looks like
+
+        import time:       123 |        456 |   name
+
+    with the time spent in the module itself, then including its imports, in
+    microseconds. Imports are indented two spaces under the module that imported
+    them, and listed before it, since a module finishes importing after its imports.
+    Return None if `module` wasn't imported.
+    """
+    # The imports seen at each depth that haven't been matched to a parent yet
+    pending: Dict[int, Dict[str, float]] = {}
+
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, name = line.split("|")
+
+        # The header
+        if not cumulative.strip().isdigit():
+            continue
+
+        # There's always one space after the separator
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        seconds = int(cumulative) / 1e6
+        imports = pending.pop(depth + 1, {})
+
+        if name == module:
+            return ImportTime(module, seconds, imports)
+
+        pending.setdefault(depth, {})[name] = seconds
+
+    return None
+
+
+def measure(module: str, repeat: int = 3) -> ImportTime:
+    """Import `module` in a fresh interpreter `repeat` times and keep the fastest."""
+    # Import it once first, so it's compiled and every timed run loads the bytecode
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        # Solution packages start with a digit, so they can't be imported with an
+        # import statement. `importlib.import_module` would work, but it skips the
+        # timing
+        f"__import__({module!r})",
+    ]
+    subprocess.run(command, capture_output=True, check=True)
+    fastest = None
+
+    for _ in range(repeat):
+        process = subprocess.run(command, capture_output=True, text=True, check=True)
+        import_time = parse_import_times(process.stderr, module)
+
+        if import_time is None:
+            raise ValueError(f"{module} wasn't imported")
+
+        if fastest is None or import_time.cumulative < fastest.cumulative:
+            fastest = import_time
+
+    assert fastest is not None
+
+    return fastest
+
+
+def get_modules(solvers: Iterable[Solver]) -> List[str]:
+    # Parts of the same day share a module
+    solution_modules = dict.fromkeys(s.module_name for s in solvers)
+
+    return [*SHARED_MODULES, *solution_modules]
+
+
+def run_startup(modules: Iterable[str], repeat: int = 3) -> List[ImportTime]:
+    return [measure(m, repeat=repeat) for m in modules]
+
+
+def format_report(
+    results: List[ImportTime], budget: float = DEFAULT_BUDGET, top: int = 3
+) -> str:
+    """Format a table of `results`, from the slowest to the fastest."""
+    lines = [f"{'module':<36}{'import':>12}  slowest imports"]
+
+    for result in sorted(results, key=lambda r: -r.cumulative):
+        slowest = ", ".join(
+            f"{name} {format_value('median', seconds)}"
+            for name, seconds in result.get_slowest_imports(top)
+        )
+        over_budget = "  over budget" if result.cumulative > budget else ""
+
+        lines.append(
+            f"{result.module:<36}"
+            f"{format_value('median', result.cumulative):>12}"
+            f"  {slowest}{over_budget}"
+        )
+
+    return "\n".join(lines)
@@ -1,44 +1,235 @@
 from __future__ import annotations
 
-import inspect
-from dataclasses import dataclass
+import mmap
+import os
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property, lru_cache, wraps
+from heapq import heappop, heappush, merge
+from itertools import islice
 from pathlib import Path
+from types import ModuleType
 from typing import (
+    Any,
     Callable,
+    Container,
+    ContextManager,
+    Dict,
+    Final,
     Generator,
+    Generic,
+    Hashable,
     Iterable,
     Iterator,
     List,
+    NamedTuple,
     Optional,
+    Protocol,
     Tuple,
     TypeVar,
+    Union,
+    cast,
 )
 
 _T = TypeVar("_T")
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+# A node in a graph search. Ints (e.g. `Grid` indices) are the fastest
+_Node = TypeVar("_Node", bound=Hashable)
+
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+PARSE_CACHE_DIR = CACHE_DIR / "parsed"
+# Set to "1" to cache parsed inputs for every call to `load_list`
+PARSE_CACHE_ENV_VAR = "ADVENTOFCODE_PARSE_CACHE"
+
+# Map input path to the contents of that file, so each input is only read once
+_input_cache: Dict[str, str] = {}
+# Set by `use_input_path` so solutions load some other input, e.g. a generated one
+_input_path_override: Optional[str] = None
+# Stands in for a file path when the input is given as a string by `use_input`
+_GIVEN_INPUT_PATH: Final = "<given input>"
+_given_input: Optional[str] = None
+
+
+@lru_cache(maxsize=None)
+def _get_default_input_path(calling_module: str) -> str:
+    # Get a path to the `input.txt` file in the callers parent dir
+    return str(Path(calling_module).parent.joinpath("input.txt"))
+
+
+def get_caller_input_path() -> str:
+    """Return the path to the "input.txt" file next to the caller of this module."""
+    if _input_path_override is not None:
+        return _input_path_override
+
+    # Get the file that called this function. It will be the first one that's not
+    # this file. Walking the frames directly is much cheaper than `inspect.stack`, which
+    # reads source context for every frame.
+    frame = sys._getframe(1)
+
+    while frame.f_code.co_filename == __file__:
+        frame = frame.f_back
+
+    return _get_default_input_path(frame.f_code.co_filename)
+
+
+@contextmanager
+def use_input_path(file_path: Path) -> Iterator[None]:
+    """Load every default input from `file_path` instead while in this context."""
+    global _input_path_override
+
+    previous = _input_path_override
+    _input_path_override = str(file_path)
+
+    try:
+        yield
+    finally:
+        _input_path_override = previous
+
+
+@contextmanager
+def use_input(text: str) -> Iterator[None]:
+    """
+    Load `text` as every default input while in this context.
+
+    Solutions don't have to know where their input came from, so the same code solves
+    a string, e.g. one of many inputs in a batch, without writing it to a file.
+    """
+    global _given_input
+
+    previous = _given_input
+    # Like `load_input`, ignore blank lines at the end
+    _given_input = text.rstrip()
+
+    try:
+        with use_input_path(Path(_GIVEN_INPUT_PATH)):
+            yield
+    finally:
+        _given_input = previous
+
+
+def clear_input_cache() -> None:
+    """Forget the contents of the inputs loaded so far, e.g. if they've changed."""
+    _input_cache.clear()
 
 
 def load_input(file_path: Optional[str] = None) -> str:
     # If a file path isn't provided, default to an "input.txt" file in the caller's
     # directory
     if not file_path:
-        # Get the file that called this function. It will be the first one that's not
-        # this file
-        stack = iter(inspect.stack())
-        calling_module = next(stack).filename
+        file_path = get_caller_input_path()
 
-        while calling_module == __file__:
-            calling_module = next(stack).filename
+    file_path = str(file_path)
 
-        # Get a path to the `input.txt` file in the callers parent dir
-        file_path = Path(calling_module).parent.joinpath("input.txt")
+    if file_path == _GIVEN_INPUT_PATH and _given_input is not None:
+        return _given_input
 
-    with open(file_path, "r") as file:
-        return file.read().rstrip()
+    if file_path not in _input_cache:
+        with open(file_path, "r") as file:
+            _input_cache[file_path] = file.read().rstrip()
+
+    return _input_cache[file_path]
+
+
+def _hash(*values: str) -> str:
+    # The parse cache is off by default, so don't make every solution import these
+    # (they're slow to import) until it's used
+    import hashlib
+
+    digest = hashlib.sha256()
+
+    for value in values:
+        digest.update(value.encode())
+        # Separate values so ("ab", "c") and ("a", "bc") hash differently
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def _hash_file(file_path: str) -> str:
+    import hashlib
+
+    with open(file_path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def _get_parser_source_hash(parser: Callable) -> str:
+    """
+    Return a hash of the source `parser` is defined in, and of this module.
+
+    We hash the whole module rather than just the parser's own source, since what a
+    parser returns also depends on the helpers and classes around it. Solutions
+    build their parsed values from this module's classes too (e.g. `Point`), and a
+    pickle of an old version of one of them may not load into the new one.
+    """
+    utils_hash = _hash_file(__file__)
+    module = sys.modules.get(getattr(parser, "__module__", None) or "")
+    module_path = getattr(module, "__file__", None)
+
+    # Builtins like `int` don't have a source file
+    if not module_path or module_path == __file__:
+        return utils_hash
+
+    return _hash(_hash_file(module_path), utils_hash)
+
+
+def _get_name(value: object) -> Optional[str]:
+    module = getattr(value, "__module__", None)
+    qualname = getattr(value, "__qualname__", None)
+
+    if module is None or qualname is None:
+        return None
+
+    return f"{module}.{qualname}"
+
+
+def _get_parser_name(parser: Callable) -> Optional[str]:
+    """
+    Return a name that identifies what `parser` does, or None if its name alone
+    doesn't.
+
+    A method bound to a class is named after the class it's bound to, since a
+    subclass shares its parent's method but not its behaviour (e.g. `cls` differs).
+    Closures and methods bound to an instance depend on state we can't name, so they
+    get None.
+    """
+    if getattr(parser, "__closure__", None):
+        return None
+
+    name = _get_name(parser)
+    bound_to = getattr(parser, "__self__", None)
+
+    if bound_to is None or name is None:
+        return name
+
+    if isinstance(bound_to, (type, ModuleType)):
+        bound_name = _get_name(bound_to) or bound_to.__name__
+        return f"{bound_name}:{name}"
+
+    return None
+
+
+def _get_parse_cache_path(raw_input: str, parser: Callable) -> Optional[Path]:
+    parser_name = _get_parser_name(parser)
+
+    if parser_name is None:
+        return None
+
+    key = _hash(_hash(raw_input), parser_name, _get_parser_source_hash(parser))
+
+    return PARSE_CACHE_DIR / f"{key}.pickle"
 
 
 def load_list(
-    file_path: Optional[str] = None, parser: Optional[Callable[[str], _T]] = None
+    file_path: Optional[str] = None,
+    parser: Optional[Callable[[str], _T]] = None,
+    cache: Optional[bool] = None,
 ) -> List[_T]:
     """
     Load a list of inputs from `file_path`.
@@ -47,11 +238,400 @@ def load_list(
     where the input is typically stored.
 
     If `parser` is provided, it will be called on each line of input from the file.
+
+    If `cache` is True, the parsed list is stored on disk keyed by the hash of the
+    input, the parser's name, and the hash of the source of the parser and of this
+    module. Later calls load it from there instead of parsing again. If either the
+    input or the parser changes, the key changes, so stale results are never used.
+    Parsers that can't be told apart by name (closures and methods bound to
+    instances) are never cached. `cache` defaults to True when the
+    `ADVENTOFCODE_PARSE_CACHE` environment variable is "1".
     """
     # No-op if a parser isn't given
     parser = parser or (lambda x: x)
+    raw_input = load_input(file_path)
+
+    if cache is None:
+        cache = os.environ.get(PARSE_CACHE_ENV_VAR) == "1"
+
+    if not cache:
+        return [parser(l) for l in raw_input.split("\n")]
+
+    cache_path = _get_parse_cache_path(raw_input, parser)
+
+    if cache_path is None:
+        # We can't tell this parser apart from others with the same name, so a
+        # cached result could be theirs
+        return [parser(l) for l in raw_input.split("\n")]
+
+    import pickle
+
+    try:
+        with open(cache_path, "rb") as file:
+            return pickle.load(file)
+    except Exception:
+        # Either it isn't cached yet, or it can't be loaded. Loading runs the parsed
+        # classes' own code, which can fail in any way if they've changed since.
+        # Either way, parse it again (and overwrite it below)
+        pass
+
+    parsed = [parser(l) for l in raw_input.split("\n")]
+
+    try:
+        data = pickle.dumps(parsed, protocol=5)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # Some parsed values can't be pickled (e.g. they hold lambdas), so we can't
+        # cache them
+        return parsed
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so a concurrent reader never sees a partial file
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(cache_path)
+
+    return parsed
+
+
+def _read_lines(file_path: str) -> Iterator[str]:
+    """
+    Lazily yield each line in `file_path` without the newline.
+
+    Like `load_input`, ignore trailing whitespace at the end of the file, including
+    lines that are only whitespace. We can't tell a line is the last one with
+    anything in it until we've read the rest, so we hold on to it, and any blank
+    lines after it, until we find another.
+    """
+    if file_path == _GIVEN_INPUT_PATH and _given_input is not None:
+        # It's already in memory, without the blank lines at the end
+        if _given_input:
+            yield from _given_input.split("\n")
+        return
+
+    last_line: Optional[str] = None
+    blank_lines: List[str] = []
+
+    with open(file_path, "r") as file:
+        for line in file:
+            line = line.rstrip("\n")
+
+            if not line.strip():
+                blank_lines.append(line)
+                continue
+
+            # These lines weren't at the end, so they're part of the input
+            if last_line is not None:
+                yield last_line
+            yield from blank_lines
+            blank_lines.clear()
+
+            last_line = line
+
+    if last_line is not None:
+        yield last_line.rstrip()
+
+
+def iter_lines(
+    file_path: Optional[str] = None, parser: Optional[Callable[[str], _T]] = None
+) -> Iterator[_T]:
+    """
+    Lazily yield each line of input from `file_path`.
+
+    This is the streaming version of `load_list`. Only one line is held in memory at
+    a time, so single pass solutions can handle inputs that are too big to load at
+    once.
+
+    If `parser` is provided, it will be called on each line of input from the file.
+    """
+    # Find the path now, while the caller is still on the stack. The generator body
+    # won't run until it's iterated, potentially from somewhere else
+    file_path = str(file_path or get_caller_input_path())
+    lines = _read_lines(file_path)
+
+    return map(parser, lines) if parser else lines
+
+
+def _read_blocks(file_path: str) -> Iterator[List[str]]:
+    block = []
+
+    for line in _read_lines(file_path):
+        if line:
+            block.append(line)
+            continue
+
+        # A blank line ends the block. Multiple blank lines don't create empty blocks
+        if block:
+            yield block
+            block = []
+
+    if block:
+        yield block
+
 
-    return [parser(l) for l in load_input(file_path).split("\n")]
+def iter_blocks(
+    file_path: Optional[str] = None,
+    parser: Optional[Callable[[List[str]], _T]] = None,
+) -> Iterator[_T]:
+    """
+    Lazily yield each block of lines from `file_path`.
+
+    Blocks are separated by a blank line, e.g. the input
+
+        1000
+        2000
+
+        3000
+
+    yields ["1000", "2000"] then ["3000"]. Only one block is held in memory at a time.
+
+    If `parser` is provided, it will be called on the lines of each block.
+    """
+    file_path = str(file_path or get_caller_input_path())
+    blocks = _read_blocks(file_path)
+
+    return map(parser, blocks) if parser else blocks
+
+
+class ByteGrid:
+    """
+    A read-only 2D view of a grid stored as bytes, one row per line.
+
+    Cells are single bytes (ints) accessed in place, so scanning the grid doesn't
+    create a Python object per cell. Each row is `width` bytes, but rows are `stride`
+    bytes apart since the line endings are still in the buffer.
+
+    `data` is usually a memory mapped file, but can be any bytes.
+    """
+
+    def __init__(self, data: Union[mmap.mmap, bytes]) -> None:
+        self._buffer = data
+        self.data = memoryview(data)
+
+        newline = data.find(b"\n")
+        self.width = newline if newline != -1 else len(data)
+        self.stride = self.width + 1
+
+        # Windows line endings
+        if self.width and data[self.width - 1] == ord("\r"):
+            self.width -= 1
+
+        # Ignore trailing line endings, like `load_input`
+        end = len(data)
+        while end and data[end - 1] in b"\r\n":
+            end -= 1
+
+        # The last row may not have a line ending
+        self.height = (end + self.stride - self.width) // self.stride
+
+    def index(self, x: int, y: int) -> int:
+        """Return the position of (x, y) in `data`."""
+        return y * self.stride + x
+
+    def get(self, x: int, y: int) -> int:
+        return self.data[y * self.stride + x]
+
+    def is_valid_point(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def row(self, y: int) -> memoryview:
+        start = y * self.stride
+        return self.data[start : start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        return self.data[x : self.height * self.stride : self.stride]
+
+    def find_all(self, value: bytes) -> Iterator[Tuple[int, int]]:
+        """Yield (x, y) for every cell equal to `value`, e.g. b"#"."""
+        index = self._buffer.find(value)
+
+        while index != -1:
+            y, x = divmod(index, self.stride)
+            yield x, y
+            index = self._buffer.find(value, index + 1)
+
+    def close(self) -> None:
+        # The view has to be released before the map can be closed
+        self.data.release()
+
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> ByteGrid:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def load_grid_bytes(file_path: Optional[str] = None) -> ByteGrid:
+    """
+    Memory map the grid in `file_path` without copying it.
+
+    By default, load from the file "input.txt" in the caller's directory.
+    """
+    file_path = str(file_path or get_caller_input_path())
+
+    # There's no file to map, but the bytes can be viewed in place just the same
+    if file_path == _GIVEN_INPUT_PATH and _given_input is not None:
+        return ByteGrid(_given_input.encode())
+
+    with open(file_path, "rb") as file:
+        # Empty files can't be mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return ByteGrid(b"")
+
+        # The map stays valid after the file is closed
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return ByteGrid(data)
+
+
+class Grid:
+    """
+    A mutable 2D grid of ints stored in one flat array.
+
+    Cells are addressed by their index in `cells` rather than by (x, y), so moving to
+    a neighbor is just adding an offset, e.g. `index + grid.stride` is the cell below.
+
+    The grid is surrounded by a one cell border filled with `border`. A neighbor of a
+    real cell is always a valid index, so lookups don't need bounds checks. Pick a
+    `border` value the solution naturally stops at, e.g. a height that's too tall to
+    climb.
+    """
+
+    def __init__(
+        self, rows: Iterable[Iterable[int]], border: int = -1, typecode: str = "i"
+    ) -> None:
+        rows = [list(row) for row in rows]
+
+        self.width = len(rows[0]) if rows else 0
+        self.height = len(rows)
+        # Include the border on both sides
+        self.stride = self.width + 2
+        self.border = border
+
+        padding = [border] * self.stride
+        self.cells = array(typecode, padding)
+
+        for row in rows:
+            self.cells.append(border)
+            self.cells.extend(row)
+            self.cells.append(border)
+
+        self.cells.extend(padding)
+
+        # Offsets to the neighbors of any cell. Orthogonal neighbors come first
+        self.orthogonal_offsets: Tuple[int, ...] = (
+            -self.stride,
+            1,
+            self.stride,
+            -1,
+        )
+        self.neighbor_offsets: Tuple[int, ...] = (
+            *self.orthogonal_offsets,
+            -self.stride + 1,
+            self.stride + 1,
+            self.stride - 1,
+            -self.stride - 1,
+        )
+
+    def index(self, x: int, y: int) -> int:
+        """Return the position of (x, y) in `cells`."""
+        return (y + 1) * self.stride + x + 1
+
+    def point(self, index: int) -> Point:
+        """Return the (x, y) of the cell at `index`."""
+        y, x = divmod(index, self.stride)
+
+        return Point(x - 1, y - 1)
+
+    def get(self, x: int, y: int) -> int:
+        return self.cells[(y + 1) * self.stride + x + 1]
+
+    def is_valid_point(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    @cached_property
+    def indices(self) -> List[int]:
+        """The index of every cell, not including the border, row by row."""
+        return [
+            index
+            for start in range(
+                self.stride + 1, self.stride * (self.height + 1), self.stride
+            )
+            for index in range(start, start + self.width)
+        ]
+
+    @cached_property
+    def orthogonal_neighbors(self) -> List[Tuple[int, ...]]:
+        """
+        The indices of each cell's orthogonal neighbors, not including the border.
+
+        Use these instead of the offsets when the border shouldn't be touched, e.g.
+        when updating neighbors.
+        """
+        return self._get_neighbor_table(self.orthogonal_offsets)
+
+    @cached_property
+    def neighbors(self) -> List[Tuple[int, ...]]:
+        """The indices of all of each cell's neighbors, not including the border."""
+        return self._get_neighbor_table(self.neighbor_offsets)
+
+    def _get_neighbor_table(self, offsets: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        # Indexed the same as `cells`. Border cells don't have any neighbors
+        table: List[Tuple[int, ...]] = [()] * len(self.cells)
+        inside = bytearray(len(self.cells))
+
+        for index in self.indices:
+            inside[index] = True
+
+        for index in self.indices:
+            table[index] = tuple(index + o for o in offsets if inside[index + o])
+
+        return table
+
+    def row(self, y: int) -> memoryview:
+        start = self.index(0, y)
+        return memoryview(self.cells)[start : start + self.width]
+
+    def column(self, x: int) -> memoryview:
+        start = self.index(x, 0)
+        return memoryview(self.cells)[
+            start : start + self.height * self.stride : self.stride
+        ]
+
+    def find_all(self, value: int) -> List[int]:
+        """Return the index of every cell equal to `value`."""
+        cells = self.cells
+        return [i for i in self.indices if cells[i] == value]
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.cells[index] = value
+
+    def __len__(self) -> int:
+        """The number of cells, not including the border."""
+        return self.width * self.height
+
+
+def load_grid(
+    file_path: Optional[str] = None,
+    parser: Callable[[str], int] = int,
+    border: int = -1,
+) -> Grid:
+    """
+    Load the grid in `file_path` with `parser` called on each character.
+
+    By default, load from the file "input.txt" in the caller's directory.
+    """
+    file_path = str(file_path or get_caller_input_path())
+
+    return Grid(
+        ([parser(c) for c in line] for line in load_input(file_path).split("\n")),
+        border=border,
+    )
 
 
 def is_valid_point(x: int, y: int, grid: List[List]) -> bool:
@@ -63,17 +643,44 @@ def is_valid_point(x: int, y: int, grid: List[List]) -> bool:
     return 0 <= x < len(grid[0]) and 0 <= y < len(grid)
 
 
-@dataclass(frozen=True)
-class Point:
+# (x, y) offsets to every neighbor, starting below and going counterclockwise
+NEIGHBOR_OFFSETS: Final = (
+    (0, 1),
+    (1, 1),
+    (1, 0),
+    (1, -1),
+    (0, -1),
+    (-1, -1),
+    (-1, 0),
+    (-1, 1),
+)
+# Only the neighbors that share an edge
+ORTHOGONAL_OFFSETS: Final = ((0, 1), (1, 0), (0, -1), (-1, 0))
+
+# Build points without going through the generated `__new__`, which is a Python
+# function. Points are created in the inner loop of a lot of solutions.
+_new_point = tuple.__new__
 
+
+class Point(NamedTuple):
+
+    # Backed by a tuple, so hashing and comparing are done in C and a point is a
+    # fraction of the size of a dataclass instance. Since it's a tuple, it can also be
+    # unpacked, e.g. `x, y = point`.
     x: int
     y: int
 
     def translate(self, x: int = 0, y: int = 0) -> Point:
-        return Point(self.x + x, self.y + y)
+        return _new_point(Point, (self[0] + x, self[1] + y))
+
+    def translate_all(self, offsets: Iterable[Tuple[int, int]]) -> List[Point]:
+        """Return this point translated by each of `offsets`."""
+        x, y = self
+
+        return [_new_point(Point, (x + dx, y + dy)) for dx, dy in offsets]
 
     def relative_to(self, point: Point) -> Point:
-        return Point(self.x - point.x, self.y - point.y)
+        return _new_point(Point, (self[0] - point[0], self[1] - point[1]))
 
     def distance_to(self, other: Point) -> float:
         # https://en.wikipedia.org/wiki/Euclidean_distance
@@ -83,19 +690,17 @@ class Point:
         return self.x, self.y
 
     @property
-    def neighbors(self) -> Iterator[Point]:
-        directions = (
-            (0, 1),
-            (1, 1),
-            (1, 0),
-            (1, -1),
-            (0, -1),
-            (-1, -1),
-            (-1, 0),
-            (-1, 1),
-        )
+    def neighbors(self) -> List[Point]:
+        return self.translate_all(NEIGHBOR_OFFSETS)
+
+    @property
+    def orthogonal_neighbors(self) -> List[Point]:
+        return self.translate_all(ORTHOGONAL_OFFSETS)
+
 
-        return (self.translate(*d) for d in directions)
+def translate_points(points: Iterable[Point], x: int = 0, y: int = 0) -> List[Point]:
+    """Return every point in `points` translated by the same amount."""
+    return [_new_point(Point, (p[0] + x, p[1] + y)) for p in points]
 
 
 @dataclass(frozen=True)
@@ -255,3 +860,662 @@ def get_area(perimeter: list[Point], include_perimeter_points: bool = False) ->
     perimeter_offset = multiplier * (perimeter_point_count // 2)
 
     return area + perimeter_offset + 1
+
+
+@dataclass
+class SearchResult(Generic[_Node]):
+
+    # The best known distance to every node reached. If the search stopped early,
+    # only the distances of expanded nodes are final
+    distances: Dict[_Node, int]
+    # The first goal reached, if any
+    goal: Optional[_Node] = None
+    # The number of nodes taken off the frontier and explored
+    expanded: int = 0
+    # The most nodes on the frontier at once
+    peak_frontier: int = 0
+
+    @property
+    def distance(self) -> Optional[int]:
+        """The distance to `goal`, or None if we didn't reach one."""
+        return None if self.goal is None else self.distances[self.goal]
+
+
+def bfs(
+    starts: Iterable[_Node],
+    get_neighbors: Callable[[_Node], Iterable[_Node]],
+    goals: Optional[Container[_Node]] = None,
+) -> SearchResult[_Node]:
+    """
+    Breadth first search from every node in `starts` at once.
+
+    Every edge has a distance of 1, so each node's distance is the fewest steps from
+    the closest start. If `goals` is provided, stop as soon as one is reached.
+    Otherwise, visit every reachable node.
+    """
+    distances = {s: 0 for s in starts}
+    frontier = deque(distances)
+    result = SearchResult(distances)
+
+    while frontier:
+        if len(frontier) > result.peak_frontier:
+            result.peak_frontier = len(frontier)
+
+        node = frontier.popleft()
+        result.expanded += 1
+
+        if goals is not None and node in goals:
+            result.goal = node
+            return result
+
+        distance = distances[node] + 1
+
+        for neighbor in get_neighbors(node):
+            if neighbor not in distances:
+                distances[neighbor] = distance
+                frontier.append(neighbor)
+
+    return result
+
+
+def dijkstra(
+    starts: Iterable[_Node],
+    get_neighbors: Callable[[_Node], Iterable[Tuple[_Node, int]]],
+    goals: Optional[Container[_Node]] = None,
+    heuristic: Optional[Callable[[_Node], int]] = None,
+) -> SearchResult[_Node]:
+    """
+    Find the shortest distance from the closest of `starts` to each node.
+
+    `get_neighbors` yields (neighbor, distance) pairs. Distances can't be negative. If
+    `goals` is provided, stop as soon as one is reached.
+
+    If `heuristic` is provided, this is A*. It has to estimate the distance from a
+    node to the closest goal without overestimating it.
+
+    The frontier is a heap of plain tuples, so ties are broken by comparing nodes.
+    """
+    distances = {s: 0 for s in starts}
+    # (estimated total distance, distance so far, node)
+    frontier = [(heuristic(s) if heuristic else 0, 0, s) for s in distances]
+    result = SearchResult(distances)
+
+    while frontier:
+        if len(frontier) > result.peak_frontier:
+            result.peak_frontier = len(frontier)
+
+        _, distance, node = heappop(frontier)
+
+        # We already found a shorter path to this node
+        if distance > distances[node]:
+            continue
+
+        result.expanded += 1
+
+        if goals is not None and node in goals:
+            result.goal = node
+            return result
+
+        for neighbor, weight in get_neighbors(node):
+            new_distance = distance + weight
+
+            if new_distance < distances.get(neighbor, new_distance + 1):
+                distances[neighbor] = new_distance
+                priority = (
+                    new_distance + heuristic(neighbor) if heuristic else new_distance
+                )
+                heappush(frontier, (priority, new_distance, neighbor))
+
+    return result
+
+
+def a_star(
+    starts: Iterable[_Node],
+    get_neighbors: Callable[[_Node], Iterable[Tuple[_Node, int]]],
+    goals: Container[_Node],
+    heuristic: Callable[[_Node], int],
+) -> SearchResult[_Node]:
+    """Dijkstra guided towards `goals` by `heuristic`. See `dijkstra`."""
+    return dijkstra(starts, get_neighbors, goals=goals, heuristic=heuristic)
+
+
+def dial(
+    starts: Iterable[_Node],
+    get_neighbors: Callable[[_Node], Iterable[Tuple[_Node, int]]],
+    max_weight: int,
+    goals: Optional[Container[_Node]] = None,
+) -> SearchResult[_Node]:
+    """
+    Dijkstra for small integer distances, using buckets instead of a heap.
+
+    https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm#Specialized_variants
+
+    Every distance from `get_neighbors` must be an int from 0 to `max_weight`. Nodes
+    are kept in a ring of buckets, one per distance, so pushing and popping are O(1)
+    rather than O(log n). Since a node is never more than `max_weight` past the one
+    being expanded, we only need `max_weight + 1` buckets.
+    """
+    distances = {s: 0 for s in starts}
+    bucket_count = max_weight + 1
+    buckets: List[List[_Node]] = [[] for _ in range(bucket_count)]
+    buckets[0].extend(distances)
+    pending = len(distances)
+    distance = 0
+    result = SearchResult(distances)
+
+    while pending:
+        bucket = buckets[distance % bucket_count]
+
+        # Distances of 0 add to the bucket we're emptying, so keep going until it's
+        # actually empty
+        while bucket:
+            if pending > result.peak_frontier:
+                result.peak_frontier = pending
+
+            node = bucket.pop()
+            pending -= 1
+
+            # We already found a shorter path to this node
+            if distances[node] != distance:
+                continue
+
+            result.expanded += 1
+
+            if goals is not None and node in goals:
+                result.goal = node
+                return result
+
+            for neighbor, weight in get_neighbors(node):
+                new_distance = distance + weight
+
+                if new_distance < distances.get(neighbor, new_distance + 1):
+                    distances[neighbor] = new_distance
+                    buckets[new_distance % bucket_count].append(neighbor)
+                    pending += 1
+
+        distance += 1
+
+    return result
+
+
+class IntervalSet:
+    """
+    A set of ints stored as sorted, disjoint intervals.
+
+    Intervals are half open like `range`, i.e. (1, 4) is 1, 2, and 3. Overlapping and
+    touching intervals are merged, so (1, 4) and (4, 6) are stored as (1, 6). Since
+    only the endpoints are stored, huge ranges take no more memory than small ones.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[int, int]] = ()) -> None:
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._extend_sorted(sorted(intervals))
+
+    @classmethod
+    def _from_sorted(cls, intervals: Iterable[Tuple[int, int]]) -> IntervalSet:
+        # Skip sorting when the intervals are already in order
+        interval_set = cls()
+        interval_set._extend_sorted(intervals)
+
+        return interval_set
+
+    def _extend_sorted(self, intervals: Iterable[Tuple[int, int]]) -> None:
+        starts, ends = self._starts, self._ends
+
+        for start, end in intervals:
+            # Empty intervals don't contain anything
+            if start >= end:
+                continue
+
+            # Merge with the last interval if they overlap or touch
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+
+    @property
+    def intervals(self) -> List[Tuple[int, int]]:
+        return list(zip(self._starts, self._ends))
+
+    @property
+    def total_length(self) -> int:
+        """The number of ints in the set."""
+        return sum(self._ends) - sum(self._starts)
+
+    def __contains__(self, value: int) -> bool:
+        # Find the last interval that starts at or before `value`
+        index = bisect_right(self._starts, value) - 1
+
+        return index >= 0 and value < self._ends[index]
+
+    def contains_sorted(self, values: Iterable[int]) -> Iterator[bool]:
+        """
+        Yield whether each of `values` is in the set.
+
+        `values` must be sorted. Rather than a binary search per value, we walk the
+        values and the intervals together, so this is one pass over each.
+        """
+        starts, ends = self._starts, self._ends
+        index = 0
+
+        for value in values:
+            # Skip the intervals that end before this value. Since the values are
+            # sorted, they'll end before every following value too
+            while index < len(ends) and ends[index] <= value:
+                index += 1
+
+            yield index < len(ends) and starts[index] <= value
+
+    def shift(self, offset: int) -> IntervalSet:
+        """Return a new set with every value moved by `offset`."""
+        return IntervalSet._from_sorted((s + offset, e + offset) for s, e in self)
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        return IntervalSet._from_sorted(merge(self, other))
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        intervals = []
+        a, b = self.intervals, other.intervals
+        i, j = 0, 0
+
+        while i < len(a) and j < len(b):
+            start = max(a[i][0], b[j][0])
+            end = min(a[i][1], b[j][1])
+
+            if start < end:
+                intervals.append((start, end))
+
+            # Move past whichever interval ends first. It can't overlap anything else
+            # in the other set
+            if a[i][1] < b[j][1]:
+                i += 1
+            else:
+                j += 1
+
+        return IntervalSet._from_sorted(intervals)
+
+    def difference(self, other: IntervalSet) -> IntervalSet:
+        intervals = []
+        b = other.intervals
+        j = 0
+
+        for start, end in self:
+            # Skip the intervals in `other` that end before this one starts
+            while j < len(b) and b[j][1] <= start:
+                j += 1
+
+            # Cut out each interval in `other` that overlaps this one
+            k = j
+            while k < len(b) and b[k][0] < end:
+                if start < b[k][0]:
+                    intervals.append((start, b[k][0]))
+
+                start = max(start, b[k][1])
+                k += 1
+
+            if start < end:
+                intervals.append((start, end))
+
+        return IntervalSet._from_sorted(intervals)
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        return self.union(other)
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        return self.intersection(other)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        return self.difference(other)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self._starts, self._ends)
+
+    def __bool__(self) -> bool:
+        return bool(self._starts)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({self.intervals})"
+
+
+@dataclass
+class Cycle(Generic[_T]):
+    """
+    A sequence of steps that repeats forever after `start`, every `length` steps.
+
+    `values` holds what each step produced (e.g. how much it added to a total), up to
+    the end of the first time through the cycle. Every later step produces the same as
+    the step `length` before it, so any step can be found without simulating it.
+    """
+
+    # The first step in the cycle
+    start: int
+    length: int
+    values: List[_T]
+
+    def get(self, step: int) -> _T:
+        """Return the value of `step`, counting from 0."""
+        if step >= self.start:
+            step = self.start + (step - self.start) % self.length
+
+        return self.values[step]
+
+    def occurrences(self, steps: int) -> List[int]:
+        """
+        Return how many times each step in `values` happens in the first `steps` steps.
+
+        This is how to total values that aren't just numbers, e.g. to count what each
+        step touched, without going through every step.
+        """
+        counts = [1 if i < steps else 0 for i in range(self.start)]
+        repeats, remainder = divmod(max(steps - self.start, 0), self.length)
+        counts.extend(repeats + (i < remainder) for i in range(self.length))
+
+        return counts
+
+    def total(self, steps: int) -> int:
+        """Return the sum of the values of the first `steps` steps."""
+        return sum(
+            count * value
+            for count, value in zip(self.occurrences(steps), self.values)
+            if count
+        )
+
+
+def find_cycle(
+    steps: Iterable[Tuple[Any, _T]], limit: Optional[int] = None
+) -> Optional[Cycle[_T]]:
+    """
+    Find where `steps` starts repeating, using Brent's algorithm.
+
+    `steps` yields (fingerprint, value) for each step of a simulation. The fingerprint
+    describes the state before the step, and has to be equal for two states exactly
+    when everything after them is the same. Fingerprints only need `==`, not hashing,
+    so e.g. lists work. The value is what the step produced.
+
+    Brent's algorithm finds the cycle's length by comparing each step to one saved
+    step, which jumps ahead to powers of two. We keep every fingerprint so the start
+    of the cycle can be found without running the simulation again.
+
+    Return None if `steps` runs out first, or no cycle is found in `limit` steps.
+    """
+    fingerprints: List[Any] = []
+    values: List[_T] = []
+    # The saved step, and how far the current step is past it
+    saved = 0
+    length = 0
+    power = 1
+
+    for index, (fingerprint, value) in enumerate(islice(steps, limit)):
+        fingerprints.append(fingerprint)
+        values.append(value)
+
+        if index == 0:
+            continue
+
+        length += 1
+        if fingerprint == fingerprints[saved]:
+            break
+
+        # Save this step, and look twice as far ahead of it
+        if length == power:
+            saved = index
+            power *= 2
+            length = 0
+    else:
+        return None
+
+    # The first step that's the same as the one a cycle after it starts the cycle
+    start = next(
+        i
+        for i in range(len(fingerprints))
+        if fingerprints[i] == fingerprints[i + length]
+    )
+
+    return Cycle(start, length, values[: start + length])
+
+
+@dataclass
+class MemoStats:
+    """How well a cache has worked, added up over every cache with the same name."""
+
+    hits: int = 0
+    misses: int = 0
+    # Entries dropped to stay under the size limit
+    evictions: int = 0
+    # The most entries held at once
+    peak_size: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0
+
+
+# Stands in for a result that isn't cached, since None could be a result
+_MISSING: Final = object()
+
+# Stats are kept by name rather than on the caches, so they outlive caches that are
+# thrown away after each run, and reporting them doesn't keep any entries alive
+_memo_stats: Dict[str, MemoStats] = {}
+
+
+def get_memo_stats() -> Dict[str, MemoStats]:
+    return dict(_memo_stats)
+
+
+def reset_memo_stats() -> None:
+    # In place, since caches hold on to their stats
+    for stats in _memo_stats.values():
+        stats.hits = stats.misses = stats.evictions = stats.peak_size = 0
+
+
+class LRUCache(Generic[_K, _V]):
+    """
+    A mapping that holds at most `maxsize` entries, dropping the least recently used
+    one to make room. With no `maxsize`, it never drops anything.
+
+    Lookups are counted in the stats for `name`. Keys are kept alive as long as the
+    cache is, so prefer small ones, e.g. a bitmask of opened valves rather than a
+    string of their names.
+    """
+
+    def __init__(self, maxsize: Optional[int] = None, name: str = "cache") -> None:
+        self.maxsize = maxsize
+        self.name = name
+        self.stats = _memo_stats.setdefault(name, MemoStats())
+        self._entries: OrderedDict[_K, _V] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: _K) -> bool:
+        return key in self._entries
+
+    def get(self, key: _K, default: Any = None) -> Any:
+        value = self._entries.get(key, _MISSING)
+        if value is _MISSING:
+            self.stats.misses += 1
+            return default
+
+        self.stats.hits += 1
+        if self.maxsize is not None:
+            self._entries.move_to_end(key)
+
+        return value
+
+    def __setitem__(self, key: _K, value: _V) -> None:
+        entries = self._entries
+        entries[key] = value
+
+        if self.maxsize is not None:
+            entries.move_to_end(key)
+
+            if len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.stats.evictions += 1
+
+        stats = self.stats
+        if len(entries) > stats.peak_size:
+            stats.peak_size = len(entries)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class Memoized(Protocol[_V]):
+    """A function whose results are cached in an `LRUCache`. See `memoize`."""
+
+    cache: LRUCache[Hashable, _V]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> _V: ...
+
+    def scope(self) -> ContextManager[None]:
+        """
+        Clear the cache when the block ends, e.g. to only share results while solving
+        one row of the input.
+        """
+        ...
+
+
+def memoize(
+    maxsize: Optional[int] = None, key: Optional[Callable[..., Hashable]] = None
+) -> Callable[[Callable[..., _V]], Memoized[_V]]:
+    """
+    Cache the results of a function, like `functools.lru_cache`, but count how well
+    the cache works (see `get_memo_stats`).
+
+    `key` is called with the same arguments as the function and returns what to
+    cache its result by. Use it to build a smaller key than the arguments, e.g. an int
+    instead of a long string. It's fine for a key to only be unique within a `scope`.
+    """
+
+    def decorator(function: Callable[..., _V]) -> Memoized[_V]:
+        cache: LRUCache[Hashable, _V] = LRUCache(
+            maxsize, name=f"{function.__module__}.{function.__qualname__}"
+        )
+        # Recursive solutions call this a lot, so skip the method calls for hits
+        entries = cache._entries
+        stats = cache.stats
+
+        @wraps(function)
+        def memoized(*args: Any, **kwargs: Any) -> _V:
+            if key is not None:
+                cache_key = key(*args, **kwargs)
+            elif kwargs:
+                cache_key = (args, tuple(kwargs.items()))
+            else:
+                cache_key = args
+
+            result = entries.get(cache_key, _MISSING)
+            if result is not _MISSING:
+                stats.hits += 1
+                if maxsize is not None:
+                    entries.move_to_end(cache_key)
+
+                return result
+
+            stats.misses += 1
+            result = function(*args, **kwargs)
+            cache[cache_key] = result
+
+            return result
+
+        @contextmanager
+        def scope() -> Iterator[None]:
+            try:
+                yield
+            finally:
+                cache.clear()
+
+        memoized.cache = cache  # type: ignore[attr-defined]
+        memoized.scope = scope  # type: ignore[attr-defined]
+
+        return cast(Memoized[_V], memoized)
+
+    return decorator
+
+
+@dataclass
+class Instrumentation:
+    """What `timer` and `count` recorded during one run. See `instrument`."""
+
+    # Seconds spent in each phase, in the order they first started
+    timings: Dict[str, float] = field(default_factory=dict)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+# What we're recording to, if anything. None most of the time, so `timer` and
+# `count` do as little as possible
+_instrumentation: Optional[Instrumentation] = None
+
+
+@contextmanager
+def instrument() -> Iterator[Instrumentation]:
+    """
+    Record every `timer` and `count` in the block.
+
+    Outside of one, they only check whether they're being recorded.
+    """
+    global _instrumentation
+
+    previous = _instrumentation
+    _instrumentation = Instrumentation()
+
+    try:
+        yield _instrumentation
+    finally:
+        _instrumentation = previous
+
+
+class _Timer:
+    """A phase being timed. A class rather than a generator, since it's cheaper."""
+
+    __slots__ = ("timings", "name", "start")
+
+    def __init__(self, timings: Dict[str, float], name: str) -> None:
+        self.timings = timings
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *_: Any) -> None:
+        elapsed = time.perf_counter() - self.start
+        self.timings[self.name] = self.timings.get(self.name, 0) + elapsed
+
+
+_NOT_TIMED: Final = nullcontext()
+
+
+def timer(name: str) -> ContextManager[None]:
+    """
+    Time the block as the phase `name`, e.g. "parse" or "solve".
+
+    Phases with the same name add up, and phases can be nested.
+    """
+    if _instrumentation is None:
+        return _NOT_TIMED
+
+    return _Timer(_instrumentation.timings, name)
+
+
+def count(name: str, amount: int = 1) -> None:
+    """
+    Add `amount` to the counter `name`, e.g. "nodes expanded".
+
+    This is a function call even when nothing is being recorded, so in an inner loop,
+    count in a local and add the total once afterwards.
+    """
+    if _instrumentation is not None:
+        counts = _instrumentation.counts
+        counts[name] = counts.get(name, 0) + amount